@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import gc
+import json
+import platform
+import random
+import statistics
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Optional, Sequence
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_stats import RoutingStats
+
+OPERATIONS = ("build", "join", "insert", "lookup", "leave")
+"""The ring operations that can be benchmarked, in the order they are run: a bulk build of the whole ring with
+:meth:`Chord.from_node_ids`, then the operations of the incremental workload."""
+
+RESULT_FIELDS = [
+    "m", "op", "count", "mean_us", "p50_us", "p95_us", "p99_us", "mean_hops", "max_hops", "peak_memory_kb"
+]
+"""The fields of a benchmark result row."""
+
+
+class Workload:
+    """
+    The keys and values inserted by a benchmark run, and the keys it looks up.
+    :cvar keys: The keys to insert.
+    :cvar values: The value inserted for each key.
+    :cvar lookups: The keys to look up, in order.
+    """
+    keys: list[str]
+    values: list[str]
+    lookups: list[str]
+
+    def __init__(self, keys: int, value_size: int = 0, skew: float = 0.0, seed: int = 0):
+        """
+        Generates a workload.
+        :param keys: The number of keys to insert, and of lookups.
+        :param value_size: The length of the random string inserted for each key, or 0 to insert each key as its own
+            value.
+        :param skew: The exponent of the Zipf distribution the looked up keys are drawn from, so the ``k``-th key is
+            looked up with a probability proportional to ``1 / k^skew``, or 0 to look up every key once, in order.
+        :param seed: The seed of the random values and lookups.
+        :raises ValueError: If the value size or the skew is negative.
+        """
+        if value_size < 0 or skew < 0:
+            raise ValueError("Value size and skew must not be negative.")
+
+        rng = random.Random(seed)
+
+        self.keys = [f"key_{i}" for i in range(keys)]
+        self.values = [key if not value_size else "".join(rng.choices(string.ascii_letters, k=value_size))
+                       for key in self.keys]
+        self.lookups = self.keys
+
+        if skew and keys:
+            self.lookups = rng.choices(self.keys, [1 / rank ** skew for rank in range(1, keys + 1)], k=keys)
+
+
+def run_workload(m: int, workload: Workload, ops: Sequence[str], seed: int,
+                 stats: Optional[dict[str, RoutingStats]] = None) -> dict[str, list[float]]:
+    """
+    Runs one workload on a fresh Chord ring: joins all ``2^m`` nodes in random order, inserts the keys and looks up
+    the lookups of the workload, then removes every other node. Joins and leaves always run, so the ring is the same
+    whichever operations are timed, while inserts and lookups only run when timed. A timed build creates a separate
+    ring from all ``2^m`` node IDs at once, and skips the incremental workload if no other operation is timed, e.g.
+    to benchmark large rings.
+    :param m: The number of bits in the hash space.
+    :param workload: The keys and values to insert and the keys to look up.
+    :param ops: The operations to time.
+    :param seed: The seed of the random join order.
+    :param stats: The routing statistics to record insert and lookup routes into, per operation, if any.
+    :return: The duration of each timed operation in microseconds, per operation.
+    """
+    stats = stats or {}
+    samples = {op: [] for op in ops}
+    node_ids = list(range(2 ** m))
+    random.Random(seed).shuffle(node_ids)
+
+    if "build" in samples:
+        # The rings of earlier runs are collected first, so their garbage is not collected during the timed build.
+        gc.collect()
+        start = time.perf_counter_ns()
+        Chord.from_node_ids(node_ids, m)
+        samples["build"].append((time.perf_counter_ns() - start) / 1000)
+        if len(samples) == 1:
+            return samples
+
+    chord = Chord(m)
+
+    for node_id in node_ids:
+        start = time.perf_counter_ns()
+        chord.join(node_id)
+        if "join" in samples:
+            samples["join"].append((time.perf_counter_ns() - start) / 1000)
+
+    if "insert" in samples:
+        for key, value in zip(workload.keys, workload.values):
+            start = time.perf_counter_ns()
+            chord.insert(key, value, stats.get("insert"))
+            samples["insert"].append((time.perf_counter_ns() - start) / 1000)
+
+    if "lookup" in samples:
+        for key in workload.lookups:
+            start = time.perf_counter_ns()
+            chord.lookup(key, stats.get("lookup"))
+            samples["lookup"].append((time.perf_counter_ns() - start) / 1000)
+
+    for node_id in sorted(node_ids)[::2]:
+        start = time.perf_counter_ns()
+        chord.leave(node_id)
+        if "leave" in samples:
+            samples["leave"].append((time.perf_counter_ns() - start) / 1000)
+
+    return samples
+
+
+def measure_peak_memory(m: int, workload: Workload, ops: Sequence[str], seed: int) -> int:
+    """
+    Measures the peak memory allocated while running one workload. This is done in a separate, untimed run, since
+    tracing allocations slows down every operation.
+    :param m: The number of bits in the hash space.
+    :param workload: The keys and values to insert and the keys to look up.
+    :param ops: The operations to run.
+    :param seed: The seed of the random join order.
+    :return: The peak allocated memory in kilobytes.
+    """
+    tracemalloc.start()
+
+    try:
+        run_workload(m, workload, ops, seed)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak // 1024
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    Summarizes the durations of an operation.
+    :param samples: The durations in microseconds.
+    :return: The mean and the 50th, 95th and 99th percentiles of the durations.
+    """
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {"mean_us": value, "p50_us": value, "p95_us": value, "p99_us": value}
+
+    percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p50_us": percentiles[49],
+        "p95_us": percentiles[94],
+        "p99_us": percentiles[98],
+    }
+
+
+def benchmark(ms: Sequence[int], keys: int = 1000, ops: Sequence[str] = OPERATIONS, repeats: int = 5,
+              warmup: int = 1, seed: int = 0, memory: bool = True, value_size: int = 0,
+              skew: float = 0.0) -> list[dict[str, object]]:
+    """
+    Benchmarks the Chord ring operations for different sizes of the hash space.
+    :param ms: The numbers of bits in the hash space to benchmark.
+    :param keys: The number of keys to insert and lookup.
+    :param ops: The operations to benchmark.
+    :param repeats: The number of timed runs per hash space size.
+    :param warmup: The number of untimed runs per hash space size, before the timed runs.
+    :param seed: The seed of the workloads; run ``i`` uses ``seed + i`` for its join order, and every run inserts and
+        looks up the same keys and values, generated from ``seed``.
+    :param memory: Whether to measure the peak memory of a workload.
+    :param value_size: The length of the random string inserted for each key, or 0 to insert each key as its own value.
+    :param skew: The Zipf exponent of the popularity of the looked up keys, or 0 to look up every key once.
+    :return: One result row per hash space size and operation, with the fields of :data:`RESULT_FIELDS`.
+    :raises ValueError: If an operation is unknown, or the value size or the skew is negative.
+    """
+    for op in ops:
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation {op}.")
+
+    workload = Workload(keys, value_size, skew, seed)
+    results = []
+
+    for m in ms:
+        for run in range(warmup):
+            run_workload(m, workload, ops, seed + run)
+
+        samples = {op: [] for op in ops}
+        stats = {op: RoutingStats() for op in ["insert", "lookup"] if op in ops}
+
+        for run in range(repeats):
+            for op, durations in run_workload(m, workload, ops, seed + warmup + run, stats).items():
+                samples[op].extend(durations)
+
+        peak_memory = measure_peak_memory(m, workload, ops, seed) if memory else None
+
+        for op in ops:
+            op_stats = stats.get(op)
+            results.append({
+                "m": m,
+                "op": op,
+                "count": len(samples[op]),
+                **summarize(samples[op]),
+                "mean_hops": op_stats.mean_hops if op_stats else None,
+                "max_hops": op_stats.max_hops if op_stats else None,
+                "peak_memory_kb": peak_memory,
+            })
+
+    return results
+
+
+def collect_metadata(args: argparse.Namespace) -> dict[str, object]:
+    """
+    Collects the environment and parameters of a benchmark run, so results can be compared across commits.
+    :param args: The parsed command-line arguments.
+    :return: The metadata of the benchmark run.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "parameters": vars(args),
+    }
+
+
+def write_results(results: list[dict[str, object]], metadata: dict[str, object], path: Optional[str],
+                  fields: Sequence[str] = RESULT_FIELDS) -> None:
+    """
+    Writes the benchmark results as CSV, if the path ends with ``.csv``, or as JSON otherwise.
+    :param results: The benchmark result rows.
+    :param metadata: The metadata of the benchmark run, only written to JSON.
+    :param path: The output file path, or ``None`` to write JSON to the standard output.
+    :param fields: The fields of a result row, in the order of the CSV columns.
+    """
+    if path is not None and path.endswith(".csv"):
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(results)
+        return
+
+    document = json.dumps({"metadata": metadata, "results": results}, indent=2)
+
+    if path is None:
+        print(document)
+    else:
+        with open(path, "w") as file:
+            file.write(document + "\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Runs the Chord benchmark from the command line.
+    :param argv: The command-line arguments, or ``None`` to use ``sys.argv``.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Chord DHT ring operations.")
+    parser.add_argument("-m", type=int, nargs="+", default=list(range(1, 9)), help="the hash space sizes in bits")
+    parser.add_argument("--keys", type=int, default=1000, help="the number of keys to insert and lookup")
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=list(OPERATIONS),
+                        help="the operations to time; joins and leaves always run to build and shrink the ring, "
+                             "unless only the bulk build is timed")
+    parser.add_argument("--value-size", type=int, default=0,
+                        help="the length of the random value inserted for each key, 0 to insert the key itself")
+    parser.add_argument("--skew", type=float, default=0.0,
+                        help="the Zipf exponent of the popularity of looked up keys, 0 to look up every key once")
+    parser.add_argument("--repeats", type=int, default=5, help="the number of timed runs")
+    parser.add_argument("--warmup", type=int, default=1, help="the number of untimed warmup runs")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the workloads")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory measurement")
+    parser.add_argument("-o", "--output", help="the output file (.json or .csv), defaults to JSON on stdout")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.m, args.keys, args.ops, args.repeats, args.warmup, args.seed, not args.no_memory,
+                        args.value_size, args.skew)
+
+    write_results(results, collect_metadata(args), args.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
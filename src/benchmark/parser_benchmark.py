@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Optional, Sequence
+
+from src.benchmark.chord_benchmark import collect_metadata, summarize, write_results
+from src.crawler.infobox_parser import BACKENDS, etree, parse_page
+from src.crawler.page_cache import PageCache
+
+RESULT_FIELDS = ["backend", "pages", "mean_us", "p50_us", "p95_us", "p99_us", "total_ms", "speedup", "mismatches"]
+"""The fields of a parser benchmark result row."""
+
+
+def available_backends() -> list[str]:
+    """
+    The parser backends that can run in this environment.
+    :return: The installed backends, in the order of :data:`BACKENDS`.
+    """
+    return [backend for backend in BACKENDS if backend != "lxml" or etree is not None]
+
+
+def benchmark(pages: Sequence[bytes], backends: Sequence[str], repeats: int = 3,
+              warmup: int = 1) -> list[dict[str, object]]:
+    """
+    Benchmarks the infobox parser backends on the same pages, checking that every backend scrapes the same records as
+    BeautifulSoup.
+    :param pages: The HTML content of the pages.
+    :param backends: The parser backends to benchmark.
+    :param repeats: The number of timed passes over the pages per backend.
+    :param warmup: The number of untimed passes over the pages per backend, before the timed passes.
+    :return: One result row per backend, with the fields of :data:`RESULT_FIELDS`.
+    :raises ValueError: If a backend is unknown or not installed.
+    """
+    expected = [parse_page(page, "bs4") for page in pages]
+    results = []
+
+    for backend in backends:
+        for _ in range(warmup):
+            for page in pages:
+                parse_page(page, backend)
+
+        samples = []
+        mismatches = 0
+
+        for _ in range(repeats):
+            for page, record in zip(pages, expected):
+                start = time.perf_counter_ns()
+                parsed = parse_page(page, backend)
+                samples.append((time.perf_counter_ns() - start) / 1000)
+                mismatches += parsed != record
+
+        results.append({
+            "backend": backend,
+            "pages": len(pages),
+            **summarize(samples),
+            "total_ms": sum(samples) / 1000 / max(repeats, 1),
+            "mismatches": mismatches,
+        })
+
+    baseline = next((result["total_ms"] for result in results if result["backend"] == "bs4"), None)
+
+    for result in results:
+        result["speedup"] = baseline / result["total_ms"] if baseline and result["total_ms"] else None
+
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Runs the parser benchmark on the pages of a crawler page cache from the command line.
+    :param argv: The command-line arguments, or ``None`` to use ``sys.argv``.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the infobox parser backends on cached pages.")
+    parser.add_argument("cache", help="the directory of the crawler page cache")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=available_backends(),
+                        help="the parser backends")
+    parser.add_argument("--limit", type=int, help="the maximum number of cached pages to parse")
+    parser.add_argument("--repeats", type=int, default=3, help="the number of timed passes over the pages")
+    parser.add_argument("--warmup", type=int, default=1, help="the number of untimed warmup passes")
+    parser.add_argument("-o", "--output", help="the output file (.json or .csv), defaults to JSON on stdout")
+    args = parser.parse_args(argv)
+
+    with PageCache(args.cache) as cache:
+        urls = list(cache.pages)[:args.limit]
+        pages = [cache.get(url) for url in urls]
+
+    results = benchmark(pages, args.backends, args.repeats, args.warmup)
+
+    write_results(results, collect_metadata(args), args.output, RESULT_FIELDS)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
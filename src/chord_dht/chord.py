@@ -1,7 +1,35 @@
 from __future__ import annotations
 
+import gc
+import json
 import logging
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Sequence
 from src.chord_dht.chord_node import ChordNode
+from src.chord_dht.chord_stats import LoadReport, RoutingStats
+from src.chord_dht.chord_utils import KeyHasher, ValueFilter, finger_table, in_right_closed_range, position_typecode
+from src.chord_dht.chord_wal import WriteAheadLog
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SNAPSHOT_MAGIC = b"CHRD"
+"""The magic bytes at the start of a ring snapshot file."""
+
+SNAPSHOT_VERSION = 1
+"""The version of the ring snapshot file format."""
+
+SNAPSHOT_HEADER = struct.Struct("<4sHHQQ")
+"""The header of a ring snapshot file: the magic bytes, the format version, ``m``, the number of nodes and the length
+of the JSON ring configuration that follows it."""
 
 
 class Chord:
@@ -9,22 +37,196 @@ class Chord:
     A Chord-DHT ring.
     :cvar m: The number of bits in the hash space.
     :cvar nodes: A dictionary of nodes in the ring.
+    :cvar node_ids: The IDs of the nodes in the ring, in ascending order.
+    :cvar hasher: The hasher mapping keys to IDs, shared by all nodes in the ring.
+    :cvar index_field: The value field indexed by every node for range filters, or ``None`` if values are not indexed.
+    :cvar replication: The number of copies of each key, kept on the node responsible for it and its successors.
+    :cvar successor_list_size: The length of the successor list of every node.
+    :cvar virtual_nodes: The number of ring positions owned by every joined node.
+    :cvar virtual_ids: The ring positions owned by each joined node that owns more than one, by the ID it joined with.
+    :cvar lookup_cache_size: The maximum number of key IDs whose responsible node is cached, or 0 if lookups are not
+        cached.
+    :cvar cache_values: Whether the values of cached keys are cached too, instead of being read from the node.
+    :cvar epoch: The version of the ring, bumped by every join, leave, crash and insert to invalidate cached lookups.
+    :cvar cache_hits: The number of lookups answered from the cache.
+    :cvar cache_misses: The number of cached lookups that had to be routed.
+    :cvar wal_directory: The directory holding the write-ahead log of every node, or ``None`` if data is not logged.
+    :cvar wal_sync_every: The number of log records written between syncs to disk.
+    :cvar wal_compact_every: The number of log records after which a log is compacted, or 0 to never compact.
     """
     m: int
     nodes: dict[int, ChordNode]
+    node_ids: list[int]
+    hasher: KeyHasher
+    index_field: Optional[str]
+    replication: int
+    successor_list_size: int
+    virtual_nodes: int
+    virtual_ids: dict[int, list[int]]
+    lookup_cache_size: int
+    cache_values: bool
+    epoch: int
+    cache_hits: int
+    cache_misses: int
+    wal_directory: Optional[str]
+    wal_sync_every: int
+    wal_compact_every: int
 
-    def __init__(self, m: int):
+    def __init__(self, m: int, hash_function: str = "sha1", hash_cache_size: int = 0,
+                 index_field: Optional[str] = None, replication: int = 1, successor_list_size: int = 1,
+                 virtual_nodes: int = 1, lookup_cache_size: int = 0, cache_values: bool = False,
+                 wal_directory: Optional[str] = None, wal_sync_every: int = 64, wal_compact_every: int = 10000):
         """
         Initializes an empty Chord ring.
         :param m: The number of bits in the hash space.
+        :param hash_function: The name of the hash function used to map keys to IDs.
+        :param hash_cache_size: The maximum number of key IDs to cache, or 0 to disable caching.
+        :param index_field: The field of dictionary values to index for range filters, if any.
+        :param replication: The number of copies of each key, including the one on the responsible node.
+        :param successor_list_size: The length of the successor list, raised to ``replication - 1`` if shorter.
+        :param virtual_nodes: The number of ring positions owned by every joined node, to spread its load.
+        :param lookup_cache_size: The maximum number of key IDs whose responsible node is kept in an LRU cache, or 0 to
+            route every lookup.
+        :param cache_values: Whether to cache the values of looked up keys too.
+        :param wal_directory: The directory to keep a write-ahead log of every node in, if any. Nodes joining with the
+            ID of a logged node recover its data from the log.
+        :param wal_sync_every: The number of log records written between syncs to disk.
+        :param wal_compact_every: The number of log records after which a log is compacted, or 0 to never compact.
+        :raises ValueError: If the hash function is unknown, or the replication factor or the number of virtual nodes is
+            not positive.
         """
+        if replication < 1:
+            raise ValueError(f"Replication factor must be positive, got {replication}.")
+
+        if virtual_nodes < 1:
+            raise ValueError(f"Number of virtual nodes must be positive, got {virtual_nodes}.")
+
         self.m = m
         self.nodes = {}
+        self.node_ids = []
+        self.hasher = KeyHasher(m, hash_function, hash_cache_size)
+        self.index_field = index_field
+        self.replication = replication
+        self.successor_list_size = successor_list_size
+        self.virtual_nodes = virtual_nodes
+        self.virtual_ids = {}
+        self.lookup_cache_size = lookup_cache_size
+        self.cache_values = cache_values
+        self.epoch = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.wal_directory = wal_directory
+        self.wal_sync_every = wal_sync_every
+        self.wal_compact_every = wal_compact_every
+        self._lookup_cache: OrderedDict[int, tuple[int, ChordNode, Optional[list[object]]]] = OrderedDict()
+
+    @classmethod
+    def from_node_ids(cls, node_ids: Iterable[int], m: int, hash_function: str = "sha1", hash_cache_size: int = 0,
+                      index_field: Optional[str] = None, replication: int = 1, successor_list_size: int = 1,
+                      virtual_nodes: int = 1, lookup_cache_size: int = 0, cache_values: bool = False,
+                      wal_directory: Optional[str] = None, wal_sync_every: int = 64,
+                      wal_compact_every: int = 10000) -> Chord:
+        """
+        Builds a Chord ring from the IDs of its nodes in a single pass, instead of joining the nodes one at a time.
+        :param node_ids: The IDs of the nodes in the ring, in any order.
+        :param m: The number of bits in the hash space.
+        :param hash_function: The name of the hash function used to map keys to IDs.
+        :param hash_cache_size: The maximum number of key IDs to cache, or 0 to disable caching.
+        :param index_field: The field of dictionary values to index for range filters, if any.
+        :param replication: The number of copies of each key, including the one on the responsible node.
+        :param successor_list_size: The length of the successor list, raised to ``replication - 1`` if shorter.
+        :param virtual_nodes: The number of ring positions owned by every joined node, to spread its load.
+        :param lookup_cache_size: The maximum number of key IDs whose responsible node is kept in an LRU cache, or 0 to
+            route every lookup.
+        :param cache_values: Whether to cache the values of looked up keys too.
+        :param wal_directory: The directory to keep a write-ahead log of every node in, if any. Nodes joining with the
+            ID of a logged node recover its data from the log.
+        :param wal_sync_every: The number of log records written between syncs to disk.
+        :param wal_compact_every: The number of log records after which a log is compacted, or 0 to never compact.
+        :return: The Chord ring, identical to one built by joining the nodes sequentially.
+        :raises ValueError: If a node ID is out of bounds or duplicated.
+        """
+        chord = cls(m, hash_function, hash_cache_size, index_field, replication, successor_list_size, virtual_nodes,
+                    lookup_cache_size, cache_values, wal_directory, wal_sync_every, wal_compact_every)
+        chord.join_many(node_ids)
+
+        return chord
+
+    @classmethod
+    def load(cls, path: str) -> Chord:
+        """
+        Loads a Chord ring saved with :meth:`save`. The file is memory-mapped: the node IDs and finger tables are read
+        at once, but the data of each node is only deserialized when it is first accessed. Only load trusted files, as
+        node data is unpickled.
+        :param path: The path of the snapshot file.
+        :return: The Chord ring.
+        :raises ValueError: If the file is not a ring snapshot of a supported version.
+        """
+        buffer, m, config, node_ids, columns, segments, offset = read_snapshot(path)
+        virtual_ids = {int(node_id): positions for node_id, positions in config.pop("virtual_ids").items()}
+
+        chord = cls(m, **config)
+        chord.node_ids = node_ids.tolist()
+        chord.virtual_ids = virtual_ids
+
+        with _paused_gc():
+            chord.nodes = {node_id: chord._new_node(node_id) for node_id in chord.node_ids}
+
+            for node_id, positions in virtual_ids.items():
+                for position in positions:
+                    chord.nodes[position].owner = node_id
+
+            if chord.nodes:
+                chord._link_nodes(columns)
+
+        for node, start, end in zip(chord.nodes_in_order, segments, segments[1:]):
+            node._defer_data(buffer, offset + start, offset + end)
+
+        logging.info(f"Loaded a ring of {len(node_ids)} nodes from {path}.")
+
+        return chord
+
+    def save(self, path: str) -> None:
+        """
+        Saves the Chord ring to a binary snapshot file: a header and the ring configuration, followed by the array of
+        node IDs, an array of finger positions for each finger index, the offsets of the data segments and a segment
+        with the serialized data of each node. The ring is saved as a fully stabilized ring; the stale pointers and
+        crashed nodes of an unstabilized ring are not kept.
+        :param path: The path of the snapshot file.
+        """
+        config = {
+            "hash_function": self.hasher.hash_function,
+            "hash_cache_size": self.hasher.cache_size,
+            "index_field": self.index_field,
+            "replication": self.replication,
+            "successor_list_size": self.successor_list_size,
+            "virtual_nodes": self.virtual_nodes,
+            "lookup_cache_size": self.lookup_cache_size,
+            "cache_values": self.cache_values,
+            "virtual_ids": self.virtual_ids,
+        }
+        config = json.dumps(config).encode()
+        segments = [node._serialize_data() for node in self.nodes_in_order]
+        offsets = [0]
+
+        for segment in segments:
+            offsets.append(offsets[-1] + len(segment))
+
+        with open(path, "wb") as file:
+            file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.m, len(self.node_ids), len(config)))
+            file.write(config)
+            file.write(array("Q", self.node_ids).tobytes())
+            for column in finger_table(self.node_ids, self.m):
+                file.write(column.tobytes())
+            file.write(array("Q", offsets).tobytes())
+            file.writelines(segments)
+
+        logging.info(f"Saved a ring of {len(self.node_ids)} nodes to {path}.")
 
     def __len__(self) -> int:
         """
         The size of the Chord ring.
-        :return: The number of nodes in the ring.
+        :return: The number of nodes in the ring, counting every virtual node.
         """
         return len(self.nodes)
 
@@ -41,14 +243,54 @@ class Chord:
         The nodes in the Chord ring in order of ascending node IDs.
         :return: An ordered list of the nodes in the ring.
         """
-        return sorted(self.nodes.values(), key=lambda node: node.id)
+        return [self.nodes[node_id] for node_id in self.node_ids]
 
-    def join(self, node_id: int) -> ChordNode:
+    @property
+    def first_node(self) -> ChordNode:
+        """
+        The node with the lowest ID in the Chord ring, used as the entry point for ring operations.
+        :return: The node with the lowest ID.
+        :raises ValueError: If the ring is empty.
         """
-        Creates a new Chord node and joins it to the Chord ring.
+        if not self.node_ids:
+            raise ValueError("The Chord ring is empty.")
+
+        return self.nodes[self.node_ids[0]]
+
+    @property
+    def bootstrap_node(self) -> ChordNode:
+        """
+        The first node of the Chord ring that knows another alive node, used by the stabilization protocol to look up
+        nodes that have lost every alive node they knew, e.g. after their only successor has left.
+        :return: The first node with an alive successor, or the first node if there is none.
+        :raises ValueError: If the ring is empty.
+        """
+        nodes = (self.nodes[node_id] for node_id in self.node_ids)
+
+        return next((node for node in nodes if node._alive_successor() is not node), self.first_node)
+
+    def successor_of(self, target_id: int) -> ChordNode:
+        """
+        Finds the node responsible for the target ID using the sorted index of node IDs, in O(log N) time.
+        :param target_id: The ID to find the successor for.
+        :return: The first node whose ID is equal to or follows the target ID on the ring.
+        :raises ValueError: If the ring is empty.
+        """
+        if not self.node_ids:
+            raise ValueError("The Chord ring is empty.")
+
+        index = bisect_left(self.node_ids, target_id % (2 ** self.m))
+
+        return self.nodes[self.node_ids[index % len(self.node_ids)]]
+
+    def join(self, node_id: int, lazy: bool = False) -> ChordNode:
+        """
+        Creates a new Chord node and joins it to the Chord ring, together with its virtual nodes.
         :param node_id: The ID of the node to join the ring.
+        :param lazy: Whether to only look up the node's successor and leave the rest to the stabilization protocol.
         :return: The new Chord node.
-        :raises ValueError: If the node ID is out of bounds or already in use.
+        :raises ValueError: If the node ID is out of bounds or already in use, or the ring has no room for its virtual
+            nodes.
         """
         if node_id < 0 or node_id >= 2 ** self.m:
             raise ValueError(f"Node ID {node_id} out of bounds for m={self.m}.")
@@ -56,54 +298,414 @@ class Chord:
         if node_id in self.nodes:
             raise ValueError(f"Node ID {node_id} already in use.")
 
-        self.nodes[node_id] = ChordNode(node_id, self.m)
+        positions = self._virtual_positions([node_id])[0]
+        self.epoch += 1
 
-        if len(self) == 1:
+        for position in positions:
+            self._join_position(position, node_id, lazy)
+
+        if len(positions) > 1:
+            self.virtual_ids[node_id] = positions
+
+        return self.nodes[node_id]
+
+    def _join_position(self, node_id: int, owner: int, lazy: bool) -> None:
+        """
+        Creates a Chord node at a ring position and joins it to the Chord ring.
+        :param node_id: The ring position of the node.
+        :param owner: The ID of the physical node owning the position.
+        :param lazy: Whether to only look up the node's successor and leave the rest to the stabilization protocol.
+        """
+        node = self._new_node(node_id, owner)
+
+        if not self.nodes:
             logging.info(f"Node {node_id} joined the ring as the first node.")
+        elif lazy:
+            node.join_lazily(self.bootstrap_node)
+            logging.info(f"Node {node_id} joined the ring lazily.")
         else:
-            self.nodes[node_id].join(self.nodes_in_order[0])
+            node.join(self.bootstrap_node)
             logging.info(f"Node {node_id} joined the ring.")
 
-        return self.nodes[node_id]
+        self.nodes[node_id] = node
+        insort(self.node_ids, node_id)
 
-    def leave(self, node_id: int) -> None:
+    def join_many(self, node_ids: Iterable[int]) -> list[ChordNode]:
+        """
+        Creates many Chord nodes and joins them to the Chord ring at once. The successors, predecessors and finger
+        tables of all nodes are recomputed from the sorted node IDs, with one vectorized search per finger index (see
+        :func:`finger_table`), and each new node then pulls its data from the node that held it before.
+        :param node_ids: The IDs of the nodes to join the ring.
+        :return: The new Chord nodes, in the order of the given IDs, each followed by its virtual nodes.
+        :raises ValueError: If a node ID is out of bounds or already in use, or the ring has no room for the virtual
+            nodes.
         """
-        Removes a Chord node from the Chord ring.
+        node_ids = list(node_ids)
+
+        for node_id in node_ids:
+            if node_id < 0 or node_id >= 2 ** self.m:
+                raise ValueError(f"Node ID {node_id} out of bounds for m={self.m}.")
+
+        if len(set(node_ids)) != len(node_ids) or any(node_id in self.nodes for node_id in node_ids):
+            raise ValueError("Node IDs already in use.")
+
+        owned_positions = self._virtual_positions(node_ids)
+
+        with _paused_gc():
+            owners = {position: node_id for node_id, positions in zip(node_ids, owned_positions) for position in positions}
+            # The nodes are created in ring order, so neighbouring nodes lie close in memory when they are linked.
+            created = {position: self._new_node(position, owners[position]) for position in sorted(owners)}
+            new_nodes = [created[position] for positions in owned_positions for position in positions]
+            holders = [self.successor_of(node.id) for node in new_nodes] if self.nodes else [None] * len(new_nodes)
+            self.epoch += 1
+
+            for node_id, positions in zip(node_ids, owned_positions):
+                if len(positions) > 1:
+                    self.virtual_ids[node_id] = positions
+
+            self.nodes.update(created)
+            self.node_ids = sorted(self.nodes)
+            self._link_nodes()
+
+        for node, holder in zip(new_nodes, holders):
+            if holder is not None:
+                node._pull_data_from(holder)
+
+        if self.replication > 1:
+            for node in self.nodes.values():
+                node._sync_replicas()
+
+        logging.info(f"{len(new_nodes)} nodes joined the ring.")
+
+        return new_nodes
+
+    def _link_nodes(self, columns: Optional[Sequence[Sequence[int]]] = None) -> None:
+        """
+        Sets the successor, predecessor and finger table of every node from the sorted index of node IDs.
+        :param columns: The ``i``-th finger of every node as positions in the sorted node IDs, for each finger index
+            ``i``, or ``None`` to compute them.
+        """
+        nodes = self.nodes_in_order
+        columns = finger_table(self.node_ids, self.m) if columns is None else columns
+
+        # The positions are transposed into plain lists of integers first, which index the list of nodes fastest.
+        rows = np.asarray(columns).T.tolist() if np is not None else zip(*columns)
+        finger_rows = [list(map(nodes.__getitem__, row)) for row in rows]
+
+        # Slices of the ring laid out twice wrap around its end.
+        ring = nodes + nodes
+
+        for position, (node, fingers) in enumerate(zip(nodes, finger_rows)):
+            node.successor = ring[position + 1]
+            node.predecessor = nodes[position - 1]
+            node.fingers = fingers
+            node.successor_list = ring[position + 1:position + min(node.successor_list_size + 1, len(nodes))]
+
+    def _new_node(self, node_id: int, owner: Optional[int] = None) -> ChordNode:
+        """
+        Creates a node configured for this Chord ring.
+        :param node_id: The ID of the node.
+        :param owner: The ID of the physical node owning the node, or ``None`` if it is the node itself.
+        :return: The new Chord node.
+        """
+        node = ChordNode(node_id, self.m, self.hasher, self.index_field, self.replication, self.successor_list_size,
+                         owner)
+
+        if self.wal_directory is not None:
+            path = os.path.join(self.wal_directory, f"node-{node_id}.wal")
+            node._recover_from(WriteAheadLog(path, self.wal_sync_every, self.wal_compact_every))
+
+        return node
+
+    def _virtual_positions(self, node_ids: list[int]) -> list[list[int]]:
+        """
+        Chooses the ring positions of joining nodes: the ID of each node, followed by ``virtual_nodes - 1`` positions
+        hashed from it. A hashed position already in use moves on to the next free ID.
+        :param node_ids: The IDs of the joining nodes.
+        :return: The ring positions of each node.
+        :raises ValueError: If the ring has no room for the virtual nodes.
+        """
+        if self.virtual_nodes == 1:
+            return [[node_id] for node_id in node_ids]
+
+        if len(self.nodes) + len(node_ids) * self.virtual_nodes > 2 ** self.m:
+            raise ValueError(f"Not enough free IDs for {self.virtual_nodes} virtual nodes per node.")
+
+        taken = set(self.nodes).union(node_ids)
+        owned_positions = []
+
+        for node_id in node_ids:
+            positions = [node_id]
+            for i in range(1, self.virtual_nodes):
+                position = self.hasher.hash(f"{node_id}#{i}")
+                while position in taken:
+                    position = (position + 1) % (2 ** self.m)
+                taken.add(position)
+                positions.append(position)
+            owned_positions.append(positions)
+
+        return owned_positions
+
+    def leave(self, node_id: int, lazy: bool = False) -> None:
+        """
+        Removes a Chord node from the Chord ring, together with its virtual nodes.
         :param node_id: The ID of the node to leave the ring.
+        :param lazy: Whether to only update the node's neighbours and leave the rest to the stabilization protocol.
+        :raises ValueError: If the node ID is not in the ring, or is a virtual node of another node.
         """
-        if node_id not in self.nodes:
-            raise ValueError("Node ID not in the ring.")
+        for position in self._pop_positions(node_id):
+            self._leave_position(position, lazy)
 
-        self.nodes.pop(node_id).leave()
+    def _leave_position(self, node_id: int, lazy: bool) -> None:
+        """
+        Removes the Chord node at a ring position from the Chord ring.
+        :param node_id: The ring position of the node.
+        :param lazy: Whether to only update the node's neighbours and leave the rest to the stabilization protocol.
+        """
+        node = self.nodes.pop(node_id)
+        del self.node_ids[bisect_left(self.node_ids, node_id)]
+
+        if lazy:
+            node.leave_lazily(self.bootstrap_node if self.nodes else None)
+        else:
+            node.leave()
+
+        if node.wal is not None:
+            node.wal.destroy()
 
         logging.info(f"Node {node_id} left the ring.")
 
-    def insert(self, key: str, value: object) -> None:
+    def crash(self, node_id: int) -> None:
+        """
+        Fails a Chord node abruptly, together with its virtual nodes, without handing over its data or updating any
+        other node.
+        :param node_id: The ID of the node to crash.
+        :raises ValueError: If the node ID is not in the ring, or is a virtual node of another node.
+        """
+        for position in self._pop_positions(node_id):
+            node = self.nodes.pop(position)
+            node.crash()
+            del self.node_ids[bisect_left(self.node_ids, position)]
+            if node.wal is not None:
+                node.wal.close()
+
+        logging.info(f"Node {node_id} crashed.")
+
+    def _pop_positions(self, node_id: int) -> list[int]:
+        """
+        Removes a node from the index of virtual nodes.
+        :param node_id: The ID of the node.
+        :return: The ring positions owned by the node.
+        :raises ValueError: If the node ID is not in the ring, or is a virtual node of another node.
+        """
+        if node_id not in self.nodes or self.nodes[node_id].owner != node_id:
+            raise ValueError("Node ID not in the ring.")
+
+        self.epoch += 1
+
+        return self.virtual_ids.pop(node_id, [node_id])
+
+    def sync(self) -> None:
+        """
+        Writes the pending records of the write-ahead log of every node to disk.
+        """
+        for node in self.nodes.values():
+            if node.wal is not None:
+                node.wal.sync()
+
+    def load_report(self) -> LoadReport:
+        """
+        Summarizes how evenly the keys are spread over the physical nodes of the ring, counting the keys of every
+        virtual node towards the node that owns it.
+        :return: The load report.
+        """
+        keys = {}
+
+        for node in self.nodes.values():
+            keys[node.owner] = keys.get(node.owner, 0) + len(node.data)
+
+        return LoadReport(keys)
+
+    def insert(self, key: str, value: object, stats: Optional[RoutingStats] = None) -> None:
         """
         Inserts a key-value pair into the Chord ring.
         :param key: The key to insert.
         :param value: The value to store with the key.
+        :param stats: The routing statistics to record the route into, if any.
         :raises ValueError: If the ring is empty.
         """
         if not self.nodes:
             raise ValueError("Cannot insert into an empty Chord ring.")
 
-        self.nodes_in_order[0].insert(key, value)
+        self.epoch += 1
+        self.first_node.insert(key, value, stats)
 
         logging.info(f"Inserted key {key} with value {value}.")
 
-    def lookup(self, key: str) -> list[object]:
+    def lookup(self, key: str, stats: Optional[RoutingStats] = None,
+               where: Optional[ValueFilter] = None) -> list[object]:
         """
-        Looks up a key in the Chord ring.
+        Looks up a key in the Chord ring. With a lookup cache, the node responsible for a recently looked up key is
+        contacted directly, as long as the ring has not changed and the node still covers the key.
         :param key: The key to lookup.
+        :param stats: The routing statistics to record the route into, if any; cache hits are recorded without hops.
+        :param where: A predicate on the values, or an inclusive range over the indexed value field, if any.
         :return: The data stored with the key, or None if the key is not found.
         :raises ValueError: If the ring is empty.
         """
         if not self.nodes:
             raise ValueError("Cannot lookup in an empty Chord ring.")
 
-        data = self.nodes_in_order[0].lookup(key)
+        if self.lookup_cache_size > 0:
+            data = self._cached_lookup(key, stats, where)
+        else:
+            data = self.first_node.lookup(key, stats, where)
 
         logging.info(f"Lookup key {key} returned value {data}.")
 
         return data
+
+    def _cached_lookup(self, key: str, stats: Optional[RoutingStats] = None,
+                       where: Optional[ValueFilter] = None) -> list[object]:
+        """
+        Looks up a key through the lookup cache, routing it only on a miss. Entries of an older epoch, or whose node has
+        since crashed or handed the key over during stabilization, are misses.
+        :param key: The key to lookup.
+        :param stats: The routing statistics to record the route into, if any.
+        :param where: A predicate on the values, or an inclusive range over the indexed value field, if any.
+        :return: The data stored with the key.
+        """
+        key_id = self.hasher.hash(key)
+        entry = self._lookup_cache.get(key_id)
+
+        if entry is not None:
+            epoch, node, values = entry
+            if epoch == self.epoch and node.alive and in_right_closed_range(node.predecessor.id, node.id, key_id):
+                self._lookup_cache.move_to_end(key_id)
+                self.cache_hits += 1
+                if stats is not None:
+                    stats.record([node.id])
+                if values is not None and where is None:
+                    return values
+                return node._read(key, where)
+
+        self.cache_misses += 1
+        node = self.first_node._find_successor(key_id, stats)
+        data = node._read(key, where)
+        values = data if self.cache_values and where is None else None
+
+        self._lookup_cache[key_id] = (self.epoch, node, values)
+        self._lookup_cache.move_to_end(key_id)
+        if len(self._lookup_cache) > self.lookup_cache_size:
+            self._lookup_cache.popitem(last=False)
+
+        return data
+
+    def insert_many(self, items: Iterable[tuple[str, object]], stats: Optional[RoutingStats] = None) -> None:
+        """
+        Inserts many key-value pairs into the Chord ring in a single routing pass.
+        :param items: The key-value pairs to insert.
+        :param stats: The routing statistics to record the routes into, if any.
+        :raises ValueError: If the ring is empty.
+        """
+        if not self.nodes:
+            raise ValueError("Cannot insert into an empty Chord ring.")
+
+        items = list(items)
+
+        self.epoch += 1
+        self.first_node.insert_many(items, stats)
+
+        logging.info(f"Inserted {len(items)} keys.")
+
+    def lookup_many(self, keys: Iterable[str], stats: Optional[RoutingStats] = None,
+                    where: Optional[ValueFilter] = None) -> list[list[object]]:
+        """
+        Looks up many keys in the Chord ring in a single routing pass.
+        :param keys: The keys to lookup.
+        :param stats: The routing statistics to record the routes into, if any.
+        :param where: A predicate on the values, or an inclusive range over the indexed value field, if any.
+        :return: The data stored with each key, in the order of the given keys.
+        :raises ValueError: If the ring is empty.
+        """
+        if not self.nodes:
+            raise ValueError("Cannot lookup in an empty Chord ring.")
+
+        data = self.first_node.lookup_many(keys, stats, where)
+
+        logging.info(f"Looked up {len(data)} keys.")
+
+        return data
+
+    def range_lookup(self, lo_id: int, hi_id: int,
+                     stats: Optional[RoutingStats] = None) -> list[tuple[str, list[object]]]:
+        """
+        Looks up all keys with IDs in an inclusive range of the Chord ring. The range wraps around the ring if the
+        lower bound is greater than the upper bound.
+        :param lo_id: The lowest key ID of the range.
+        :param hi_id: The highest key ID of the range.
+        :param stats: The routing statistics to record the route into, if any.
+        :return: The keys in the range and their associated values, in ring order starting from the lower bound.
+        :raises ValueError: If the ring is empty or the range is out of bounds.
+        """
+        if not self.nodes:
+            raise ValueError("Cannot lookup in an empty Chord ring.")
+
+        if not (0 <= lo_id < 2 ** self.m and 0 <= hi_id < 2 ** self.m):
+            raise ValueError(f"Range [{lo_id}, {hi_id}] out of bounds for m={self.m}.")
+
+        data = self.first_node.range_lookup(lo_id, hi_id, stats)
+
+        logging.info(f"Range lookup [{lo_id}, {hi_id}] returned {len(data)} keys.")
+
+        return data
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    """
+    Pauses the cyclic garbage collector while many nodes are created and linked, since every batch of new nodes would
+    otherwise trigger a collection traversing all the nodes created so far, none of which are garbage.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def read_snapshot(path: str) -> tuple[mmap.mmap, int, dict, array, list[array], array, int]:
+    """
+    Memory-maps a ring snapshot file written by :meth:`Chord.save` and reads its arrays.
+    :param path: The path of the snapshot file.
+    :return: The memory map of the file, ``m``, the ring configuration, the node IDs, the finger positions for each
+        finger index, the offsets of the data segments, and the offset of the first data segment in the file.
+    :raises ValueError: If the file is not a ring snapshot of a supported version.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(buffer) < SNAPSHOT_HEADER.size:
+        raise ValueError(f"{path} is not a Chord ring snapshot.")
+
+    magic, version, m, size, config_length = SNAPSHOT_HEADER.unpack_from(buffer)
+
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} Chord ring snapshot.")
+
+    offset = SNAPSHOT_HEADER.size
+    config = json.loads(buffer[offset:offset + config_length])
+    offset += config_length
+    arrays = []
+
+    for typecode, length in [("Q", size)] + [(position_typecode(size), size)] * m + [("Q", size + 1)]:
+        arrays.append(array(typecode))
+        arrays[-1].frombytes(buffer[offset:offset + arrays[-1].itemsize * length])
+        offset += arrays[-1].itemsize * length
+
+    node_ids, *columns, segments = arrays
+
+    return buffer, m, config, node_ids, columns, segments, offset
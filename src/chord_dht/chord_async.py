@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+from src.chord_dht.chord_stats import RoutingStats
+from src.chord_dht.chord_transport import Transport
+from src.chord_dht.chord_utils import KeyHasher, in_open_range, in_right_closed_range
+
+NodeRef = tuple[int, str]
+"""A reference to a remote Chord node, as its ID and address."""
+
+
+class AsyncChordNode:
+    """
+    A Chord-DHT node running on asyncio, which talks to other nodes only through messages over a transport. Routing is
+    iterative: the node asking for a successor sends a ``step`` request to one node after the other, so each hop is a
+    single request and many lookups can be in flight at once. Values must be JSON-serializable for stream transports.
+    :cvar id: The ID of the node.
+    :cvar m: The number of bits in the hash space of the Chord ring.
+    :cvar address: The address the node serves requests at.
+    :cvar transport: The transport used to talk to other nodes.
+    :cvar successor: The next node in the ring.
+    :cvar predecessor: The previous node in the ring.
+    :cvar fingers: The finger table of the node.
+    :cvar data: The key-value pairs stored in the node.
+    :cvar hasher: The hasher mapping keys to IDs in the Chord ring.
+    """
+    id: int
+    m: int
+    address: str
+    transport: Transport
+    successor: NodeRef
+    predecessor: NodeRef
+    fingers: list[NodeRef]
+    data: dict[str, list[object]]
+    hasher: KeyHasher
+
+    def __init__(self, nid: int, m: int, address: str, transport: Transport, hasher: Optional[KeyHasher] = None):
+        """
+        A node in an asynchronous Chord-DHT ring.
+        :param nid: The ID of the node.
+        :param m: The number of bits in the ID hash space of the Chord ring.
+        :param address: The address to serve requests at.
+        :param transport: The transport used to talk to other nodes.
+        :param hasher: The hasher mapping keys to IDs, or ``None`` to use a SHA-1 hasher.
+        """
+        self.id = nid
+        self.m = m
+        self.address = address
+        self.transport = transport
+        self.successor = self.ref
+        self.predecessor = self.ref
+        self.fingers = [self.ref] * self.m
+        self.data = {}
+        self.hasher = hasher or KeyHasher(m)
+
+    def __str__(self) -> str:
+        """
+        A string representation of the Chord node.
+        :return: A string representation of the Chord node.
+        """
+        return f"{self.id}: Fingers: {[finger[0] for finger in self.fingers]} Next: {self.successor[0]} Prev: {self.predecessor[0]}"
+
+    @property
+    def ref(self) -> NodeRef:
+        """
+        The reference other nodes use to reach this node.
+        :return: The ID and address of this node.
+        """
+        return self.id, self.address
+
+    async def start(self) -> None:
+        """
+        Starts serving requests from other nodes.
+        """
+        await self.transport.serve(self.address, self.handle)
+
+    async def stop(self) -> None:
+        """
+        Stops serving requests from other nodes.
+        """
+        await self.transport.unserve(self.address)
+
+    async def join(self, bootstrap: Optional[str] = None) -> None:
+        """
+        Joins the node to a Chord ring. The node must already be serving requests. Concurrent joins are not supported.
+        :param bootstrap: The address of any node in the ring, or ``None`` to start a new ring.
+        """
+        if bootstrap is None:
+            logging.info(f"Node {self.id} started a new ring.")
+            return
+
+        self.predecessor, self.successor, _ = await self._route(bootstrap, self.id)
+
+        logging.info(f"Node {self.id} is joining the ring between {self.predecessor[0]} and {self.successor[0]}...")
+
+        await self._call(self.successor, "set_predecessor", node=self.ref)
+        await self._call(self.predecessor, "set_successor", node=self.ref)
+
+        self.fingers = list(await asyncio.gather(
+            *(self.find_successor((self.id + 2 ** i) % (2 ** self.m)) for i in range(self.m))
+        ))
+
+        await asyncio.gather(*(self._update_finger_chain(i, "update_finger") for i in range(self.m)))
+
+        items = await self._call(self.successor, "take_range", lo=self.predecessor[0], hi=self.id)
+        self.data.update(items)
+
+    async def leave(self) -> None:
+        """
+        Leaves the Chord ring, handing this node's fingers and data over to its successor.
+        """
+        if self.successor == self.ref:
+            return
+
+        logging.info(f"Node {self.id} is leaving the ring...")
+
+        await asyncio.gather(*(self._update_finger_chain(i, "replace_finger") for i in range(self.m)))
+
+        await self._call(self.successor, "put_data", items=list(self.data.items()))
+        await self._call(self.successor, "set_predecessor", node=self.predecessor)
+        await self._call(self.predecessor, "set_successor", node=self.successor)
+
+        self.data.clear()
+        self.successor = self.predecessor = self.ref
+        self.fingers = [self.ref] * self.m
+
+    async def insert(self, key: str, value: object, stats: Optional[RoutingStats] = None) -> None:
+        """
+        Inserts a key and its associated value into the Chord ring.
+        :param key: The key to insert.
+        :param value: The value to insert.
+        :param stats: The routing statistics to record the route into, if any.
+        """
+        node = await self.find_successor(self.hasher.hash(key), stats)
+
+        logging.info(f"Inserting key {key} into node {node[0]}...")
+
+        await self._call(node, "store", key=key, value=value)
+
+    async def lookup(self, key: str, stats: Optional[RoutingStats] = None) -> list[object]:
+        """
+        Looks up a key in the Chord ring and returns the associated values.
+        :param key: The key to lookup.
+        :param stats: The routing statistics to record the route into, if any.
+        :return: The values associated with the key, or an empty list if the key cannot be found.
+        """
+        node = await self.find_successor(self.hasher.hash(key), stats)
+
+        logging.info(f"Looking up key {key} in node {node[0]}...")
+
+        return await self._call(node, "fetch", key=key)
+
+    async def find_successor(self, target_id: int, stats: Optional[RoutingStats] = None) -> NodeRef:
+        """
+        Finds the successor node for the target ID.
+        :param target_id: The ID to find the successor for.
+        :param stats: The routing statistics to record the route into, if any.
+        :return: The successor node for the target ID.
+        """
+        _, successor, path = await self._route(self.address, target_id)
+
+        if stats is not None:
+            stats.record(path if path[-1] == successor[0] else path + [successor[0]])
+
+        return successor
+
+    def handle(self, op: str, args: dict) -> object:
+        """
+        Handles a request from another node.
+        :param op: The name of the requested operation.
+        :param args: The arguments of the operation.
+        :return: The JSON-serializable result of the operation.
+        :raises ValueError: If the operation is unknown.
+        """
+        handler = getattr(self, f"_handle_{op}", None)
+
+        if handler is None:
+            raise ValueError(f"Unknown operation {op}.")
+
+        return handler(**args)
+
+    async def _call(self, to: NodeRef, op: str, **args) -> object:
+        """
+        Sends a request to a node, handling it directly if the node is this node.
+        :param to: The node to send the request to.
+        :param op: The name of the requested operation.
+        :param args: The arguments of the operation.
+        :return: The result of the operation.
+        """
+        if to[1] == self.address:
+            return self.handle(op, args)
+
+        return await self.transport.request(to[1], op, args)
+
+    async def _route(self, address: str, target_id: int) -> tuple[NodeRef, NodeRef, list[int]]:
+        """
+        Iteratively routes towards the predecessor of the target ID, one ``step`` request per hop.
+        :param address: The address of the node to start routing from.
+        :param target_id: The ID to route to.
+        :return: The predecessor and successor nodes of the target ID, and the IDs of the visited nodes.
+        """
+        node = (None, address)
+        path = []
+
+        while True:
+            reply = await self._call(node, "step", target_id=target_id)
+            node = tuple(reply["node"])
+            path.append(node[0])
+
+            if reply["next"] is None:
+                return node, tuple(reply["successor"]), path
+
+            node = tuple(reply["next"])
+
+    async def _find_predecessor(self, target_id: int) -> NodeRef:
+        """
+        Finds the predecessor node for the target ID.
+        :param target_id: The ID to find the predecessor for.
+        :return: The predecessor node for the target ID.
+        """
+        predecessor, _, _ = await self._route(self.address, target_id)
+
+        return predecessor
+
+    async def _update_finger_chain(self, i: int, op: str) -> None:
+        """
+        Sends an ``update_finger`` or ``replace_finger`` request for the ``i``-th finger to the predecessor of
+        ``id - 2^i``, then to its predecessors for as long as their finger is changed.
+        :param i: The index of the finger.
+        :param op: The name of the finger operation.
+        """
+        node = await self._find_predecessor((self.id - 2 ** i + 1) % (2 ** self.m))
+
+        while node is not None and node != self.ref:
+            predecessor = await self._call(node, op, i=i, node=self.ref, successor=self.successor)
+            node = tuple(predecessor) if predecessor is not None else None
+
+    def _closest_finger(self, target_id: int) -> NodeRef:
+        """
+        Finds the closest finger that precedes the target ID, falling back to the successor.
+        :param target_id: The ID to find the closest finger for.
+        :return: The closest finger that precedes the target ID.
+        """
+        for i in range(self.m - 1, -1, -1):
+            finger = self.fingers[i]
+            if in_open_range(self.id, target_id, finger[0]):
+                return finger
+
+        return self.successor
+
+    def _handle_step(self, target_id: int) -> dict:
+        """
+        Handles a routing step: either this node precedes the target ID, or the next node to ask is returned.
+        :param target_id: The ID being routed to.
+        :return: This node, its successor, and the next node to ask, or ``None`` if this node precedes the target ID.
+        """
+        if in_right_closed_range(self.id, self.successor[0], target_id):
+            return {"node": self.ref, "successor": self.successor, "next": None}
+
+        return {"node": self.ref, "successor": self.successor, "next": self._closest_finger(target_id)}
+
+    def _handle_set_successor(self, node: list) -> None:
+        """
+        Handles a new successor.
+        :param node: The new successor node.
+        """
+        self.successor = tuple(node)
+        self.fingers[0] = self.successor
+
+    def _handle_set_predecessor(self, node: list) -> None:
+        """
+        Handles a new predecessor.
+        :param node: The new predecessor node.
+        """
+        self.predecessor = tuple(node)
+
+    def _handle_update_finger(self, i: int, node: list, successor: list) -> Optional[NodeRef]:
+        """
+        Handles a joining node, pointing the ``i``-th finger at it if it is the new successor of the finger start.
+        :param i: The index of the finger.
+        :param node: The joining node.
+        :param successor: The successor of the joining node.
+        :return: This node's predecessor if the finger was updated, so the update continues there, or ``None``.
+        """
+        start = (self.id + 2 ** i) % (2 ** self.m)
+
+        if tuple(node) == self.ref or not in_open_range((start - 1) % (2 ** self.m), self.fingers[i][0], node[0]):
+            return None
+
+        self.fingers[i] = tuple(node)
+
+        return self.predecessor
+
+    def _handle_replace_finger(self, i: int, node: list, successor: list) -> Optional[NodeRef]:
+        """
+        Handles a leaving node, pointing the ``i``-th finger at its successor if the finger points at it.
+        :param i: The index of the finger.
+        :param node: The leaving node.
+        :param successor: The successor of the leaving node.
+        :return: This node's predecessor if the finger was replaced, so the replacement continues there, or ``None``.
+        """
+        if self.fingers[i] != tuple(node):
+            return None
+
+        self.fingers[i] = tuple(successor)
+
+        return self.predecessor
+
+    def _handle_store(self, key: str, value: object) -> None:
+        """
+        Handles a value to store with a key.
+        :param key: The key.
+        :param value: The value to store.
+        """
+        self.data.setdefault(key, []).append(value)
+
+    def _handle_fetch(self, key: str) -> list[object]:
+        """
+        Handles a lookup of the values stored with a key.
+        :param key: The key.
+        :return: The values stored with the key.
+        """
+        return self.data.get(key, [])
+
+    def _handle_take_range(self, lo: int, hi: int) -> list[tuple[str, list[object]]]:
+        """
+        Handles a joining node taking over the keys with IDs in the range ``(lo, hi]``.
+        :param lo: The exclusive start of the range.
+        :param hi: The inclusive end of the range.
+        :return: The keys in the range and their values, removed from this node.
+        """
+        keys = [key for key in self.data if in_right_closed_range(lo, hi, self.hasher.hash(key))]
+
+        return [(key, self.data.pop(key)) for key in keys]
+
+    def _handle_put_data(self, items: list) -> None:
+        """
+        Handles the data of a leaving node.
+        :param items: The keys of the leaving node and their values.
+        """
+        for key, values in items:
+            self.data.setdefault(key, []).extend(values)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable, Optional
+import numpy as np
+from src.chord_dht.chord import Chord, read_snapshot
+from src.chord_dht.chord_stats import RoutingStats
+from src.chord_dht.chord_utils import finger_table, in_open_range, in_right_closed_range, position_typecode
+
+
+class CompactChord:
+    """
+    A compact, struct-of-arrays representation of the routing state of a Chord-DHT ring, meant for simulating very
+    large rings. Nodes are identified by their position in the sorted array of node IDs, so the successor and the
+    predecessor of the node at position ``p`` are the nodes at positions ``p + 1`` and ``p - 1`` (modulo the ring size).
+    The arrays are NumPy arrays, so whole batches of lookups can be routed at once with :meth:`find_successors`.
+    :cvar m: The number of bits in the hash space.
+    :cvar node_ids: The IDs of the nodes in the ring, in ascending order.
+    :cvar fingers: The ``i``-th finger of every node, as positions in ``node_ids``, in row ``i`` of an ``(m, N)``
+        array of the :func:`position_typecode` of the ring.
+    """
+    m: int
+    node_ids: np.ndarray
+    fingers: np.ndarray
+
+    def __init__(self, m: int, node_ids: Iterable[int]):
+        """
+        Initializes a compact Chord ring from the IDs of its nodes.
+        :param m: The number of bits in the hash space.
+        :param node_ids: The IDs of the nodes in the ring, in any order.
+        :raises ValueError: If ``m`` exceeds 64 bits, the ring is empty, or a node ID is out of bounds or duplicated.
+        """
+        if m > 64:
+            raise ValueError(f"Compact Chord rings support up to m=64, got m={m}.")
+
+        try:
+            node_ids = np.sort(np.fromiter(node_ids, dtype=np.uint64))
+        except OverflowError:
+            raise ValueError(f"Node IDs out of bounds for m={m}.") from None
+
+        if not len(node_ids):
+            raise ValueError("A compact Chord ring needs at least one node.")
+
+        if node_ids[-1] >= 2 ** m:
+            raise ValueError(f"Node IDs out of bounds for m={m}.")
+
+        if np.any(node_ids[1:] == node_ids[:-1]):
+            raise ValueError("Node IDs must be unique.")
+
+        self._set_arrays(m, node_ids, finger_table(node_ids, m))
+
+    def __len__(self) -> int:
+        """
+        The size of the Chord ring.
+        :return: The number of nodes in the ring.
+        """
+        return len(self.node_ids)
+
+    def __getstate__(self) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        Pickles the compact Chord ring by its arrays, without the memory views over them.
+        :return: ``m``, the node IDs and the finger positions.
+        """
+        return self.m, self.node_ids, self.fingers
+
+    def __setstate__(self, state: tuple[int, np.ndarray, np.ndarray]) -> None:
+        """
+        Restores a pickled compact Chord ring.
+        :param state: ``m``, the node IDs and the finger positions.
+        """
+        self._set_arrays(*state)
+
+    @classmethod
+    def from_chord(cls, chord: Chord) -> CompactChord:
+        """
+        Creates a compact representation of a Chord ring.
+        :param chord: The Chord ring.
+        :return: The compact Chord ring.
+        """
+        return cls(chord.m, chord.node_ids)
+
+    @classmethod
+    def load(cls, path: str) -> CompactChord:
+        """
+        Loads the routing state of a Chord ring saved with :meth:`Chord.save`, without creating any node objects or
+        reading any node data.
+        :param path: The path of the snapshot file.
+        :return: The compact Chord ring.
+        :raises ValueError: If the file is not a ring snapshot of a supported version, or holds an empty ring.
+        """
+        _, m, _, node_ids, columns, _, _ = read_snapshot(path)
+
+        if not node_ids:
+            raise ValueError("A compact Chord ring needs at least one node.")
+
+        compact = cls.__new__(cls)
+        compact._set_arrays(m, np.frombuffer(node_ids, dtype=np.uint64),
+                            np.array(columns, dtype=position_typecode(len(node_ids))))
+
+        return compact
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory used by the arrays of the compact Chord ring.
+        :return: The number of bytes of the node ID and finger arrays.
+        """
+        return self.node_ids.nbytes + self.fingers.nbytes
+
+    def position_of(self, node_id: int) -> int:
+        """
+        Finds the position of a node in the ring.
+        :param node_id: The ID of the node.
+        :return: The position of the node in ``node_ids``.
+        :raises ValueError: If the node is not in the ring.
+        """
+        position = bisect_left(self._node_ids, node_id)
+
+        if position == len(self._node_ids) or self._node_ids[position] != node_id:
+            raise ValueError(f"Node ID {node_id} not in the ring.")
+
+        return position
+
+    def successor_of(self, target_id: int) -> int:
+        """
+        Finds the ID of the node responsible for the target ID, in O(log N) time.
+        :param target_id: The ID to find the successor for.
+        :return: The ID of the first node whose ID is equal to or follows the target ID on the ring.
+        """
+        return self._node_ids[bisect_left(self._node_ids, target_id % (2 ** self.m)) % len(self._node_ids)]
+
+    def route(self, target_id: int, start: int = 0) -> list[int]:
+        """
+        Iteratively routes towards the successor of the target ID using the finger arrays, like
+        :meth:`ChordNode._route`.
+        :param target_id: The ID to route to.
+        :param start: The position of the node to start routing from.
+        :return: The positions of the visited nodes, from the start node to the successor of the target ID.
+        """
+        node_ids, fingers, size = self._node_ids, self._fingers, len(self._node_ids)
+        position = start
+        path = [position]
+
+        while node_ids[position] != target_id:
+            successor = (position + 1) % size
+
+            if in_right_closed_range(node_ids[position], node_ids[successor], target_id):
+                path.append(successor)
+                break
+
+            for i in range(self.m - 1, -1, -1):
+                finger = fingers[i][position]
+                if in_open_range(node_ids[position], target_id, node_ids[finger]):
+                    position = finger
+                    break
+            else:
+                position = successor
+
+            path.append(position)
+
+        return path
+
+    def find_successor(self, target_id: int, start_id: Optional[int] = None,
+                       stats: Optional[RoutingStats] = None) -> int:
+        """
+        Finds the ID of the node responsible for the target ID by routing through the finger arrays.
+        :param target_id: The ID to find the successor for.
+        :param start_id: The ID of the node to start routing from, or ``None`` to start from the first node.
+        :param stats: The routing statistics to record the route into, if any.
+        :return: The ID of the successor node for the target ID.
+        """
+        start = 0 if start_id is None else self.position_of(start_id)
+        path = self.route(target_id, start)
+
+        if stats is not None:
+            stats.record([self._node_ids[position] for position in path])
+
+        return self._node_ids[path[-1]]
+
+    def find_successors(self, target_ids: Iterable[int], start_id: Optional[int] = None,
+                        stats: Optional[RoutingStats] = None) -> np.ndarray:
+        """
+        Finds the IDs of the nodes responsible for many target IDs at once, routing all of them through the finger
+        arrays in lockstep, like :meth:`find_successor`.
+        :param target_ids: The IDs to find the successors for.
+        :param start_id: The ID of the node to start routing from, or ``None`` to start from the first node.
+        :param stats: The routing statistics to record the routes into, if any.
+        :return: The ID of the successor node for each target ID, in the order of the target IDs.
+        :raises ValueError: If the start node is not in the ring.
+        """
+        start = 0 if start_id is None else self.position_of(start_id)
+
+        return self.node_ids[self.route_many(np.fromiter(target_ids, dtype=np.uint64), start, stats)]
+
+    def route_many(self, target_ids: np.ndarray, start: int = 0, stats: Optional[RoutingStats] = None) -> np.ndarray:
+        """
+        Routes towards the successors of many target IDs at once. Each step advances every unfinished route by one
+        hop, choosing the same finger as :meth:`route` would: only fingers below the distance to the target can
+        precede it, so each route tries its fingers downwards from the highest such finger index.
+        :param target_ids: The IDs to route to, as an array of unsigned 64-bit integers.
+        :param start: The position of the node to start routing from.
+        :param stats: The routing statistics to record the routes into, if any.
+        :return: The position of the successor of each target ID.
+        """
+        node_ids, fingers, size = self.node_ids, self.fingers, len(self.node_ids)
+        mask = np.uint64((1 << self.m) - 1)
+        positions = np.full(len(target_ids), start, dtype=np.int64)
+        hops = np.zeros(len(target_ids), dtype=np.int64)
+        active = np.flatnonzero(target_ids != node_ids[start])
+
+        while active.size:
+            position, target_id = positions[active], target_ids[active]
+            node_id = node_ids[position]
+            successor = position + 1
+            successor[successor == size] = 0
+            hops[active] += 1
+
+            # Unsigned 64-bit subtractions wrap around modulo 2^64, so the mask also reduces distances in a 64-bit ring.
+            distance = (target_id - node_id) & mask
+            finger_index = np.minimum(np.log2(distance.astype(np.float64)).astype(np.int64), self.m - 1)
+            done = _in_right_closed_ranges(node_id, node_ids[successor], target_id)
+            following = np.where(done, -1, finger_index)
+            pending = np.flatnonzero(following >= 0)
+
+            while pending.size:
+                finger = fingers[following[pending], position[pending]]
+                hit = _in_open_ranges(node_id[pending], target_id[pending], node_ids[finger])
+                successor[pending[hit]] = finger[hit]
+                following[pending] -= 1
+                pending = pending[~hit & (following[pending] >= 0)]
+
+            positions[active] = successor
+            active = active[~done & (node_ids[successor] != target_id)]
+
+        if stats is not None and len(target_ids):
+            histogram = np.bincount(hops).tolist()
+            last_path = [self._node_ids[position] for position in self.route(int(target_ids[-1]), start)]
+            stats.record_histogram({hop_count: count for hop_count, count in enumerate(histogram) if count}, last_path)
+
+        return positions
+
+    def _set_arrays(self, m: int, node_ids: np.ndarray, fingers: np.ndarray) -> None:
+        """
+        Sets the arrays of the compact Chord ring, along with memory views over them, which :meth:`route` indexes
+        with plain Python integers much faster than the arrays themselves.
+        :param m: The number of bits in the hash space.
+        :param node_ids: The IDs of the nodes in the ring, in ascending order.
+        :param fingers: The finger positions, as an ``(m, N)`` array.
+        """
+        self.m = m
+        self.node_ids = node_ids
+        self.fingers = fingers
+        self._node_ids = memoryview(node_ids)
+        self._fingers = [memoryview(row) for row in fingers]
+
+
+def _in_open_ranges(start: np.ndarray, end: np.ndarray, target_id: np.ndarray) -> np.ndarray:
+    """
+    Determines element-wise if the target IDs are in open ranges, like :func:`in_open_range`.
+    :param start: The starts of the ranges.
+    :param end: The ends of the ranges.
+    :param target_id: The IDs to check.
+    :return: Whether each target ID is in its range.
+    """
+    return np.where(start < end, (start < target_id) & (target_id < end), (target_id > start) | (target_id < end))
+
+
+def _in_right_closed_ranges(start: np.ndarray, end: np.ndarray, target_id: np.ndarray) -> np.ndarray:
+    """
+    Determines element-wise if the target IDs are in right-closed ranges, like :func:`in_right_closed_range`.
+    :param start: The starts of the ranges.
+    :param end: The ends of the ranges.
+    :param target_id: The IDs to check.
+    :return: Whether each target ID is in its range.
+    """
+    return np.where(start < end, (start < target_id) & (target_id <= end), (target_id > start) | (target_id <= end))
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import Optional
+import pickle
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Iterable, Optional
+from src.chord_dht.chord_stats import RoutingStats
 from src.chord_dht.chord_utils import *
+from src.chord_dht.chord_wal import WriteAheadLog
 
 
 class ChordNode:
@@ -14,19 +20,61 @@ class ChordNode:
     :cvar predecessor: The previous node in the ring.
     :cvar fingers: The finger table of the node.
     :cvar data: The key-value pairs stored in the node.
+    :cvar data_index: The ``(key ID, key)`` pairs of the stored keys, in ascending order of key IDs.
+    :cvar hasher: The hasher mapping keys to IDs in the Chord ring.
+    :cvar index_field: The value field indexed by the node, or ``None`` if values are not indexed.
+    :cvar value_index: The ``(field value, position)`` pairs of the values stored with each key, in ascending order.
+    :cvar alive: Whether the node is still part of the ring; departed nodes are skipped by routing.
+    :cvar next_finger: The index of the finger refreshed by the last call to :meth:`fix_fingers`.
+    :cvar successor_list: The next nodes in the ring, used to route around and recover from crashed successors.
+    :cvar successor_list_size: The length of the successor list.
+    :cvar replication: The number of copies of each key, kept on the node responsible for it and its successors.
+    :cvar replicas: The copies of the key-value pairs of the preceding nodes, kept for fault tolerance.
+    :cvar reads: The number of lookups served by the node.
+    :cvar owner: The ID of the physical node owning this ring position, which is this node's ID unless it is a virtual
+        node.
+    :cvar wal: The write-ahead log the changes to the data of the node are recorded in, if any.
+    :cvar LAZY_FIELDS: The fields of a node loaded from a ring snapshot that are only deserialized on first access.
     """
+    __slots__ = (
+        "id", "m", "successor", "predecessor", "fingers", "data", "data_index", "hasher", "index_field", "value_index",
+        "alive", "next_finger", "successor_list", "successor_list_size", "replication", "replicas", "reads",
+        "owner", "wal", "_segment"
+    )
+
+    LAZY_FIELDS = frozenset(["data", "data_index", "value_index", "replicas"])
+
     id: int
     m: int
     successor: ChordNode
     predecessor: ChordNode
     fingers: list[ChordNode]
     data: dict[str, list[object]]
-
-    def __init__(self, nid: int, m: int):
+    data_index: list[tuple[int, str]]
+    hasher: KeyHasher
+    index_field: Optional[str]
+    value_index: dict[str, list[tuple[object, int]]]
+    alive: bool
+    next_finger: int
+    successor_list: list[ChordNode]
+    successor_list_size: int
+    replication: int
+    replicas: dict[str, list[object]]
+    reads: int
+    owner: int
+    wal: Optional[WriteAheadLog]
+
+    def __init__(self, nid: int, m: int, hasher: Optional[KeyHasher] = None, index_field: Optional[str] = None,
+                 replication: int = 1, successor_list_size: int = 1, owner: Optional[int] = None):
         """
         A node in a Chord-DHT ring.
         :param nid: The ID of the node.
         :param m: The number of bits in the ID hash space of the Chord ring.
+        :param hasher: The hasher shared by the nodes of the Chord ring, or ``None`` to use a SHA-1 hasher.
+        :param index_field: The field of dictionary values to index for range filters, if any.
+        :param replication: The number of copies of each key, including the one on the responsible node.
+        :param successor_list_size: The length of the successor list, raised to ``replication - 1`` if shorter.
+        :param owner: The ID of the physical node owning this ring position, or ``None`` if it is the node itself.
         """
         self.id = nid
         self.m = m
@@ -34,6 +82,41 @@ class ChordNode:
         self.predecessor = self
         self.fingers = [self] * self.m
         self.data = {}
+        self.data_index = []
+        self.hasher = hasher or KeyHasher(m)
+        self.index_field = index_field
+        self.value_index = {}
+        self.alive = True
+        self.next_finger = self.m - 1
+        self.successor_list = []
+        self.successor_list_size = max(successor_list_size, replication - 1)
+        self.replication = replication
+        self.replicas = {}
+        self.reads = 0
+        self.owner = nid if owner is None else owner
+        self.wal = None
+        self._segment = None
+
+    def __getattr__(self, name: str) -> object:
+        """
+        Deserializes the data of a node loaded from a ring snapshot on first access to any of :attr:`LAZY_FIELDS`.
+        Only called for fields that are not set, so nodes with loaded data are not slowed down.
+        :param name: The name of the field.
+        :return: The value of the field.
+        :raises AttributeError: If the field is not a lazily loaded field of this node.
+        """
+        # Special names are probed often, e.g. by NumPy and pickle, so they fail without formatting a message.
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if name not in ChordNode.LAZY_FIELDS or self._segment is None:
+            raise AttributeError(f"'ChordNode' object has no attribute '{name}'")
+
+        buffer, start, end = self._segment
+        self._segment = None
+        self._deserialize_data(buffer[start:end])
+
+        return getattr(self, name)
 
     def __str__(self) -> str:
         """
@@ -51,6 +134,7 @@ class ChordNode:
             raise ValueError("Node to join cannot be None.")
 
         self.successor = node._find_successor(self.id)
+        self.successor._recover_predecessor()
         self.predecessor = self.successor.predecessor
 
         logging.info(f"Node {self.id} is joining the ring between {self.predecessor.id} and {self.successor.id}...")
@@ -61,6 +145,8 @@ class ChordNode:
         self._init_fingers()
         self._update_others_fingers()
         self._pull_data_from_successor()
+        self._refresh_preceding_successor_lists(self)
+        self._sync_replicas_from(self, self.replication + 1)
 
     def leave(self):
         """
@@ -68,52 +154,262 @@ class ChordNode:
         """
         logging.info(f"Node {self.id} is leaving the ring...")
 
+        self._recover_predecessor()
+        self.successor = self.fingers[0] = self._alive_successor()
+        self.successor._recover_predecessor()
+
         self._replace_in_others_fingers()
         self._push_data_to_successor()
 
-        self.successor.predecessor = self.predecessor
-        self.predecessor.successor = self.successor
+        successor, predecessor = self.successor, self.predecessor
+        successor.predecessor = predecessor
+        predecessor.successor = successor
         self.successor = self.predecessor = self
         self.fingers = [self] * self.m
+        self.successor_list = []
+        self.replicas = {}
+
+        self._refresh_preceding_successor_lists(predecessor)
+        self._sync_replicas_from(successor, self.replication)
+
+    def crash(self):
+        """
+        Fails the node abruptly: it stops serving without handing over its data or updating any other node. The ring
+        recovers through the successor lists, the replicas and the stabilization protocol.
+        """
+        logging.info(f"Node {self.id} crashed.")
+
+        self.alive = False
+
+    def join_lazily(self, node: ChordNode):
+        """
+        Joins the node to the Chord ring as in the stabilization protocol: only the successor is looked up and notified,
+        so that the new node is known to an alive node before it can leave again, and the rest of the ring learns about
+        this node through :meth:`stabilize`, :meth:`notify` and :meth:`fix_fingers`.
+        :param node: The node to join to the Chord ring.
+        """
+        if not node:
+            raise ValueError("Node to join cannot be None.")
+
+        self.predecessor = self
+        self.successor = node._find_successor(self.id)
+        self.fingers = [self.successor] * self.m
+        self._adopt_successor_list()
+        self.successor.notify(self)
 
-    def insert(self, key: str, value: object) -> None:
+        logging.info(f"Node {self.id} is lazily joining the ring before {self.successor.id}...")
+
+    def leave_lazily(self, bootstrap: Optional[ChordNode] = None):
+        """
+        Leaves the Chord ring, only updating the neighbouring nodes and handing over the data. Stale fingers of other
+        nodes are skipped by routing and refreshed by :meth:`fix_fingers`.
+        :param bootstrap: An alive node of the ring to look the successor up through, if this node knows no other alive
+            node, if any.
+        """
+        logging.info(f"Node {self.id} is lazily leaving the ring...")
+
+        # The pointers may not be stabilized yet: the data goes to the first alive successor, or any alive node known
+        # to this node, from where stabilization moves it on. The node that still points at this one may not be its
+        # predecessor, e.g. when a lazy join has moved the predecessor pointer, so it is looked up by routing.
+        self.alive = False
+        predecessor = self.predecessor
+        successor = self._alive_successor()
+
+        if successor is self and bootstrap is not None and bootstrap is not self:
+            successor = bootstrap._find_successor(self.id)
+
+        if successor is self:
+            return
+
+        if predecessor is not self and predecessor.successor is self:
+            predecessor.successor = predecessor.fingers[0] = successor
+
+        node = successor._find_predecessor(self.id)
+
+        while node.successor is self:
+            node.successor = node.fingers[0] = successor
+            node = successor._find_predecessor(self.id)
+
+        successor._put_data(self.data_index, self.data, self.value_index)
+        self._clear_data()
+
+        if successor.predecessor is self:
+            successor.predecessor = predecessor if predecessor.alive else successor
+
+        self._sync_replicas_from(successor, self.replication)
+
+    def stabilize(self, bootstrap: Optional[ChordNode] = None):
+        """
+        Verifies the successor of the node, adopting the successor's predecessor if it has joined in between, and
+        notifies the successor about this node.
+        :param bootstrap: The node to look the successor up through, as when joining, if this node knows no other alive
+            node, if any.
+        """
+        if not self.successor.alive:
+            self.successor = self.fingers[0] = self._alive_successor()
+
+        if self.successor is self and bootstrap is not None and bootstrap is not self:
+            self.successor = self.fingers[0] = bootstrap._find_successor(self.id)
+
+        node = self.successor.predecessor
+
+        if node.alive and in_open_range(self.id, self.successor.id, node.id):
+            self.successor = node
+            self.fingers[0] = node
+
+        self.successor.notify(self)
+        self._adopt_successor_list()
+
+    def notify(self, node: ChordNode):
+        """
+        Handles a node that thinks it might be the predecessor of this node, handing it the keys it is now
+        responsible for.
+        :param node: The node that might be the predecessor.
+        """
+        if node is self:
+            return
+
+        self.check_predecessor()
+
+        changed = False
+
+        if self.predecessor is self or in_open_range(self.predecessor.id, self.id, node.id):
+            self._hand_over_to(node)
+            self._promote_replicas(node.id)
+            self.predecessor = node
+            changed = True
+        elif node is self.predecessor:
+            changed = self._hand_over_to(node)
+
+        if changed and self.replication > 1:
+            node._sync_replicas()
+            self._sync_replicas_from(self, self.replication)
+
+    def fix_fingers(self):
+        """
+        Refreshes the next finger of the node, cycling through the finger table on successive calls.
+        """
+        self.next_finger = (self.next_finger + 1) % self.m
+        self.fingers[self.next_finger] = self._find_successor((self.id + 2 ** self.next_finger) % (2 ** self.m))
+
+    def check_predecessor(self):
+        """
+        Clears the predecessor of the node if it has left the ring, so that :meth:`notify` can set a new one.
+        """
+        if not self.predecessor.alive:
+            self.predecessor = self
+
+    def insert(self, key: str, value: object, stats: Optional[RoutingStats] = None) -> None:
         """
         Inserts a key and its associated value into the Chord ring.
         :param key: The key to insert.
         :param value: The value to insert.
+        :param stats: The routing statistics to record the route into, if any.
         """
-        key_id = hash_id(key, self.m)
-        node = self._find_successor(key_id)
+        key_id = self.hasher.hash(key)
+        node = self._find_successor(key_id, stats)
 
         logging.info(f"Inserting key {key} into node {node.id}...")
 
-        node.data.setdefault(key, []).append(value)
+        node._store(key_id, key, value)
+        node._replicate(key, value)
 
-    def lookup(self, key: str) -> list[object]:
+    def lookup(self, key: str, stats: Optional[RoutingStats] = None,
+               where: Optional[ValueFilter] = None) -> list[object]:
         """
         Looks up a key in the Chord ring and returns the associated value.
         :param key: The key to lookup.
+        :param stats: The routing statistics to record the route into, if any.
+        :param where: The filter applied to the values by the responsible node, if any.
         :return: The value associated with the key, or ``None`` if the key cannot be found.
         """
-        key_id = hash_id(key, self.m)
-        node = self._find_successor(key_id)
+        key_id = self.hasher.hash(key)
+        node = self._find_successor(key_id, stats)
 
         logging.info(f"Looking up key {key} in node {node.id}...")
 
-        return node.data[key] if key in node.data else []
+        return node._read(key, where)
+
+    def insert_many(self, items: Iterable[tuple[str, object]], stats: Optional[RoutingStats] = None) -> None:
+        """
+        Inserts many keys and their associated values into the Chord ring, routing once per responsible node.
+        :param items: The key-value pairs to insert.
+        :param stats: The routing statistics to record the routes into, if any.
+        """
+        items = list(items)
+        key_ids = {key: self.hasher.hash(key) for key, _ in items}
+        successors = self._find_successors(key_ids.values(), stats)
+
+        logging.info(f"Inserting {len(items)} keys into {len(set(successors.values()))} nodes...")
+
+        for key, value in items:
+            successors[key_ids[key]]._store(key_ids[key], key, value)
+            successors[key_ids[key]]._replicate(key, value)
+
+    def lookup_many(self, keys: Iterable[str], stats: Optional[RoutingStats] = None,
+                    where: Optional[ValueFilter] = None) -> list[list[object]]:
+        """
+        Looks up many keys in the Chord ring, routing once per responsible node.
+        :param keys: The keys to lookup.
+        :param stats: The routing statistics to record the routes into, if any.
+        :param where: The filter applied to the values by the responsible nodes, if any.
+        :return: The values associated with each key, in the order of the given keys.
+        """
+        keys = list(keys)
+        key_ids = {key: self.hasher.hash(key) for key in keys}
+        successors = self._find_successors(key_ids.values(), stats)
+
+        logging.info(f"Looking up {len(keys)} keys in {len(set(successors.values()))} nodes...")
+
+        return [successors[key_ids[key]]._read(key, where) for key in keys]
+
+    def range_lookup(self, lo_id: int, hi_id: int,
+                     stats: Optional[RoutingStats] = None) -> list[tuple[str, list[object]]]:
+        """
+        Looks up all keys with IDs in an inclusive, possibly wrapping, range of the Chord ring. Routing is performed
+        once, to the successor of the lower bound, and the successors covering the range are then walked in order.
+        :param lo_id: The lowest key ID of the range.
+        :param hi_id: The highest key ID of the range.
+        :param stats: The routing statistics to record the route into, if any.
+        :return: The keys in the range and their associated values, in ring order starting from the lower bound.
+        """
+        size = 2 ** self.m
+        span = (hi_id - lo_id) % size
+        first = node = self._find_successor(lo_id, stats)
+
+        # The first node may also hold the end of a range that wraps all the way around the ring.
+        entries = first._index_range(lo_id, hi_id)
+        split = bisect_right(entries, (first.id - lo_id) % size, key=lambda entry: (entry[0] - lo_id) % size)
+        results = [(key, first.data[key]) for _, key in entries[:split]]
+
+        while (node.id - lo_id) % size < span:
+            node = node.successor
+
+            if node is first:
+                break
+
+            results.extend((key, node.data[key]) for _, key in node._index_range(lo_id, hi_id))
+
+        results.extend((key, first.data[key]) for _, key in entries[split:])
+
+        logging.info(f"Looked up {len(results)} keys in range [{lo_id}, {hi_id}] from node {first.id}...")
+
+        return results
 
     def delete(self, key: str) -> None:
         """
         Deletes a key and its associated value from the Chord ring.
         :param key: The key to delete.
         """
-        key_id = hash_id(key, self.m)
+        key_id = self.hasher.hash(key)
         node = self._find_successor(key_id)
 
         logging.info(f"Deleting key {key} from node {node.id}...")
 
-        if key in node.data:
-            del node.data[key]
+        node._remove(key_id, key)
+
+        for holder in node._replica_holders():
+            holder.replicas.pop(key, None)
 
     def _find_closest_finger(self, target_id: int) -> ChordNode:
         """
@@ -123,34 +419,84 @@ class ChordNode:
         """
         for i in range(self.m - 1, -1, -1):
             finger = self.fingers[i]
-            if in_open_range(self.id, target_id, finger.id):
+            if in_open_range(self.id, target_id, finger.id) and finger.alive:
                 return finger
 
         return self
 
-    def _find_successor(self, target_id: int) -> ChordNode:
+    def _route(self, target_id: int) -> tuple[ChordNode, list[ChordNode]]:
+        """
+        Iteratively routes towards the successor node of the target ID, following the closest preceding fingers.
+        Falls back to the successor pointer when no finger makes progress, so a degraded finger table cannot loop.
+        :param target_id: The ID to route to.
+        :return: The successor node for the target ID and the path of visited nodes, starting from this node.
+        """
+        node = self
+        path = [self]
+
+        while node.id != target_id:
+            successor = node.successor if node.successor.alive else node._alive_successor()
+
+            if in_right_closed_range(node.id, successor.id, target_id):
+                node = successor
+                path.append(node)
+                break
+
+            finger = node._find_closest_finger(target_id)
+            node = finger if finger is not node else successor
+            path.append(node)
+
+        return node, path
+
+    def _find_successor(self, target_id: int, stats: Optional[RoutingStats] = None) -> ChordNode:
         """
         Finds the successor node for the target ID.
         :param target_id: The ID to find the successor for.
+        :param stats: The routing statistics to record the route into, if any.
         :return: The successor node for the target ID.
         """
-        if self.id == target_id:
-            return self
-        if in_right_closed_range(self.id, self.successor.id, target_id):
-            return self.successor
-        else:
-            return self._find_closest_finger(target_id)._find_successor(target_id)
+        node, path = self._route(target_id)
+
+        if stats is not None:
+            stats.record([visited.id for visited in path])
+
+        return node
+
+    def _find_successors(self, target_ids: Iterable[int], stats: Optional[RoutingStats] = None) -> dict[int, ChordNode]:
+        """
+        Finds the successor nodes for many target IDs. The IDs are visited in ascending order, so that routing is only
+        performed when an ID falls outside the range of the previously found node.
+        :param target_ids: The IDs to find the successors for.
+        :param stats: The routing statistics to record the routes into, if any.
+        :return: A dictionary mapping each target ID to its successor node.
+        """
+        successors = {}
+        node = None
+
+        for target_id in sorted(set(target_ids)):
+            if node is None or not in_right_closed_range(node.predecessor.id, node.id, target_id):
+                node = (node or self)._find_successor(target_id, stats)
+            successors[target_id] = node
+
+        return successors
 
     def _find_predecessor(self, target_id: int) -> ChordNode:
         """
-        Finds the predecessor node for the target ID.
+        Finds the predecessor node for the target ID. Like :meth:`_route`, falls back to the first alive successor when
+        no finger makes progress, so dead fingers cannot loop.
         :param target_id: The ID to find the predecessor for.
         :return: The predecessor node for the target ID.
         """
         node = self
-        while not in_right_closed_range(node.id, node.successor.id, target_id):
-            node = node._find_closest_finger(target_id)
-        return node
+
+        while True:
+            successor = node.successor if node.successor.alive else node._alive_successor()
+
+            if in_right_closed_range(node.id, successor.id, target_id):
+                return node
+
+            finger = node._find_closest_finger(target_id)
+            node = finger if finger is not node else successor
 
     def _init_fingers(self):
         """
@@ -162,36 +508,325 @@ class ChordNode:
 
     def _update_others_fingers(self):
         """
-        Updates the fingers of other nodes to include this node, if necessary.
+        Updates the fingers of other nodes to include this node, if necessary. For each finger index ``i``, only the
+        nodes preceding ``id - 2^i`` whose ``i``-th finger should now point at this node are visited.
         """
-        node = self.successor
-        while node != self:
-            node.fingers = [self._find_successor((node.id + 2 ** i) % (2 ** self.m)) for i in range(self.m)]
-            node = node.successor
+        for i in range(self.m):
+            node = self._find_predecessor((self.id - 2 ** i + 1) % (2 ** self.m))
+            while node is not self and in_open_range((node.id + 2 ** i - 1) % (2 ** self.m), node.fingers[i].id, self.id):
+                node.fingers[i] = self
+                node = node.predecessor
 
     def _replace_in_others_fingers(self):
         """
-        Replaces this node in the fingers of other nodes with its successor.
+        Replaces this node in the fingers of other nodes with its successor. For each finger index ``i``, only the
+        nodes preceding ``id - 2^i`` whose ``i``-th finger points at this node are visited and patched in place.
+        """
+        for i in range(self.m):
+            node = self._find_predecessor((self.id - 2 ** i + 1) % (2 ** self.m))
+            while node is not self and node.fingers[i] is self:
+                node.fingers[i] = self.successor
+                node = node.predecessor
+
+    def _store(self, key_id: int, key: str, value: object) -> None:
+        """
+        Stores a value with a key in this node, indexing the key by its ID if it is new.
+        :param key_id: The ID of the key.
+        :param key: The key to store the value with.
+        :param value: The value to store.
+        """
+        if self.wal is not None:
+            self._log("store", key_id, key, value)
+
+        self._append(key_id, key, value)
+
+    def _append(self, key_id: int, key: str, value: object) -> None:
+        """
+        Stores a value with a key in this node without logging it, indexing the key by its ID if it is new.
+        :param key_id: The ID of the key.
+        :param key: The key to store the value with.
+        :param value: The value to store.
+        """
+        if key not in self.data:
+            self.data[key] = []
+            insort(self.data_index, (key_id, key))
+
+        if self.index_field is not None and isinstance(value, dict) and self.index_field in value:
+            insort(self.value_index.setdefault(key, []), (value[self.index_field], len(self.data[key])))
+
+        self.data[key].append(value)
+
+    def _index_range(self, lo_id: int, hi_id: int) -> list[tuple[int, str]]:
         """
+        Finds the indexed keys of this node with IDs in an inclusive, possibly wrapping, range.
+        :param lo_id: The lowest key ID of the range.
+        :param hi_id: The highest key ID of the range.
+        :return: The ``(key ID, key)`` pairs in the range, in ring order starting from the lower bound.
+        """
+        start = bisect_left(self.data_index, lo_id, key=itemgetter(0))
+        end = bisect_right(self.data_index, hi_id, key=itemgetter(0))
+
+        if lo_id <= hi_id:
+            return self.data_index[start:end]
+
+        return self.data_index[start:] + self.data_index[:end]
+
+    def _alive_successor(self) -> ChordNode:
+        """
+        Finds the first successor of the node that has not crashed, using the successor list, then the nearest alive
+        finger and the predecessor, so an exhausted successor list does not make this node responsible for the whole
+        ring.
+        :return: The first alive successor, or this node if it knows no other alive node.
+        """
+        for node in [self.successor, *self.successor_list, *self.fingers, self.predecessor]:
+            if node.alive and node is not self:
+                return node
+
+        return self
+
+    def _refresh_successor_list(self):
+        """
+        Rebuilds the successor list of the node by following the successor pointers.
+        """
+        self.successor_list = []
         node = self.successor
-        while node != self:
-            node.fingers = [self.successor if finger == self else finger for finger in node.fingers]
+
+        while node is not self and len(self.successor_list) < self.successor_list_size:
+            self.successor_list.append(node)
             node = node.successor
 
+    def _defer_data(self, buffer: object, start: int, end: int):
+        """
+        Drops the data of the node, to be deserialized from a segment of a ring snapshot on first access.
+        :param buffer: The buffer holding the snapshot, e.g. a memory map of the snapshot file.
+        :param start: The offset of the first byte of the node's segment.
+        :param end: The offset after the last byte of the node's segment.
+        """
+        del self.data, self.data_index, self.value_index, self.replicas
+        self._segment = (buffer, start, end)
+
+    def _deserialize_data(self, segment: bytes):
+        """
+        Replaces the data of the node with data serialized by :meth:`_serialize_data`.
+        :param segment: The serialized data, indexes and replicas of the node.
+        """
+        self.data, self.data_index, self.value_index, self.replicas = pickle.loads(segment)
+
+    def _recover_from(self, wal: WriteAheadLog):
+        """
+        Restores the data of the node from a write-ahead log, replaying its records on top of its snapshot, and
+        records further changes in the log.
+        :param wal: The write-ahead log of the node.
+        """
+        snapshot, records = wal.recover()
+
+        if snapshot is not None:
+            self._deserialize_data(snapshot)
+
+        for op, *args in records:
+            getattr(self, f"_{op}")(*args)
+
+        self.wal = wal
+
+        logging.info(f"Node {self.id} recovered {len(self.data)} keys from {wal.path}.")
+
+    def _log(self, op: str, *args: object):
+        """
+        Records a change to the data of the node in its write-ahead log, if any, compacting the log first if it has
+        grown too long.
+        :param op: The name of the method applying the change, without the leading underscore.
+        :param args: The arguments of the method.
+        """
+        if self.wal is None:
+            return
+
+        if self.wal.needs_compaction:
+            self.wal.compact(self._serialize_data())
+
+        self.wal.append((op, *args))
+
+    def _serialize_data(self) -> bytes:
+        """
+        Serializes the data of the node into a segment of a ring snapshot.
+        :return: The serialized data, indexes and replicas of the node.
+        """
+        return pickle.dumps((self.data, self.data_index, self.value_index, self.replicas), pickle.HIGHEST_PROTOCOL)
+
+    def _adopt_successor_list(self):
+        """
+        Rebuilds the successor list of the node from the successor and its successor list, as in the stabilization
+        protocol.
+        """
+        if self.successor is self:
+            return
+
+        successors = [self.successor] + self.successor.successor_list
+        self.successor_list = [node for node in successors if node is not self and node.alive]
+        del self.successor_list[self.successor_list_size:]
+
+    def _refresh_preceding_successor_lists(self, node: ChordNode):
+        """
+        Rebuilds the successor lists of a node and of the preceding nodes whose lists may include it.
+        :param node: The last node whose successor list changed.
+        """
+        for _ in range(self.successor_list_size + 1):
+            node._refresh_successor_list()
+            node = node.predecessor
+
+    def _replica_holders(self) -> list[ChordNode]:
+        """
+        The nodes holding copies of the keys of this node.
+        :return: The next ``replication - 1`` alive successors.
+        """
+        if self.replication == 1:
+            return []
+
+        return [node for node in self.successor_list if node.alive][:self.replication - 1]
+
+    def _replicate(self, key: str, value: object):
+        """
+        Copies a newly stored value to the replica holders of this node.
+        :param key: The key the value is stored with.
+        :param value: The stored value.
+        """
+        for holder in self._replica_holders():
+            holder.replicas.setdefault(key, []).append(value)
+
+    def _sync_replicas(self):
+        """
+        Rebuilds the replicas of the node from the data of its ``replication - 1`` preceding nodes.
+        """
+        self.replicas = {}
+        node = self.predecessor
+
+        for _ in range(self.replication - 1):
+            if node is self or not node.alive:
+                break
+            # Keys a node only holds on their way to the node responsible for them are not its to replicate.
+            for _, key in node._index_range((node.predecessor.id + 1) % 2 ** self.m, node.id):
+                self.replicas[key] = list(node.data[key])
+            node = node.predecessor
+
+    def _sync_replicas_from(self, node: ChordNode, count: int):
+        """
+        Rebuilds the replicas of a number of consecutive nodes after the data or membership of the ring changed.
+        :param node: The first node to rebuild the replicas of.
+        :param count: The number of nodes to rebuild the replicas of.
+        """
+        if self.replication == 1:
+            return
+
+        for _ in range(count):
+            node._sync_replicas()
+            node = node.successor
+
+    def _promote_replicas(self, lo_id: int):
+        """
+        Takes over the keys of crashed predecessors: the replicas with IDs after the new predecessor become data. The
+        values stored with such a key since the crash are kept after the older values of the replica.
+        :param lo_id: The ID of the new predecessor.
+        """
+        for key, values in list(self.replicas.items()):
+            key_id = self.hasher.hash(key)
+            if not in_right_closed_range(lo_id, self.id, key_id):
+                continue
+
+            stored = self.data.get(key, [])
+            merged = values + [value for value in stored if value not in values]
+
+            if merged != stored:
+                self._remove(key_id, key)
+                for value in merged:
+                    self._store(key_id, key, value)
+
+    def _recover_predecessor(self):
+        """
+        Takes over the keys of crashed predecessors before an eager join or leave next to this node, as
+        :meth:`notify` would, and links this node to its first alive predecessor.
+        """
+        if self.predecessor.alive:
+            return
+
+        predecessor = self._find_predecessor(self.id)
+        self._promote_replicas(predecessor.id)
+        self.predecessor = predecessor
+        predecessor.successor = predecessor.fingers[0] = self
+
+    def _read(self, key: str, where: Optional[ValueFilter] = None) -> list[object]:
+        """
+        Reads the values of a key of this node from the least loaded of this node and its replica holders.
+        :param key: The key to read.
+        :param where: The filter applied to the values, if any.
+        :return: The selected values.
+        """
+        holders = [holder for holder in self._replica_holders() if key in holder.replicas]
+        node = min([self, *holders], key=lambda holder: holder.reads)
+        node.reads += 1
+
+        return node._select(key, where)
+
+    def _select(self, key: str, where: Optional[ValueFilter] = None) -> list[object]:
+        """
+        Selects the values stored with a key in this node that pass a filter.
+        :param key: The key to select the values of.
+        :param where: A predicate on the values, or an inclusive range over the indexed value field, if any.
+        :return: The selected values, in insertion order.
+        :raises ValueError: If a range is given but the node does not index a value field.
+        """
+        values = self.data[key] if key in self.data else self.replicas.get(key, [])
+
+        if where is None:
+            return values
+
+        if callable(where):
+            return [value for value in values if where(value)]
+
+        if self.index_field is None:
+            raise ValueError("Range filters require an indexed value field.")
+
+        low, high = where
+
+        if key not in self.data:
+            field = self.index_field
+            return [value for value in values
+                    if isinstance(value, dict) and field in value and low <= value[field] <= high]
+
+        index = self.value_index.get(key, [])
+        start = bisect_left(index, low, key=itemgetter(0))
+        end = bisect_right(index, high, key=itemgetter(0))
+
+        return [values[position] for position in sorted(position for _, position in index[start:end])]
+
+    def _remove(self, key_id: int, key: str) -> None:
+        """
+        Removes a key and its values from this node, if it is stored.
+        :param key_id: The ID of the key.
+        :param key: The key to remove.
+        """
+        if key not in self.data:
+            return
+
+        self._log("remove", key_id, key)
+
+        del self.data[key]
+        del self.data_index[bisect_left(self.data_index, (key_id, key))]
+        self.value_index.pop(key, None)
+
     def _pull_data_from_successor(self):
         """
         Pulls all data, this node should store, from its successor node.
         """
-        if self == self.successor:
-            return
+        self._pull_data_from(self.successor)
 
-        transfer_data = {
-            key: self.successor.data.pop(key)
-            for key in list(self.successor.data)
-            if in_right_closed_range(self.predecessor.id, self.id, hash_id(key, self.m))
-        }
+    def _pull_data_from(self, node: ChordNode):
+        """
+        Pulls all data, this node should store, from the node that held it before this node joined.
+        :param node: The node holding the data of this node.
+        """
+        if self == node:
+            return
 
-        self.data.update(transfer_data)
+        self._put_data(*node._take_range(self.predecessor.id, self.id))
 
     def _push_data_to_successor(self):
         """
@@ -200,5 +835,95 @@ class ChordNode:
         if self == self.successor:
             return
 
-        self.successor.data.update(self.data)
-        self.data.clear()
+        self.successor._put_data(self.data_index, self.data, self.value_index)
+        self._clear_data()
+
+    def _hand_over_to(self, node: ChordNode) -> bool:
+        """
+        Hands the keys outside the range of this node over to its predecessor. Besides the keys the predecessor takes
+        over when it joins, these are the keys pushed past it by a node that left before the ring stabilized; they
+        move back one node per round of stabilization until they reach the node responsible for them.
+        :param node: The predecessor of this node.
+        :return: Whether any keys were handed over.
+        """
+        if not self._count_outside(node.id):
+            return False
+
+        node._put_data(*self._take_range(self.id, node.id))
+
+        return True
+
+    def _count_outside(self, lo_id: int) -> int:
+        """
+        Counts the keys of this node with IDs outside the range ``(lo_id, id]``.
+        :param lo_id: The exclusive start of the range.
+        :return: The number of keys outside the range.
+        """
+        index = self.data_index
+        start = bisect_right(index, lo_id, key=itemgetter(0))
+        end = bisect_right(index, self.id, key=itemgetter(0))
+
+        return len(index) - (end - start if lo_id < self.id else len(index) - start + end)
+
+    def _clear_data(self):
+        """
+        Removes all keys from this node.
+        """
+        self._log("clear_data")
+
+        self.data = {}
+        self.data_index = []
+        self.value_index = {}
+
+    def _take_range(self, lo_id: int, hi_id: int) -> tuple[list[tuple[int, str]], dict, dict]:
+        """
+        Removes the keys with IDs in the range ``(lo_id, hi_id]`` from this node. The keys form a contiguous (possibly
+        wrapping) slice of the index, so only the moved keys are visited.
+        :param lo_id: The exclusive start of the range.
+        :param hi_id: The inclusive end of the range.
+        :return: The index entries, data and value index of the removed keys.
+        """
+        self._log("take_range", lo_id, hi_id)
+
+        index = self.data_index
+        start = bisect_right(index, lo_id, key=itemgetter(0))
+        end = bisect_right(index, hi_id, key=itemgetter(0))
+
+        if lo_id < hi_id:
+            taken = index[start:end]
+            del index[start:end]
+        else:
+            taken = index[:end] + index[start:]
+            self.data_index = index[end:start]
+
+        data = {key: self.data.pop(key) for _, key in taken}
+        value_index = {key: self.value_index.pop(key) for _, key in taken if key in self.value_index}
+
+        return taken, data, value_index
+
+    def _put_data(self, index: list[tuple[int, str]], data: dict, value_index: dict):
+        """
+        Adds keys removed from another node to this node, merging the sorted indexes of both nodes and skipping the
+        values of a key this node already stores.
+        :param index: The index entries of the keys.
+        :param data: The values of the keys.
+        :param value_index: The value index of the keys.
+        """
+        self._log("put_data", index, data, value_index)
+
+        new_index = []
+
+        for key_id, key in index:
+            if key in self.data:
+                # Both nodes may hold a key after churn, e.g. one as a promoted replica: the copies are merged once.
+                existing = list(self.data[key])
+                for value in data[key]:
+                    if value not in existing:
+                        self._append(key_id, key, value)
+            else:
+                new_index.append((key_id, key))
+                self.data[key] = data[key]
+                if key in value_index:
+                    self.value_index[key] = value_index[key]
+
+        self.data_index = list(heapq.merge(self.data_index, new_index)) if self.data_index else new_index
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Optional
+import numpy as np
+from src.chord_dht.chord_compact import CompactChord
+from src.chord_dht.chord_stats import RoutingStats
+from src.chord_dht.chord_utils import KeyHasher, position_typecode
+
+_worker_state: Optional[tuple[ChordSnapshot, KeyHasher]] = None
+"""The snapshot and key hasher of a worker process of a :class:`ParallelRouter`."""
+
+
+class ChordSnapshot(CompactChord):
+    """
+    An immutable compact Chord ring whose node ID and finger arrays live in a single block of shared memory. Other
+    processes attach to the block by name, so a snapshot is pickled as a reference instead of a copy of the ring.
+    The process that created the snapshot owns the block and frees it on :meth:`unlink`.
+    :cvar shared_memory: The block of shared memory holding the arrays.
+    """
+    shared_memory: SharedMemory
+
+    def __init__(self, m: int, node_ids: Iterable[int]):
+        """
+        Initializes a snapshot of a Chord ring from the IDs of its nodes, in a new block of shared memory.
+        :param m: The number of bits in the hash space.
+        :param node_ids: The IDs of the nodes in the ring, in any order.
+        :raises ValueError: If ``m`` exceeds 64 bits, the ring is empty, or a node ID is out of bounds or duplicated.
+        """
+        compact = CompactChord(m, node_ids)
+        shared_memory = SharedMemory(create=True, size=compact.nbytes)
+
+        self._attach(shared_memory, m, len(compact), owner=True)
+        self.node_ids[:] = compact.node_ids
+        self.fingers[:] = compact.fingers
+
+        logging.info(f"Created snapshot {self.name} of {len(self)} nodes ({self.nbytes} bytes).")
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the snapshot as a reference to its block of shared memory.
+        :return: The function attaching to the block and its arguments.
+        """
+        return ChordSnapshot.attach, (self.name, self.m, len(self))
+
+    def __enter__(self) -> ChordSnapshot:
+        """
+        Uses the snapshot as a context manager.
+        :return: The snapshot.
+        """
+        return self
+
+    def __exit__(self, *_) -> None:
+        """
+        Frees the snapshot if this process owns it, or detaches from it otherwise.
+        """
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    @classmethod
+    def attach(cls, name: str, m: int, size: int) -> ChordSnapshot:
+        """
+        Attaches to the snapshot created by another process.
+        :param name: The name of the block of shared memory of the snapshot.
+        :param m: The number of bits in the hash space.
+        :param size: The number of nodes in the ring.
+        :return: The attached snapshot.
+        """
+        snapshot = cls.__new__(cls)
+        snapshot._attach(SharedMemory(name=name), m, size, owner=False)
+
+        return snapshot
+
+    @property
+    def name(self) -> str:
+        """
+        The name other processes attach to the snapshot with.
+        :return: The name of the block of shared memory.
+        """
+        return self.shared_memory.name
+
+    def close(self) -> None:
+        """
+        Detaches this process from the snapshot. The snapshot cannot be used afterwards.
+        """
+        for view in [self._node_ids, *self._fingers]:
+            view.release()
+        del self.node_ids, self.fingers, self._node_ids, self._fingers
+        self.shared_memory.close()
+
+    def unlink(self) -> None:
+        """
+        Detaches this process from the snapshot and frees its block of shared memory.
+        """
+        self.close()
+        self.shared_memory.unlink()
+
+    def _attach(self, shared_memory: SharedMemory, m: int, size: int, owner: bool) -> None:
+        """
+        Maps the arrays of the snapshot onto a block of shared memory: the node IDs, followed by the finger positions
+        for each finger index.
+        :param shared_memory: The block of shared memory.
+        :param m: The number of bits in the hash space.
+        :param size: The number of nodes in the ring.
+        :param owner: Whether this process created the block.
+        """
+        node_ids = np.ndarray((size,), dtype=np.uint64, buffer=shared_memory.buf)
+        fingers = np.ndarray((m, size), dtype=position_typecode(size), buffer=shared_memory.buf, offset=node_ids.nbytes)
+
+        self.shared_memory = shared_memory
+        self._set_arrays(m, node_ids, fingers)
+        self._owner = owner
+
+
+class ParallelRouter:
+    """
+    Routes large batches of lookups over a shared Chord ring snapshot in a pool of worker processes. Each worker
+    attaches to the snapshot once and routes whole chunks of keys, returning only the responsible node IDs and the
+    routing statistics of the chunk.
+    :cvar snapshot: The snapshot of the Chord ring to route over.
+    :cvar chunk_size: The number of keys sent to a worker at a time.
+    """
+    snapshot: ChordSnapshot
+    chunk_size: int
+
+    def __init__(self, snapshot: ChordSnapshot, processes: Optional[int] = None, chunk_size: int = 10000,
+                 hash_function: str = "sha1"):
+        """
+        Initializes a router and starts its worker processes.
+        :param snapshot: The snapshot of the Chord ring to route over.
+        :param processes: The number of worker processes, or ``None`` for one per CPU.
+        :param chunk_size: The number of keys sent to a worker at a time.
+        :param hash_function: The hash function the keys are stored with in the ring.
+        :raises ValueError: If the chunk size is not positive or the hash function is unknown.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive.")
+
+        KeyHasher(snapshot.m, hash_function)
+
+        self.snapshot = snapshot
+        self.chunk_size = chunk_size
+        self._pool = multiprocessing.Pool(processes, _init_worker, (snapshot, hash_function))
+
+    def __enter__(self) -> ParallelRouter:
+        """
+        Uses the router as a context manager.
+        :return: The router.
+        """
+        return self
+
+    def __exit__(self, *_) -> None:
+        """
+        Stops the worker processes.
+        """
+        self.close()
+
+    def find_successors(self, keys: Iterable[str], start_id: Optional[int] = None,
+                        stats: Optional[RoutingStats] = None) -> list[int]:
+        """
+        Finds the IDs of the nodes responsible for many keys by routing them through the finger arrays in parallel.
+        :param keys: The keys to route.
+        :param start_id: The ID of the node to start routing from, or ``None`` to start from the first node.
+        :param stats: The routing statistics to record the routes into, if any.
+        :return: The ID of the responsible node of each key, in the order of the keys.
+        :raises ValueError: If the start node is not in the ring.
+        """
+        start = 0 if start_id is None else self.snapshot.position_of(start_id)
+        keys = iter(keys)
+        chunks = iter(lambda: list(islice(keys, self.chunk_size)), [])
+        successor_ids = []
+
+        for chunk_ids, chunk_stats in self._pool.imap(_route_chunk, ((chunk, start) for chunk in chunks)):
+            successor_ids.extend(chunk_ids)
+            if stats is not None:
+                stats.merge(chunk_stats)
+
+        return successor_ids
+
+    def close(self) -> None:
+        """
+        Stops the worker processes. The snapshot is left to its owner.
+        """
+        self._pool.close()
+        self._pool.join()
+
+
+def _init_worker(snapshot: ChordSnapshot, hash_function: str) -> None:
+    """
+    Sets up a worker process of a :class:`ParallelRouter`.
+    :param snapshot: The snapshot, attached to by this process.
+    :param hash_function: The hash function the keys are stored with in the ring.
+    """
+    global _worker_state
+    _worker_state = snapshot, KeyHasher(snapshot.m, hash_function)
+
+
+def _route_chunk(task: tuple[list[str], int]) -> tuple[list[int], RoutingStats]:
+    """
+    Routes a chunk of keys in a worker process of a :class:`ParallelRouter`.
+    :param task: The keys and the position of the node to start routing from.
+    :return: The ID of the responsible node of each key and the routing statistics of the chunk.
+    """
+    keys, start = task
+    snapshot, hasher = _worker_state
+    stats = RoutingStats()
+    positions = snapshot.route_many(np.fromiter(map(hasher.hash, keys), dtype=np.uint64, count=len(keys)), start, stats)
+
+    return snapshot.node_ids[positions].tolist(), stats
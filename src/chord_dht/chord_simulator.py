@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import random
+from typing import Iterable, Optional
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_stabilizer import Stabilizer
+from src.chord_dht.chord_stats import RoutingStats
+
+EVENTS = ("join", "leave", "crash", "lookup")
+"""The events that can be generated at a rate or replayed from a workload."""
+
+
+class SimulationReport:
+    """
+    The results of a churn simulation.
+    :cvar duration: The simulated time covered so far.
+    :cvar events: The number of events processed so far.
+    :cvar joins: The number of nodes that joined the ring.
+    :cvar leaves: The number of nodes that left the ring.
+    :cvar crashes: The number of nodes that crashed.
+    :cvar lookups: The number of lookups run.
+    :cvar successes: The number of lookups that returned the inserted values.
+    :cvar routing: The routing statistics of the lookups, including the hop distribution.
+    :cvar key_load: The number of keys stored by each node, sampled over simulated time.
+    :cvar lookup_load: The number of lookups resolved by each node since the previous sample, sampled over simulated
+        time.
+    """
+    duration: float
+    events: int
+    joins: int
+    leaves: int
+    crashes: int
+    lookups: int
+    successes: int
+    routing: RoutingStats
+    key_load: list[tuple[float, dict[int, int]]]
+    lookup_load: list[tuple[float, dict[int, int]]]
+
+    def __init__(self):
+        """
+        Initializes an empty simulation report.
+        """
+        self.duration = 0.0
+        self.events = 0
+        self.joins = 0
+        self.leaves = 0
+        self.crashes = 0
+        self.lookups = 0
+        self.successes = 0
+        self.routing = RoutingStats()
+        self.key_load = []
+        self.lookup_load = []
+
+    def __str__(self) -> str:
+        """
+        A string representation of the simulation report.
+        :return: A string representation of the simulation report.
+        """
+        return (f"Time: {self.duration:.2f} Events: {self.events} Joins: {self.joins} Leaves: {self.leaves} "
+                f"Crashes: {self.crashes} Lookups: {self.lookups} Success rate: {self.success_rate:.4f} "
+                f"Mean hops: {self.routing.mean_hops:.2f}")
+
+    @property
+    def success_rate(self) -> float:
+        """
+        The fraction of lookups that returned the inserted values.
+        :return: The success rate, or 1 if no lookup was run.
+        """
+        return self.successes / self.lookups if self.lookups else 1.0
+
+
+class ChordSimulator:
+    """
+    A discrete-event simulator of a Chord ring under churn. Joins, leaves, crashes and lookups arrive as independent
+    Poisson processes, and the stabilization protocol runs at a fixed interval; all events are processed in order of
+    simulated time from a priority queue. Events can also be scheduled explicitly, to replay a recorded workload.
+    Nodes join and leave lazily, so the ring only repairs itself through stabilization.
+    :cvar chord: The simulated Chord ring.
+    :cvar keys: The keys inserted into the ring, each stored with itself as value.
+    :cvar rates: The mean number of events per unit of simulated time, per event.
+    :cvar stabilize_interval: The simulated time between rounds of the stabilization protocol, if any.
+    :cvar sample_interval: The simulated time between samples of the per-node load, if any.
+    :cvar stabilizer: The stabilizer running the stabilization rounds.
+    :cvar now: The current simulated time.
+    :cvar report: The results of the simulation so far.
+    """
+    chord: Chord
+    keys: list[str]
+    rates: dict[str, float]
+    stabilize_interval: Optional[float]
+    sample_interval: Optional[float]
+    stabilizer: Stabilizer
+    now: float
+    report: SimulationReport
+
+    def __init__(self, chord: Chord, keys: Iterable[str], join_rate: float = 0.0, leave_rate: float = 0.0,
+                 crash_rate: float = 0.0, lookup_rate: float = 0.0, stabilize_interval: Optional[float] = 1.0,
+                 sample_interval: Optional[float] = None, fingers_per_tick: int = 1, seed: int = 0):
+        """
+        Initializes a simulator and inserts the keys into the ring.
+        :param chord: The Chord ring to simulate, with at least one node.
+        :param keys: The keys to insert and lookup.
+        :param join_rate: The mean number of joins per unit of simulated time.
+        :param leave_rate: The mean number of leaves per unit of simulated time.
+        :param crash_rate: The mean number of crashes per unit of simulated time.
+        :param lookup_rate: The mean number of lookups per unit of simulated time.
+        :param stabilize_interval: The simulated time between rounds of the stabilization protocol, if any.
+        :param sample_interval: The simulated time between samples of the per-node load, if any.
+        :param fingers_per_tick: The number of fingers each node refreshes per stabilization round.
+        :param seed: The seed of the random event times, node IDs and keys.
+        :raises ValueError: If the ring is empty, if a rate is negative or if an interval is not positive.
+        """
+        if not chord.nodes:
+            raise ValueError("Cannot simulate an empty Chord ring.")
+
+        self.rates = {"join": join_rate, "leave": leave_rate, "crash": crash_rate, "lookup": lookup_rate}
+
+        if any(rate < 0 for rate in self.rates.values()):
+            raise ValueError("Event rates must be non-negative.")
+        if any(interval is not None and interval <= 0 for interval in (stabilize_interval, sample_interval)):
+            raise ValueError("Intervals must be positive.")
+
+        self.chord = chord
+        self.keys = list(keys)
+        self.stabilize_interval = stabilize_interval
+        self.sample_interval = sample_interval
+        self.stabilizer = Stabilizer(chord, fingers_per_tick)
+        self.now = 0.0
+        self.report = SimulationReport()
+        self._random = random.Random(seed)
+        self._queue: list[tuple[float, int, str, object]] = []
+        self._sequence = itertools.count()
+        self._window: dict[int, int] = {}
+        self._handlers = {
+            "join": self._join, "leave": self._leave, "crash": self._crash, "lookup": self._lookup,
+            "stabilize": self._stabilize, "sample": self._sample
+        }
+
+        chord.insert_many((key, key) for key in self.keys)
+
+        for event in EVENTS:
+            self._schedule_next(event)
+        if stabilize_interval is not None:
+            self.schedule(stabilize_interval, "stabilize")
+        if sample_interval is not None:
+            self.schedule(0.0, "sample")
+
+    def schedule(self, time: float, event: str, arg: Optional[object] = None) -> None:
+        """
+        Schedules an event, e.g. to replay a recorded workload next to the generated one.
+        :param time: The simulated time of the event.
+        :param event: The event, one of :data:`EVENTS`.
+        :param arg: The node ID to join, leave or crash, or the key to lookup; chosen at random if not given.
+        :raises ValueError: If the event is unknown or the time is in the past.
+        """
+        if event not in self._handlers:
+            raise ValueError(f"Unknown event {event}.")
+        if time < self.now:
+            raise ValueError("Cannot schedule an event in the past.")
+
+        heapq.heappush(self._queue, (time, next(self._sequence), event, arg))
+
+    def run(self, duration: float) -> SimulationReport:
+        """
+        Processes the events of a span of simulated time.
+        :param duration: The simulated time to run for.
+        :return: The results of the simulation so far.
+        """
+        end = self.now + duration
+        queue = self._queue
+        handlers = self._handlers
+        pop = heapq.heappop
+        events = 0
+
+        while queue and queue[0][0] <= end:
+            self.now, _, event, arg = pop(queue)
+            handlers[event](arg)
+            events += 1
+
+        self.now = end
+        self.report.duration = end
+        self.report.events += events
+
+        logging.info(f"Simulated {events} events up to time {end}.")
+
+        return self.report
+
+    def _schedule_next(self, event: str) -> None:
+        """
+        Schedules the next arrival of a Poisson process.
+        :param event: The event of the process.
+        """
+        rate = self.rates[event]
+
+        if rate > 0:
+            heapq.heappush(self._queue, (self.now + self._random.expovariate(rate), next(self._sequence), event, None))
+
+    def _join(self, node_id: Optional[int]) -> None:
+        """
+        Lazily joins a node to the ring.
+        :param node_id: The ID of the node, or ``None`` to join a random free ID and schedule the next join.
+        """
+        if node_id is None:
+            self._schedule_next("join")
+            if len(self.chord) + self.chord.virtual_nodes > 2 ** self.chord.m:
+                return
+            node_id = self._random.randrange(2 ** self.chord.m)
+            while node_id in self.chord.nodes:
+                node_id = self._random.randrange(2 ** self.chord.m)
+
+        self.chord.join(node_id, lazy=True)
+        self.report.joins += 1
+
+    def _leave(self, node_id: Optional[int]) -> None:
+        """
+        Lazily removes a node from the ring, keeping at least one node.
+        :param node_id: The ID of the node, or ``None`` to remove a random node and schedule the next leave.
+        """
+        if node_id is None:
+            self._schedule_next("leave")
+            if len(self.chord) == self.chord.virtual_nodes:
+                return
+            node_id = self.chord.nodes[self._random.choice(self.chord.node_ids)].owner
+
+        self.chord.leave(node_id, lazy=True)
+        self.report.leaves += 1
+
+    def _crash(self, node_id: Optional[int]) -> None:
+        """
+        Crashes a node of the ring, keeping at least one node.
+        :param node_id: The ID of the node, or ``None`` to crash a random node and schedule the next crash.
+        """
+        if node_id is None:
+            self._schedule_next("crash")
+            if len(self.chord) == self.chord.virtual_nodes:
+                return
+            node_id = self.chord.nodes[self._random.choice(self.chord.node_ids)].owner
+
+        self.chord.crash(node_id)
+        self.report.crashes += 1
+
+    def _lookup(self, key: Optional[str]) -> None:
+        """
+        Looks up a key from a random node of the ring, recording the route and whether the inserted value was found.
+        :param key: The key to lookup, or ``None`` to lookup a random key and schedule the next lookup.
+        """
+        if key is None:
+            self._schedule_next("lookup")
+            if not self.keys:
+                return
+            key = self._random.choice(self.keys)
+
+        report = self.report
+        entry = self.chord.nodes[self._random.choice(self.chord.node_ids)]
+        values = entry.lookup(key, report.routing)
+        node_id = report.routing.last_path[-1]
+
+        report.lookups += 1
+        if values == [key]:
+            report.successes += 1
+        self._window[node_id] = self._window.get(node_id, 0) + 1
+
+    def _stabilize(self, _: Optional[object]) -> None:
+        """
+        Runs a round of the stabilization protocol and schedules the next one.
+        """
+        self.stabilizer.tick()
+        self.schedule(self.now + self.stabilize_interval, "stabilize")
+
+    def _sample(self, _: Optional[object]) -> None:
+        """
+        Samples the per-node load and schedules the next sample.
+        """
+        self.report.key_load.append((self.now, {node.id: len(node.data) for node in self.chord.nodes.values()}))
+        self.report.lookup_load.append((self.now, self._window))
+        self._window = {}
+        self.schedule(self.now + self.sample_interval, "sample")
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Optional
+from src.chord_dht.chord import Chord
+
+
+class Stabilizer:
+    """
+    Drives the stabilization protocol of a Chord ring in discrete ticks. On every tick, each node runs
+    :meth:`ChordNode.check_predecessor`, :meth:`ChordNode.stabilize` and a number of :meth:`ChordNode.fix_fingers`.
+    :cvar chord: The Chord ring to stabilize.
+    :cvar fingers_per_tick: The number of fingers each node refreshes per tick.
+    :cvar ticks: The number of ticks run so far.
+    :cvar convergence_ticks: The number of ticks the last call to :meth:`run_until_stable` took to converge.
+    :cvar convergence_seconds: The wall-clock time the last call to :meth:`run_until_stable` took to converge.
+    """
+    chord: Chord
+    fingers_per_tick: int
+    ticks: int
+    convergence_ticks: Optional[int]
+    convergence_seconds: Optional[float]
+
+    def __init__(self, chord: Chord, fingers_per_tick: int = 1):
+        """
+        Initializes a stabilizer.
+        :param chord: The Chord ring to stabilize.
+        :param fingers_per_tick: The number of fingers each node refreshes per tick.
+        """
+        self.chord = chord
+        self.fingers_per_tick = fingers_per_tick
+        self.ticks = 0
+        self.convergence_ticks = None
+        self.convergence_seconds = None
+
+    def tick(self) -> None:
+        """
+        Runs one round of the stabilization protocol on every node in the ring.
+        """
+        bootstrap = self.chord.bootstrap_node
+
+        for node in self.chord.nodes_in_order:
+            node.check_predecessor()
+            node.stabilize(bootstrap)
+            for _ in range(self.fingers_per_tick):
+                node.fix_fingers()
+
+        self.ticks += 1
+
+    def run(self, ticks: int) -> None:
+        """
+        Runs a number of rounds of the stabilization protocol.
+        :param ticks: The number of rounds to run.
+        """
+        for _ in range(ticks):
+            self.tick()
+
+    def run_until_stable(self, max_ticks: int = 1000) -> int:
+        """
+        Runs rounds of the stabilization protocol until every successor, predecessor and finger is correct, e.g. to
+        measure the convergence time after a burst of churn.
+        :param max_ticks: The maximum number of rounds to run.
+        :return: The number of rounds it took to converge.
+        :raises RuntimeError: If the ring has not converged within the maximum number of rounds.
+        """
+        start = time.perf_counter()
+        ticks = 0
+
+        while not self.is_stable():
+            if ticks == max_ticks:
+                raise RuntimeError(f"Ring did not stabilize within {max_ticks} ticks.")
+            self.tick()
+            ticks += 1
+
+        self.convergence_ticks = ticks
+        self.convergence_seconds = time.perf_counter() - start
+
+        logging.info(f"Ring stabilized after {ticks} ticks.")
+
+        return ticks
+
+    def is_stable(self) -> bool:
+        """
+        Checks whether every successor, predecessor and finger in the ring is correct, and every key is stored by the
+        node responsible for it.
+        :return: ``True`` if the ring has converged, ``False`` otherwise.
+        """
+        nodes = self.chord.nodes_in_order
+        size = 2 ** self.chord.m
+
+        for position, node in enumerate(nodes):
+            if node.successor is not nodes[(position + 1) % len(nodes)]:
+                return False
+            if node.predecessor is not nodes[position - 1]:
+                return False
+            if node._count_outside(node.predecessor.id):
+                return False
+            for i, finger in enumerate(node.fingers):
+                if finger is not self.chord.successor_of((node.id + 2 ** i) % size):
+                    return False
+
+        return True
+
+
+class TimerStabilizer(Stabilizer):
+    """
+    Drives the stabilization protocol of a live Chord ring, running a tick at a fixed interval on the asyncio event
+    loop. Ticks run between other tasks of the loop, so they never interleave with ring operations.
+    :cvar interval: The time between ticks in seconds.
+    """
+    interval: float
+
+    def __init__(self, chord: Chord, interval: float, fingers_per_tick: int = 1):
+        """
+        Initializes a timer-based stabilizer.
+        :param chord: The Chord ring to stabilize.
+        :param interval: The time between ticks in seconds.
+        :param fingers_per_tick: The number of fingers each node refreshes per tick.
+        """
+        super().__init__(chord, fingers_per_tick)
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """
+        Starts running ticks in the background of the running event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_periodically())
+
+    async def stop(self) -> None:
+        """
+        Stops running ticks.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_periodically(self) -> None:
+        """
+        Runs a tick at every interval, until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            self.tick()
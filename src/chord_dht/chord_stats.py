@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+
+class RoutingStats:
+    """
+    Routing statistics collected over one or more Chord operations.
+    :cvar count: The number of routed operations.
+    :cvar total_hops: The total number of hops over all routed operations.
+    :cvar max_hops: The largest number of hops taken by a single routed operation.
+    :cvar hop_histogram: The number of routed operations for each hop count.
+    :cvar last_path: The IDs of the nodes visited by the last routed operation, starting from the entry node.
+    """
+    count: int
+    total_hops: int
+    max_hops: int
+    hop_histogram: dict[int, int]
+    last_path: list[int]
+
+    def __init__(self):
+        """
+        Initializes empty routing statistics.
+        """
+        self.count = 0
+        self.total_hops = 0
+        self.max_hops = 0
+        self.hop_histogram = {}
+        self.last_path = []
+
+    def __str__(self) -> str:
+        """
+        A string representation of the routing statistics.
+        :return: A string representation of the routing statistics.
+        """
+        return f"Routed: {self.count} Mean hops: {self.mean_hops:.2f} Max hops: {self.max_hops}"
+
+    @property
+    def last_hops(self) -> int:
+        """
+        The number of hops taken by the last routed operation.
+        :return: The number of hops of the last path, or 0 if nothing was routed.
+        """
+        return max(len(self.last_path) - 1, 0)
+
+    @property
+    def mean_hops(self) -> float:
+        """
+        The mean number of hops per routed operation.
+        :return: The mean number of hops, or 0 if nothing was routed.
+        """
+        return self.total_hops / self.count if self.count else 0.0
+
+    def record(self, path: list[int]) -> None:
+        """
+        Records the path of a routed operation.
+        :param path: The IDs of the visited nodes, starting from the entry node and ending at the responsible node.
+        """
+        hops = len(path) - 1
+
+        self.count += 1
+        self.total_hops += hops
+        self.max_hops = max(self.max_hops, hops)
+        self.hop_histogram[hops] = self.hop_histogram.get(hops, 0) + 1
+        self.last_path = path
+
+    def merge(self, other: RoutingStats) -> None:
+        """
+        Adds the routing statistics collected elsewhere, e.g. by another process, to these statistics.
+        :param other: The routing statistics to add.
+        """
+        if other.count:
+            self.record_histogram(other.hop_histogram, other.last_path)
+
+    def record_histogram(self, hop_histogram: dict[int, int], last_path: list[int]) -> None:
+        """
+        Records many routed operations at once by their hop counts, e.g. when they were routed in bulk.
+        :param hop_histogram: The number of routed operations for each hop count.
+        :param last_path: The IDs of the nodes visited by the last of the routed operations.
+        """
+        for hops, count in hop_histogram.items():
+            self.count += count
+            self.total_hops += hops * count
+            self.max_hops = max(self.max_hops, hops)
+            self.hop_histogram[hops] = self.hop_histogram.get(hops, 0) + count
+        self.last_path = last_path
+
+
+class LoadReport:
+    """
+    How evenly the keys of a Chord ring are spread over its nodes.
+    :cvar keys: The number of keys stored by each node, by node ID.
+    :cvar mean: The mean number of keys per node.
+    :cvar max: The largest number of keys stored by a single node.
+    :cvar gini: The Gini coefficient of the number of keys per node, from 0 for a perfectly even spread to almost 1 when
+        a single node stores every key.
+    """
+    keys: dict[int, int]
+    mean: float
+    max: int
+    gini: float
+
+    def __init__(self, keys: dict[int, int]):
+        """
+        Initializes a load report.
+        :param keys: The number of keys stored by each node, by node ID.
+        """
+        counts = sorted(keys.values())
+        total = sum(counts)
+
+        self.keys = keys
+        self.mean = total / len(counts) if counts else 0.0
+        self.max = counts[-1] if counts else 0
+        self.gini = (2 * sum(rank * count for rank, count in enumerate(counts, 1)) / (len(counts) * total)
+                     - (len(counts) + 1) / len(counts)) if total else 0.0
+
+    def __str__(self) -> str:
+        """
+        A string representation of the load report.
+        :return: A string representation of the load report.
+        """
+        return f"Nodes: {len(self.keys)} Mean keys: {self.mean:.2f} Max/mean: {self.imbalance:.2f} Gini: {self.gini:.3f}"
+
+    @property
+    def imbalance(self) -> float:
+        """
+        The ratio of the largest to the mean number of keys per node.
+        :return: The max/mean ratio, or 0 if no keys are stored.
+        """
+        return self.max / self.mean if self.mean else 0.0
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import struct
+from abc import ABC, abstractmethod
+from typing import Callable
+
+Handler = Callable[[str, dict], object]
+"""A request handler, called with the operation name and its arguments, returning a JSON-serializable result."""
+
+
+class ChordTransportError(Exception):
+    """
+    An error raised when a request cannot be delivered, or when its handler fails on the remote node.
+    """
+
+
+class Transport(ABC):
+    """
+    A message transport between Chord nodes. Nodes serve requests at an address, and send requests to the addresses
+    of other nodes. Handlers are plain functions, so every request is handled atomically by the receiving node.
+    """
+
+    @abstractmethod
+    async def serve(self, address: str, handler: Handler) -> None:
+        """
+        Starts serving requests at an address.
+        :param address: The address to serve at.
+        :param handler: The handler of the requests.
+        """
+
+    @abstractmethod
+    async def unserve(self, address: str) -> None:
+        """
+        Stops serving requests at an address.
+        :param address: The address to stop serving at.
+        """
+
+    @abstractmethod
+    async def request(self, address: str, op: str, args: dict) -> object:
+        """
+        Sends a request to an address and waits for its result.
+        :param address: The address of the receiving node.
+        :param op: The name of the requested operation.
+        :param args: The arguments of the operation.
+        :return: The result of the operation.
+        :raises ChordTransportError: If the request cannot be delivered or its handler fails.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Stops serving at all addresses and closes all connections.
+        """
+
+
+class InProcessTransport(Transport):
+    """
+    A transport between nodes running in the same event loop. Every served address has a request queue that is
+    drained by a worker task, and an optional latency models the network delay of each request.
+    :cvar latency: The delay of each request in seconds.
+    """
+    latency: float
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initializes an in-process transport.
+        :param latency: The delay of each request in seconds.
+        """
+        self.latency = latency
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    async def serve(self, address: str, handler: Handler) -> None:
+        """
+        Starts serving requests at an address, with a queue and a worker task handling its requests in order.
+        :param address: The address to serve at.
+        :param handler: The handler of the requests.
+        :raises ChordTransportError: If the address is already served.
+        """
+        if address in self._queues:
+            raise ChordTransportError(f"Address {address} already in use.")
+
+        queue = asyncio.Queue()
+        self._queues[address] = queue
+        self._workers[address] = asyncio.create_task(self._work(queue, handler))
+
+    async def unserve(self, address: str) -> None:
+        """
+        Stops serving requests at an address, cancelling its worker task and failing the requests still queued.
+        :param address: The address to stop serving at.
+        """
+        queue = self._queues.pop(address, None)
+        worker = self._workers.pop(address, None)
+
+        if worker is not None:
+            worker.cancel()
+
+        while queue is not None and not queue.empty():
+            _, _, future = queue.get_nowait()
+            if not future.done():
+                future.set_exception(ChordTransportError(f"No node at address {address}."))
+
+    async def request(self, address: str, op: str, args: dict) -> object:
+        """
+        Queues a request at an address after the latency of the transport, and waits for its result.
+        :param address: The address of the receiving node.
+        :param op: The name of the requested operation.
+        :param args: The arguments of the operation.
+        :return: The result of the operation.
+        :raises ChordTransportError: If no node serves the address or the handler fails.
+        """
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if address not in self._queues:
+            raise ChordTransportError(f"No node at address {address}.")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queues[address].put((op, args, future))
+
+        return await future
+
+    async def close(self) -> None:
+        """
+        Stops serving at all addresses.
+        """
+        for address in list(self._queues):
+            await self.unserve(address)
+
+    @staticmethod
+    async def _work(queue: asyncio.Queue, handler: Handler) -> None:
+        """
+        Handles the requests of a queue, one at a time, skipping the requests cancelled while queued.
+        :param queue: The queue of ``(op, args, future)`` requests.
+        :param handler: The handler of the requests.
+        """
+        while True:
+            op, args, future = await queue.get()
+            if future.done():
+                continue
+            try:
+                future.set_result(handler(op, args))
+            except Exception as error:
+                future.set_exception(ChordTransportError(f"{op} failed: {error}"))
+
+
+class _Connection:
+    """
+    A pipelined client connection. Requests are tagged with an ID and written without waiting for earlier replies, and
+    a reader task resolves the pending requests as their replies arrive.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Initializes a pipelined connection and starts reading its replies.
+        :param reader: The reader of the connection.
+        :param writer: The writer of the connection.
+        """
+        self.writer = writer
+        self.pending: dict[int, asyncio.Future] = {}
+        self.ids = itertools.count()
+        self.reader_task = asyncio.create_task(self._read(reader))
+
+    async def request(self, op: str, args: dict) -> object:
+        """
+        Sends a request over the connection and waits for its reply.
+        :param op: The name of the requested operation.
+        :param args: The arguments of the operation.
+        :return: The result of the operation.
+        """
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+
+        write_frame(self.writer, {"id": request_id, "op": op, "args": args})
+        await self.writer.drain()
+
+        return await future
+
+    async def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        self.reader_task.cancel()
+        self.writer.close()
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        """
+        Resolves the pending requests as their replies arrive, failing all of them if the connection is lost. The
+        replies to cancelled requests are dropped.
+        :param reader: The reader of the connection.
+        """
+        try:
+            while True:
+                reply = await read_frame(reader)
+                future = self.pending.pop(reply["id"])
+                if future.done():
+                    continue
+                if "error" in reply:
+                    future.set_exception(ChordTransportError(reply["error"]))
+                else:
+                    future.set_result(reply["result"])
+        except (asyncio.IncompleteReadError, ConnectionError) as error:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ChordTransportError(f"Connection lost: {error}"))
+            self.pending.clear()
+
+
+class StreamTransport(Transport):
+    """
+    A transport over stream sockets, exchanging length-prefixed JSON messages. Connections to each address are pooled
+    and pipelined, so concurrent requests share a few long-lived connections.
+    :cvar pool_size: The maximum number of connections to each address.
+    """
+    pool_size: int
+
+    def __init__(self, pool_size: int = 1):
+        """
+        Initializes a stream transport.
+        :param pool_size: The maximum number of connections to each address.
+        """
+        self.pool_size = pool_size
+        self._servers: dict[str, asyncio.AbstractServer] = {}
+        self._pools: dict[str, list[_Connection]] = {}
+        self._turns: dict[str, itertools.count] = {}
+        self._lock = asyncio.Lock()
+
+    async def serve(self, address: str, handler: Handler) -> None:
+        """
+        Starts a stream server at an address, replying to the requests of each connection in order.
+        :param address: The address to serve at.
+        :param handler: The handler of the requests.
+        :raises ChordTransportError: If the address is already served.
+        """
+        if address in self._servers:
+            raise ChordTransportError(f"Address {address} already in use.")
+
+        async def on_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            """
+            Handles the requests of a connection until it is closed.
+            :param reader: The reader of the connection.
+            :param writer: The writer of the connection.
+            """
+            try:
+                while True:
+                    message = await read_frame(reader)
+                    try:
+                        reply = {"id": message["id"], "result": handler(message["op"], message["args"])}
+                    except Exception as error:
+                        reply = {"id": message["id"], "error": f"{message['op']} failed: {error}"}
+                    write_frame(writer, reply)
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        self._servers[address] = await self._listen(address, on_connection)
+
+    async def unserve(self, address: str) -> None:
+        """
+        Stops the stream server at an address.
+        :param address: The address to stop serving at.
+        """
+        server = self._servers.pop(address, None)
+
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def request(self, address: str, op: str, args: dict) -> object:
+        """
+        Sends a request over a pooled connection to an address and waits for its result.
+        :param address: The address of the receiving node.
+        :param op: The name of the requested operation.
+        :param args: The arguments of the operation.
+        :return: The result of the operation.
+        :raises ChordTransportError: If the connection cannot be opened or is lost, or the handler fails.
+        """
+        connection = await self._connection(address)
+
+        return await connection.request(op, args)
+
+    async def close(self) -> None:
+        """
+        Closes all pooled connections and stops all stream servers.
+        """
+        for pool in self._pools.values():
+            for connection in pool:
+                await connection.close()
+
+        self._pools.clear()
+
+        for address in list(self._servers):
+            await self.unserve(address)
+
+    async def _connection(self, address: str) -> _Connection:
+        """
+        Picks a pooled connection to an address, opening a new one while the pool is not full.
+        :param address: The address to connect to.
+        :return: The connection.
+        :raises ChordTransportError: If the connection cannot be opened.
+        """
+        async with self._lock:
+            pool = self._pools.setdefault(address, [])
+            pool[:] = [connection for connection in pool if not connection.reader_task.done()]
+
+            if len(pool) < self.pool_size:
+                try:
+                    pool.append(_Connection(*await self._open(address)))
+                except OSError as error:
+                    raise ChordTransportError(f"Cannot connect to {address}: {error}") from error
+
+            turn = self._turns.setdefault(address, itertools.count())
+
+            return pool[next(turn) % len(pool)]
+
+    @abstractmethod
+    async def _open(self, address: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Opens a stream connection to an address.
+        :param address: The address to connect to.
+        :return: The reader and writer of the connection.
+        """
+
+    @abstractmethod
+    async def _listen(self, address: str, callback: Callable) -> asyncio.AbstractServer:
+        """
+        Starts a stream server at an address.
+        :param address: The address to listen at.
+        :param callback: The callback of new connections.
+        :return: The server.
+        """
+
+
+class TcpTransport(StreamTransport):
+    """
+    A stream transport over TCP, with ``host:port`` addresses.
+    """
+
+    async def _open(self, address: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Opens a TCP connection to an address.
+        :param address: The ``host:port`` address to connect to.
+        :return: The reader and writer of the connection.
+        """
+        host, port = address.rsplit(":", 1)
+        return await asyncio.open_connection(host, int(port))
+
+    async def _listen(self, address: str, callback: Callable) -> asyncio.AbstractServer:
+        """
+        Starts a TCP server at an address.
+        :param address: The ``host:port`` address to listen at.
+        :param callback: The callback of new connections.
+        :return: The server.
+        """
+        host, port = address.rsplit(":", 1)
+        return await asyncio.start_server(callback, host, int(port))
+
+
+class UnixTransport(StreamTransport):
+    """
+    A stream transport over Unix domain sockets, with socket file paths as addresses.
+    """
+
+    async def _open(self, address: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Opens a Unix domain socket connection to an address.
+        :param address: The path of the socket file to connect to.
+        :return: The reader and writer of the connection.
+        """
+        return await asyncio.open_unix_connection(address)
+
+    async def _listen(self, address: str, callback: Callable) -> asyncio.AbstractServer:
+        """
+        Starts a Unix domain socket server at an address.
+        :param address: The path of the socket file to listen at.
+        :param callback: The callback of new connections.
+        :return: The server.
+        """
+        return await asyncio.start_unix_server(callback, address)
+
+
+def write_frame(writer: asyncio.StreamWriter, message: dict) -> None:
+    """
+    Writes a message to a stream as JSON, prefixed by its length.
+    :param writer: The stream to write to.
+    :param message: The message to write.
+    """
+    payload = json.dumps(message).encode()
+    writer.write(struct.pack(">I", len(payload)) + payload)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict:
+    """
+    Reads a length-prefixed JSON message from a stream.
+    :param reader: The stream to read from.
+    :return: The message.
+    :raises asyncio.IncompleteReadError: If the stream ends before a whole message is read.
+    """
+    (length,) = struct.unpack(">I", await reader.readexactly(4))
+    return json.loads(await reader.readexactly(length))
@@ -1,18 +1,86 @@
 import hashlib
+import zlib
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import repeat
+from operator import add, and_, mod
+from typing import Callable, Sequence, Union
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def hash_id(key: str, m: int) -> int:
+HASH_FUNCTIONS: dict[str, Callable[[bytes], int]] = {
+    "sha1": lambda data: int.from_bytes(hashlib.sha1(data).digest(), "big"),
+    "md5": lambda data: int.from_bytes(hashlib.md5(data).digest(), "big"),
+    "blake2b": lambda data: int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big"),
+    "crc32": zlib.crc32,
+}
+"""
+The available hash functions, mapping raw bytes to an integer. ``sha1`` is the default of the Chord protocol, while the
+others are faster alternatives for simulations (``blake2b`` covers up to 64 bits and ``crc32`` up to 32 bits).
+"""
+
+ValueFilter = Union[Callable[[object], bool], tuple[object, object]]
+"""
+A filter on the values stored with a key: either a predicate, or an inclusive ``(low, high)`` range over the indexed
+value field of the Chord ring.
+"""
+
+
+class KeyHasher:
+    """
+    Hashes keys to IDs in a Chord ring of a fixed size.
+    :cvar m: The number of bits in the hash space.
+    :cvar mask: The bit mask that reduces a digest to the hash space.
+    :cvar hash_function: The name of the hash function.
+    :cvar cache_size: The maximum number of cached key IDs, or 0 if caching is disabled.
+    """
+    m: int
+    mask: int
+    hash_function: str
+    cache_size: int
+
+    def __init__(self, m: int, hash_function: str = "sha1", cache_size: int = 0):
+        """
+        Initializes a key hasher.
+        :param m: The number of bits in the hash space.
+        :param hash_function: The name of the hash function, one of :data:`HASH_FUNCTIONS`.
+        :param cache_size: The maximum number of key IDs to keep in an LRU cache, or 0 to disable caching.
+        :raises ValueError: If the hash function is unknown.
+        """
+        if hash_function not in HASH_FUNCTIONS:
+            raise ValueError(f"Unknown hash function {hash_function}.")
+
+        self.m = m
+        self.mask = (1 << m) - 1
+        self.hash_function = hash_function
+        self.cache_size = cache_size
+        self._digest = HASH_FUNCTIONS[hash_function]
+
+        if cache_size > 0:
+            self.hash = lru_cache(maxsize=cache_size)(self.hash)
+
+    def hash(self, key: str) -> int:
+        """
+        Hashes a key to an ID in the Chord ring.
+        :param key: The key to hash.
+        :return: The hashed ID of the key.
+        """
+        return self._digest(key.encode()) & self.mask
+
+
+def hash_id(key: str, m: int, hash_function: str = "sha1") -> int:
     """
     Hashes a key to an ID in the Chord ring.
     :param key: The key to hash.
     :param m: The number of bits in the hash space.
+    :param hash_function: The name of the hash function, one of :data:`HASH_FUNCTIONS`.
     :return: The hashed ID of the key.
     """
-    key = key.encode()
-    key = hashlib.sha1(key)
-    key = key.hexdigest()
-
-    return int(key, 16) % (2 ** m)
+    return HASH_FUNCTIONS[hash_function](key.encode()) & ((1 << m) - 1)
 
 
 def in_open_range(start: int, end: int, target_id: int) -> bool:
@@ -41,3 +109,62 @@ def in_right_closed_range(start: int, end: int, target_id: int) -> bool:
         return start < target_id <= end
     else:
         return target_id > start or target_id <= end
+
+
+def finger_positions(node_ids: Sequence[int], m: int, i: int) -> list[int]:
+    """
+    Computes the ``i``-th finger of every node in a ring, as positions in the sorted sequence of node IDs. The
+    successors of all finger starts ``id + 2^i`` are found with a single pass of binary searches.
+    :param node_ids: The IDs of the nodes in the ring, in ascending order.
+    :param m: The number of bits in the hash space.
+    :param i: The index of the finger.
+    :return: The position of the ``i``-th finger of the node at each position.
+    """
+    size = len(node_ids)
+    starts = map(and_, map(add, node_ids, repeat(2 ** i, size)), repeat((1 << m) - 1, size))
+    positions = map(bisect_left, repeat(node_ids, size), starts)
+
+    return list(map(mod, positions, repeat(size, size)))
+
+
+def finger_table(node_ids: Sequence[int], m: int) -> Sequence[Sequence[int]]:
+    """
+    Computes the finger tables of all nodes in a ring, as positions in the sorted sequence of node IDs. With NumPy,
+    the successors of the finger starts ``id + 2^i`` of all nodes are found by a single vectorized
+    :func:`numpy.searchsorted` per finger index; without NumPy, or for IDs wider than 64 bits, each column falls back
+    to :func:`finger_positions`.
+    :param node_ids: The IDs of the nodes in the ring, in ascending order.
+    :param m: The number of bits in the hash space.
+    :return: The ``i``-th finger of every node, for each finger index ``i``: the rows of an ``(m, N)`` NumPy array, or
+        a list of arrays without NumPy, of the :func:`position_typecode` of the ring.
+    """
+    typecode = position_typecode(len(node_ids))
+
+    if np is None or m > 64:
+        return [array(typecode, finger_positions(node_ids, m, i)) for i in range(m)]
+
+    # Unsigned 64-bit additions wrap around modulo 2^64, so the mask also reduces the starts of a 64-bit ring.
+    ids = np.asarray(node_ids, dtype=np.uint64)
+    mask = np.uint64((1 << m) - 1)
+    columns = np.empty((m, len(ids)), dtype=typecode)
+
+    for i in range(m):
+        positions = np.searchsorted(ids, (ids + np.uint64(1 << i)) & mask)
+        positions[positions == len(ids)] = 0
+        columns[i] = positions
+
+    return columns
+
+
+def position_typecode(size: int) -> str:
+    """
+    Chooses the smallest unsigned array typecode that can hold positions in a ring of a given size.
+    :param size: The number of nodes in the ring.
+    :return: The array typecode.
+    :raises ValueError: If the ring is too large for any typecode.
+    """
+    for typecode in ["B", "H", "I", "Q"]:
+        if size <= 2 ** (8 * array(typecode).itemsize):
+            return typecode
+
+    raise ValueError(f"Ring size {size} too large.")
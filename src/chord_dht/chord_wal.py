@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import struct
+import zlib
+from typing import Optional
+
+RECORD_HEADER = struct.Struct("<II")
+"""The header of a log record: the length and the CRC-32 checksum of the pickled record that follows it."""
+
+SNAPSHOT_HEADER = struct.Struct("<Q")
+"""The header of a log snapshot: the generation of the snapshot."""
+
+
+class WriteAheadLog:
+    """
+    An append-only log of the changes to the data of a Chord node, for recovering the data after a restart. Records
+    are buffered and synced to disk in groups, so a crash loses at most the last ``sync_every - 1`` records, and the
+    log is periodically compacted into a snapshot of the node's data. A torn record at the end of the log, left by a
+    crash in the middle of a write, is dropped on recovery.
+
+    Every compaction starts a new generation: the snapshot and the emptied log both record it, so a log left over by a
+    crash in the middle of a compaction is recognized as already included in the snapshot.
+    :cvar path: The path of the log file.
+    :cvar snapshot_path: The path of the snapshot the log is compacted into.
+    :cvar sync_every: The number of records written between syncs to disk.
+    :cvar compact_every: The number of records after which the log should be compacted, or 0 to never compact.
+    :cvar records: The number of records in the log since the last compaction.
+    :cvar pending: The number of records written since the last sync.
+    :cvar generation: The number of compactions of the log.
+    """
+    path: str
+    snapshot_path: str
+    sync_every: int
+    compact_every: int
+    records: int
+    pending: int
+    generation: int
+
+    def __init__(self, path: str, sync_every: int = 64, compact_every: int = 0):
+        """
+        Opens a write-ahead log, creating it if it does not exist.
+        :param path: The path of the log file.
+        :param sync_every: The number of records written between syncs to disk.
+        :param compact_every: The number of records after which the log should be compacted, or 0 to never compact.
+        :raises ValueError: If ``sync_every`` is not positive.
+        """
+        if sync_every < 1:
+            raise ValueError("Sync batch size must be positive.")
+
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self.records = 0
+        self.pending = 0
+        self.generation = 0
+        self._file = open(path, "ab")
+
+    @property
+    def needs_compaction(self) -> bool:
+        """
+        Whether the log has grown enough to be compacted.
+        :return: ``True`` if the log should be compacted, ``False`` otherwise.
+        """
+        return 0 < self.compact_every <= self.records
+
+    def append(self, record: tuple) -> None:
+        """
+        Appends a record to the log, syncing the log to disk once a full group of records is pending.
+        :param record: The record, a tuple of picklable values.
+        """
+        payload = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+
+        self._file.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self.records += 1
+        self.pending += 1
+
+        if self.pending >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        Writes the pending records to disk.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.pending = 0
+
+    def recover(self) -> tuple[Optional[bytes], list[tuple]]:
+        """
+        Reads the snapshot and the records of the log, dropping a torn record at the end of the log and the records
+        of a log that predates the snapshot.
+        :return: The snapshot, or ``None`` if the log was never compacted, and the records written after it.
+        """
+        self._file.flush()
+        snapshot = None
+        records = []
+
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as file:
+                snapshot = file.read()
+            self.generation, = SNAPSHOT_HEADER.unpack_from(snapshot)
+            snapshot = snapshot[SNAPSHOT_HEADER.size:]
+
+        with open(self.path, "rb") as file:
+            buffer = file.read()
+
+        offset = 0
+
+        while offset + RECORD_HEADER.size <= len(buffer):
+            length, checksum = RECORD_HEADER.unpack_from(buffer, offset)
+            payload = buffer[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+            records.append(pickle.loads(payload))
+            offset += RECORD_HEADER.size + length
+
+        if offset < len(buffer):
+            logging.info(f"Dropping {len(buffer) - offset} bytes of a torn record from {self.path}.")
+            self._file.truncate(offset)
+
+        generation = 0
+
+        if records and records[0][0] == "generation":
+            generation = records.pop(0)[1]
+
+        if generation != self.generation:
+            logging.info(f"Dropping {len(records)} records of {self.path} already in its snapshot.")
+            records = []
+            self._start_generation()
+
+        self.records = len(records)
+
+        return snapshot, records
+
+    def compact(self, snapshot: bytes) -> None:
+        """
+        Replaces the snapshot with a new one and empties the log. The snapshot is written to a temporary file first,
+        so a crash during compaction leaves either the old snapshot and log or the new snapshot.
+        :param snapshot: The serialized data of the node, including every change in the log.
+        """
+        temporary_path = f"{self.snapshot_path}.tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(SNAPSHOT_HEADER.pack(self.generation + 1))
+            file.write(snapshot)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, self.snapshot_path)
+        self.generation += 1
+        self._start_generation()
+
+        logging.info(f"Compacted {self.path} into a snapshot of {len(snapshot)} bytes.")
+
+    def _start_generation(self) -> None:
+        """
+        Empties the log and marks it as following the snapshot of the current generation.
+        """
+        self._file.truncate(0)
+        self.append(("generation", self.generation))
+        self.sync()
+        self.records = 0
+
+    def close(self) -> None:
+        """
+        Syncs and closes the log.
+        """
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def destroy(self) -> None:
+        """
+        Closes the log and deletes it, together with its snapshot.
+        """
+        self._file.close()
+
+        for path in [self.path, self.snapshot_path]:
+            if os.path.exists(path):
+                os.remove(path)
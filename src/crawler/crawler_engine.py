@@ -0,0 +1,247 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.crawler.page_cache import Checkpoint, PageCache
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+"""The HTTP statuses of responses that are retried."""
+
+
+class HostRateLimiter:
+    """
+    Limits the rate of requests sent to each host, spacing them out evenly across all threads.
+
+    :cvar min_interval: The minimum time between two requests to the same host, in seconds.
+    """
+    min_interval: float
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initializes a rate limiter.
+
+        :param requests_per_second: The maximum number of requests per second to each host.
+        :raises ValueError: If the rate is not positive.
+        """
+        if requests_per_second <= 0:
+            raise ValueError("The request rate must be positive.")
+
+        self.min_interval = 1 / requests_per_second
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """
+        Blocks until a request to the host of the given URL may be sent.
+
+        :param url: The URL about to be requested.
+        """
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Crawler:
+    """
+    Fetches pages concurrently from a pool of worker threads. Every worker keeps its own keep-alive session, so
+    connections to a host are reused across requests, and failed requests are retried with exponential backoff.
+
+    With a page cache, cached pages are revalidated with conditional requests and only downloaded again if they
+    changed. With a checkpoint as well, the pages completed by an interrupted crawl are served from the cache without
+    any request, so the crawl resumes where it stopped.
+
+    :cvar workers: The number of worker threads.
+    :cvar retries: The number of times a failed request is retried.
+    :cvar backoff: The delay before the first retry, in seconds, doubled on every further retry.
+    :cvar timeout: The timeout of a request, in seconds.
+    :cvar rate_limiter: The per-host rate limiter, or ``None`` if requests are not rate limited.
+    :cvar cache: The cache of the fetched pages, if any.
+    :cvar checkpoint: The checkpoint of the completed URLs, if any.
+    """
+    workers: int
+    retries: int
+    backoff: float
+    timeout: float
+    rate_limiter: Optional[HostRateLimiter]
+    cache: Optional[PageCache]
+    checkpoint: Optional[Checkpoint]
+
+    def __init__(self, workers: int = 8, requests_per_second: Optional[float] = None, retries: int = 3,
+                 backoff: float = 0.5, timeout: float = 30, cache: Optional[PageCache] = None,
+                 checkpoint: Optional[Checkpoint] = None):
+        """
+        Initializes a crawler.
+
+        :param workers: The number of worker threads.
+        :param requests_per_second: The maximum number of requests per second to each host, or ``None`` for no limit.
+        :param retries: The number of times a failed request is retried.
+        :param backoff: The delay before the first retry, in seconds, doubled on every further retry.
+        :param timeout: The timeout of a request, in seconds.
+        :param cache: The cache of the fetched pages, if any.
+        :param checkpoint: The checkpoint of the completed URLs, if any; requires a cache.
+        :raises ValueError: If the number of workers is not positive, or if a checkpoint is given without a cache.
+        """
+        if workers < 1:
+            raise ValueError("The number of workers must be positive.")
+        if checkpoint is not None and cache is None:
+            raise ValueError("A checkpoint requires a page cache.")
+
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rate_limiter = HostRateLimiter(requests_per_second) if requests_per_second else None
+        self.cache = cache
+        self.checkpoint = checkpoint
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Crawler":
+        """
+        Uses the crawler as a context manager.
+
+        :return: The crawler.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """
+        Closes the sessions of all workers.
+        """
+        self.close()
+
+    def fetch(self, url: str) -> bytes:
+        """
+        Fetches a page, retrying connection errors, timeouts and server errors. A cached page is revalidated, or
+        served without any request if the checkpoint lists it as completed.
+
+        :param url: The URL of the page.
+        :return: The content of the page.
+        :raises requests.RequestException: If the page could not be fetched after all retries.
+        """
+        cache = self.cache
+
+        if cache is None:
+            return self._request(url, {}).content
+
+        if self.checkpoint is not None and url in self.checkpoint and url in cache:
+            return cache.get(url)
+
+        response = self._request(url, cache.validators(url))
+
+        if response.status_code == 304:
+            content = cache.get(url)
+        else:
+            content = response.content
+            cache.put(url, content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+        if self.checkpoint is not None:
+            self.checkpoint.add(url)
+
+        return content
+
+    def crawl(self, urls: Iterable[str], buffer_size: Optional[int] = None) -> Iterator[tuple[str, Optional[bytes]]]:
+        """
+        Fetches many pages concurrently. At most ``buffer_size`` pages are fetched ahead of the consumer, so the URLs
+        are read lazily and a slow consumer holds back the crawl instead of accumulating pages in memory.
+
+        :param urls: The URLs of the pages.
+        :param buffer_size: The maximum number of pages fetched ahead of the consumer, twice the number of workers by
+            default.
+        :return: The URL and the content of every page, in the order of the URLs, with ``None`` as the content of the
+            pages that could not be fetched.
+        """
+        buffer_size = buffer_size or 2 * self.workers
+        pending: deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for url in urls:
+                if len(pending) >= buffer_size:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(self._try_fetch, url))
+
+            while pending:
+                yield pending.popleft().result()
+
+    def close(self):
+        """
+        Closes the sessions of all workers.
+        """
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+    def _request(self, url: str, headers: dict[str, str]) -> requests.Response:
+        """
+        Sends a GET request, retrying connection errors, timeouts and server errors.
+
+        :param url: The URL of the page.
+        :param headers: The headers of the request.
+        :return: The successful or not modified response.
+        :raises requests.RequestException: If the request failed after all retries.
+        """
+        session = self._session()
+
+        for attempt in range(self.retries + 1):
+            if self.rate_limiter:
+                self.rate_limiter.wait(url)
+
+            try:
+                response = session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                error = requests.HTTPError(f"{response.status_code} for url: {url}", response=response)
+            except (requests.ConnectionError, requests.Timeout) as exception:
+                error = exception
+
+            if attempt < self.retries:
+                time.sleep(self.backoff * 2 ** attempt)
+
+        raise error
+
+    def _try_fetch(self, url: str) -> tuple[str, Optional[bytes]]:
+        """
+        Fetches a page, logging instead of raising if it could not be fetched.
+
+        :param url: The URL of the page.
+        :return: The URL and the content of the page, or ``None`` if it could not be fetched.
+        """
+        try:
+            return url, self.fetch(url)
+        except requests.RequestException as exception:
+            logging.warning(f"Failed to fetch {url}: {exception}")
+            return url, None
+
+    def _session(self) -> requests.Session:
+        """
+        Gets the keep-alive session of the current worker thread, creating it on first use.
+
+        :return: The session of the current thread.
+        """
+        session = getattr(self._local, "session", None)
+
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers))
+            session.mount("https://", HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers))
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
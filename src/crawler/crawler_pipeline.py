@@ -0,0 +1,122 @@
+import csv
+import json
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from src.crawler.crawler_engine import Crawler
+from src.crawler.crawler_utilities import (display_progress_bar, exclude_degree_titles, exclude_references,
+                                           normalize_text, remove_text_in_parentheses)
+from src.crawler.infobox_parser import parse_page
+
+RAW_COLUMNS = ["name", "education", "alma_mater", "awards"]
+"""The columns of the raw output, as scraped from the infoboxes."""
+
+PP_COLUMNS = ["name", "education", "awards"]
+"""The columns of the preprocessed output."""
+
+
+def preprocess_record(record: list) -> list:
+    """
+    Cleans up a raw record: normalizes the name, drops degree titles and references from the lists, and merges the
+    alma mater into the education.
+
+    :param record: A raw record, with the values of :data:`RAW_COLUMNS`.
+    :return: A preprocessed record, with the values of :data:`PP_COLUMNS`.
+    """
+    name, education, alma_mater, awards = record
+
+    name = remove_text_in_parentheses(normalize_text(name))
+    education = exclude_references(exclude_degree_titles(education))
+    alma_mater = exclude_references(exclude_degree_titles(alma_mater))
+    awards = exclude_references(awards)
+
+    return [name, education + alma_mater, awards]
+
+
+def parse_pages(pages: Iterable[tuple[str, Optional[bytes]]], backend: Optional[str] = None) -> Iterator[list]:
+    """
+    The parse stage of the pipeline, skipping the pages that could not be fetched.
+
+    :param pages: The URL and the content of every page.
+    :param backend: The parser backend, or ``None`` for the fastest available one.
+    :return: The raw record of every page.
+    """
+    for _, content in pages:
+        if content is not None:
+            yield parse_page(content, backend)
+
+
+def preprocess_records(records: Iterable[list]) -> Iterator[tuple[list, list]]:
+    """
+    The preprocessing stage of the pipeline.
+
+    :param records: The raw records.
+    :return: Every raw record, with its preprocessed record.
+    """
+    for record in records:
+        yield record, preprocess_record(record)
+
+
+def write_records(records: Iterable[tuple[list, list]], raw_path: str, pp_path: str,
+                  total: Optional[int] = None) -> int:
+    """
+    The output stage of the pipeline, appending every record to the raw and preprocessed files as it arrives. A file
+    is written as JSON Lines, with native lists, if its path ends with ``.jsonl``, or as CSV otherwise, with the lists
+    in their Python representation, as pandas writes list columns.
+
+    :param records: Every raw record, with its preprocessed record.
+    :param raw_path: The path of the raw output file.
+    :param pp_path: The path of the preprocessed output file.
+    :param total: The expected number of records, to display the progress of, if any.
+    :return: The number of records written.
+    """
+    count = 0
+
+    with open(raw_path, "w", newline="", encoding="utf-8") as raw_file, \
+            open(pp_path, "w", newline="", encoding="utf-8") as pp_file:
+        write_raw = _record_writer(raw_file, raw_path, RAW_COLUMNS)
+        write_pp = _record_writer(pp_file, pp_path, PP_COLUMNS)
+
+        for raw, preprocessed in records:
+            write_raw(raw)
+            write_pp(preprocessed)
+            count += 1
+
+            if total:
+                display_progress_bar(count, total)
+
+    return count
+
+
+def run_pipeline(crawler: Crawler, urls: Iterable[str], raw_path: str, pp_path: str,
+                 total: Optional[int] = None, backend: Optional[str] = None) -> int:
+    """
+    Crawls the Wikipedia articles of computer scientists and writes their raw and preprocessed records in one pass.
+    The stages are chained generators, so only the pages fetched ahead by the crawler are held in memory.
+
+    :param crawler: The crawler fetching the articles.
+    :param urls: The URLs of the articles.
+    :param raw_path: The path of the raw CSV file.
+    :param pp_path: The path of the preprocessed CSV file.
+    :param total: The expected number of articles, to display the progress of, if any.
+    :param backend: The parser backend, or ``None`` for the fastest available one.
+    :return: The number of records written.
+    """
+    return write_records(preprocess_records(parse_pages(crawler.crawl(urls), backend)), raw_path, pp_path, total)
+
+
+def _record_writer(file: TextIO, path: str, columns: list[str]) -> Callable[[list], None]:
+    """
+    Starts writing records to an output file, in the format given by its extension.
+
+    :param file: The output file, opened for writing.
+    :param path: The path of the output file.
+    :param columns: The columns of the records.
+    :return: The function writing a record to the file.
+    """
+    if path.endswith(".jsonl"):
+        return lambda record: file.write(json.dumps(dict(zip(columns, record)), ensure_ascii=False) + "\n")
+
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow(columns)
+
+    return lambda record: writer.writerow([str(value) for value in record])
@@ -1,5 +1,23 @@
-import re
 import html
+import itertools
+import json
+import re
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+PARENTHESES_PATTERN = re.compile(r'\([^)]*\)')
+"""Text enclosed in parentheses."""
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+"""A run of whitespaces."""
+
+REFERENCE_PATTERN = re.compile(r'\[\d+]')
+"""A reference, e.g. '[1]', at the start of a string."""
+
+DEGREE_TITLES = frozenset({"bsc", "msc", "phd", "bs", "ms", "ba", "ma", "beng", "meng", "dphil", "sb", "sm", "scd"})
+"""Common degree titles, lowercase and without dots."""
 
 
 def display_progress_bar(current_iteration: int, total_iterations: int):
@@ -20,7 +38,7 @@ def remove_text_in_parentheses(text: str) -> str:
     :param text: The input string.
     :return: A string with text inside parentheses removed.
     """
-    return re.sub(r'\([^)]*\)', '', text).strip()
+    return PARENTHESES_PATTERN.sub('', text).strip()
 
 
 def normalize_text(text: str) -> str:
@@ -38,7 +56,7 @@ def normalize_text(text: str) -> str:
     text = text.replace("\xa0", " ")
 
     # Remove extra whitespaces
-    text = re.sub(r'\s+', " ", text).strip()
+    text = WHITESPACE_PATTERN.sub(" ", text).strip()
 
     return text
 
@@ -50,8 +68,7 @@ def exclude_degree_titles(education_list: list[str]) -> list[str]:
     :param education_list: A list of education entries.
     :return: A list with degree titles removed.
     """
-    degrees = {"bsc", "msc", "phd", "bs", "ms", "ba", "ma", "beng", "meng", "dphil", "sb", "sm", "scd"}
-    return [entry for entry in education_list if entry.replace(".", "").lower().strip() not in degrees]
+    return [entry for entry in education_list if entry.replace(".", "").lower().strip() not in DEGREE_TITLES]
 
 
 def exclude_references(education_list: list[str]) -> list[str]:
@@ -61,4 +78,133 @@ def exclude_references(education_list: list[str]) -> list[str]:
     :param education_list: A list of education entries.
     :return: A list with reference entries removed.
     """
-    return [entry for entry in education_list if re.match(r'\[\d+]', entry) is None]
+    return [entry for entry in education_list if REFERENCE_PATTERN.match(entry) is None]
+
+
+def normalize_text_column(column: pd.Series) -> pd.Series:
+    """
+    Normalizes every string of a column, like :func:`normalize_text`, with pandas string methods.
+
+    :param column: A column of strings.
+    :return: The column of normalized strings.
+    """
+    # Only strings with an ampersand can contain HTML entities
+    escaped = column.str.contains("&", regex=False, na=False)
+    column = column.where(~escaped, column[escaped].map(html.unescape))
+
+    # Non-breaking spaces are whitespaces too, so they are replaced with the runs of whitespaces
+    return column.str.replace(WHITESPACE_PATTERN, " ", regex=True).str.strip()
+
+
+def remove_text_in_parentheses_column(column: pd.Series) -> pd.Series:
+    """
+    Removes text enclosed in parentheses from every string of a column, like :func:`remove_text_in_parentheses`.
+
+    :param column: A column of strings.
+    :return: The column of strings with text inside parentheses removed.
+    """
+    return column.str.replace(PARENTHESES_PATTERN, "", regex=True).str.strip()
+
+
+def exclude_degree_titles_column(column: pd.Series) -> pd.Series:
+    """
+    Filters out common degree titles from every list of a column, like :func:`exclude_degree_titles`.
+
+    :param column: A column of lists of education entries.
+    :return: The column of lists with degree titles removed.
+    """
+    return _filter_list_column(column, lambda entries: ~_is_degree_title(entries))
+
+
+def exclude_references_column(column: pd.Series) -> pd.Series:
+    """
+    Filters out references from every list of a column, like :func:`exclude_references`.
+
+    :param column: A column of lists of entries.
+    :return: The column of lists with reference entries removed.
+    """
+    return _filter_list_column(column, lambda entries: ~_is_reference(entries))
+
+
+def preprocess_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Preprocesses the raw scraped data with the column functions: normalizes the names, merges the alma mater into the
+    education, and removes degree titles and references.
+
+    :param df: The raw data, with the name, education, alma_mater and awards columns, the last three holding lists.
+    :return: The preprocessed data, with the name, education and awards columns.
+    """
+    # The entries are filtered one by one, so the lists can be merged first and filtered in a single pass
+    education = _filter_list_column(df["education"] + df["alma_mater"],
+                                    lambda entries: ~(_is_degree_title(entries) | _is_reference(entries)))
+
+    return pd.DataFrame({
+        "name": remove_text_in_parentheses_column(normalize_text_column(df["name"])),
+        "education": education,
+        "awards": exclude_references_column(df["awards"]),
+    })
+
+
+def write_jsonl(df: pd.DataFrame, path: str):
+    """
+    Writes a data frame to a JSON Lines file, one record per line, keeping list columns as native JSON lists.
+
+    :param df: The data frame.
+    :param path: The path of the file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        for record in df.to_dict("records"):
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def read_jsonl(path: str) -> pd.DataFrame:
+    """
+    Reads a data frame from a JSON Lines file, with list columns as Python lists and without any type inference.
+
+    :param path: The path of the file.
+    :return: The data frame.
+    """
+    return pd.read_json(path, lines=True, dtype=False, convert_dates=False)
+
+
+def _is_degree_title(entries: pd.Series) -> pd.Series:
+    """
+    Finds the degree titles in a column of entries.
+
+    :param entries: A column of strings.
+    :return: The mask of the degree titles.
+    """
+    return entries.str.replace(".", "", regex=False).str.lower().str.strip().isin(DEGREE_TITLES)
+
+
+def _is_reference(entries: pd.Series) -> pd.Series:
+    """
+    Finds the references in a column of entries.
+
+    :param entries: A column of strings.
+    :return: The mask of the references.
+    """
+    return entries.str.match(REFERENCE_PATTERN)
+
+
+def _filter_list_column(column: pd.Series, keep: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    Filters the entries of every list of a column at once: the lists are flattened into a single column of entries,
+    filtered with a mask, and split back into one list per row. The mask is only computed for the distinct entries,
+    since institutions and awards repeat across rows.
+
+    :param column: A column of lists.
+    :param keep: A function computing the mask of the entries to keep from the column of all entries.
+    :return: The column of filtered lists, with the same index.
+    """
+    entries = pd.Series(list(itertools.chain.from_iterable(column)), dtype=object)
+    codes, distinct = pd.factorize(entries)
+    mask = keep(pd.Series(distinct, dtype=object)).to_numpy(dtype=bool)[codes]
+    kept = entries[mask].tolist()
+
+    # The row of every entry, to count the entries kept in each row
+    rows = np.repeat(np.arange(len(column)), column.map(len).to_numpy(dtype=np.int64))
+    ends = np.bincount(rows[mask], minlength=len(column)).cumsum().tolist()
+    starts = [0] + ends[:-1]
+
+    return pd.Series([kept[start:end] for start, end in zip(starts, ends)], index=column.index, dtype=object)
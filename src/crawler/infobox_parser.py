@@ -0,0 +1,351 @@
+from html.parser import HTMLParser
+from typing import Callable, Optional
+
+from bs4 import BeautifulSoup
+
+from src.crawler.crawler_utilities import normalize_text
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+BACKENDS = ("lxml", "stream", "bs4")
+"""The parser backends: lxml, a scan with the standard library HTML parser, or BeautifulSoup."""
+
+INFOBOX_FIELDS = {"education": 1, "alma mater": 2, "awards": 3}
+"""The infobox labels that are scraped, with the position of their column in a raw record."""
+
+CHUNK_SIZE = 16384
+"""The number of bytes fed to an incremental parser at a time, between checks for the end of the infobox."""
+
+VOID_ELEMENTS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param",
+                           "source", "track", "wbr"})
+"""The HTML elements without content or end tag."""
+
+HIDDEN_ELEMENTS = ("script", "style", "template")
+"""The HTML elements whose text is not part of the text of the page."""
+
+LABEL_XPATH = ".//th[contains(concat(' ', normalize-space(@class), ' '), ' infobox-label ')]"
+"""The XPath of the infobox labels under an element."""
+
+
+def default_backend() -> str:
+    """
+    The fastest available parser backend.
+
+    :return: ``"lxml"`` if lxml is installed, ``"stream"`` otherwise.
+    """
+    return "stream" if etree is None else "lxml"
+
+
+def parse_page(content: bytes, backend: Optional[str] = None) -> list:
+    """
+    Scrapes the name of a computer scientist and the links of the education, alma mater and awards rows of the
+    infobox of their Wikipedia article. The lxml and stream backends stop reading the page after the infobox, and
+    fall back to BeautifulSoup if they cannot find the heading of the article. All backends scrape the same record
+    from well-formed pages, such as Wikipedia's; on malformed markup, lxml repairs the tree the way browsers do,
+    while the other backends keep the nesting of the tags as written.
+
+    :param content: The HTML content of the article, encoded in UTF-8.
+    :param backend: The parser backend, one of :data:`BACKENDS`, or ``None`` for the fastest available one.
+    :return: A raw record: the name, the education, the alma mater and the awards.
+    :raises ValueError: If the backend is unknown or not installed.
+    """
+    backend = backend or default_backend()
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend {backend}.")
+    if backend == "lxml" and etree is None:
+        raise ValueError("The lxml parser backend requires lxml to be installed.")
+
+    record = None
+
+    if backend == "lxml":
+        record = _parse_with_lxml(content)
+    elif backend == "stream":
+        record = _parse_with_scanner(content)
+
+    return record or _parse_with_bs4(content)
+
+
+def _make_record(name: str, rows: list[tuple[str, list[str]]]) -> list:
+    """
+    Builds a raw record from the rows of an infobox.
+
+    :param name: The name of the computer scientist.
+    :param rows: The label and the link texts of every labelled row of the infobox, in document order.
+    :return: A raw record: the name, the education, the alma mater and the awards.
+    """
+    record = [name, [], [], []]
+
+    for label, links in rows:
+        column = INFOBOX_FIELDS.get(normalize_text(label).lower())
+        if column is not None:
+            record[column] += links
+
+    return record
+
+
+def _parse_with_bs4(content: bytes) -> list:
+    """
+    Parses a whole article with BeautifulSoup.
+
+    :param content: The HTML content of the article.
+    :return: A raw record.
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    rows = []
+
+    # Try to find the infobox
+    infobox = soup.find("table", {"class": "infobox"})
+
+    if infobox:
+        # Find all the table rows that contain a table header
+        for tr in infobox.select('tr:has(th.infobox-label)'):
+            th = tr.find("th", {"class": "infobox-label"})
+            rows.append((th.get_text(), [i.text for i in tr.find_all("a")]))
+
+    return _make_record(soup.find(id="firstHeading").get_text(), rows)
+
+
+def _parse_with_lxml(content: bytes) -> Optional[list]:
+    """
+    Parses an article with the incremental lxml HTML parser, up to the end of the heading and the infobox.
+
+    :param content: The HTML content of the article.
+    :return: A raw record, or ``None`` if the heading was not found.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+    found = {}
+    closed = set()
+
+    def read_events():
+        for event, element in parser.read_events():
+            if event == "start":
+                if "heading" not in found and element.get("id") == "firstHeading":
+                    found["heading"] = element
+                elif ("infobox" not in found and element.tag == "table"
+                      and "infobox" in element.get("class", "").split()):
+                    found["infobox"] = element
+            elif element is found.get("heading"):
+                closed.add("heading")
+            elif element is found.get("infobox"):
+                closed.add("infobox")
+
+    for offset in range(0, len(content), CHUNK_SIZE):
+        parser.feed(content[offset:offset + CHUNK_SIZE])
+        read_events()
+        if len(closed) == 2:
+            break
+    else:
+        parser.close()
+        read_events()
+
+    if "heading" not in found:
+        return None
+
+    rows = []
+    infobox = found.get("infobox")
+
+    if infobox is not None:
+        etree.strip_elements(infobox, *HIDDEN_ELEMENTS, with_tail=False)
+        for tr in infobox.xpath(f".//tr[{LABEL_XPATH}]"):
+            th = tr.xpath(LABEL_XPATH)[0]
+            rows.append(("".join(th.itertext()), ["".join(a.itertext()) for a in tr.iter("a")]))
+
+    heading = found["heading"]
+    etree.strip_elements(heading, *HIDDEN_ELEMENTS, with_tail=False)
+
+    return _make_record("".join(heading.itertext()), rows)
+
+
+def _parse_with_scanner(content: bytes) -> Optional[list]:
+    """
+    Scans an article with the standard library HTML parser, without building a tree, up to the end of the heading
+    and the infobox.
+
+    :param content: The HTML content of the article.
+    :return: A raw record, or ``None`` if the heading was not found.
+    """
+    scanner = _InfoboxScanner()
+    text = content.decode("utf-8", errors="replace")
+
+    try:
+        for offset in range(0, len(text), CHUNK_SIZE):
+            scanner.feed(text[offset:offset + CHUNK_SIZE])
+        scanner.close()
+    except _StopScanning:
+        pass
+
+    if scanner.name is None:
+        return None
+
+    return _make_record(scanner.name, [(label, links) for _, label, links in sorted(scanner.rows)])
+
+
+class _StopScanning(Exception):
+    """
+    Raised by an :class:`_InfoboxScanner` once it has read the heading and the infobox.
+    """
+
+
+class _InfoboxScanner(HTMLParser):
+    """
+    Collects the heading and the labelled rows of the infobox of an article from a stream of HTML tokens, keeping
+    only a stack of the open elements. The text of an element is gathered by a collector, from the start tag of the
+    element to the end tag closing it.
+
+    :cvar name: The text of the heading, once read.
+    :cvar rows: The position, the label and the link texts of every labelled row of the infobox read so far.
+    """
+    name: Optional[str]
+    rows: list[tuple[int, str, list[str]]]
+
+    def __init__(self):
+        """
+        Initializes a scanner that has not read any token yet.
+        """
+        super().__init__(convert_charrefs=True)
+        self.name = None
+        self.rows = []
+        self._stack: list[str] = []
+        self._collectors: list[tuple[int, list[str], Callable[[str], None]]] = []
+        self._hidden_depth: Optional[int] = None
+        self._infobox_depth: Optional[int] = None
+        self._infobox_done = False
+        self._heading_found = False
+        self._open_rows: list[list] = []
+        self._row_count = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
+        """
+        Opens an element and advances the scanner state.
+
+        :param tag: The name of the element.
+        :param attrs: The attributes of the element.
+        """
+        # Void elements are never closed, so they are kept off the stack.
+        if tag in VOID_ELEMENTS:
+            return
+
+        self._stack.append(tag)
+        depth = len(self._stack)
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+
+        if tag in HIDDEN_ELEMENTS and self._hidden_depth is None:
+            self._hidden_depth = depth
+
+        if not self._heading_found and attributes.get("id") == "firstHeading":
+            self._heading_found = True
+            self._collect(depth, self._set_name)
+
+        if self._infobox_depth is None:
+            if tag == "table" and "infobox" in classes and not self._infobox_done:
+                self._infobox_depth = depth
+            return
+
+        if tag == "tr":
+            row = [self._row_count, None, []]
+            self._row_count += 1
+            self._open_rows.append(row)
+            self._collect(depth, lambda _: self._close_row(row))
+        elif tag == "th" and "infobox-label" in classes:
+            # The rows are claimed when the cell opens, so only the first label cell of a row sets its label.
+            rows = [row for row in self._open_rows if row[1] is None]
+            for row in rows:
+                row[1] = ""
+            self._collect(depth, lambda label: self._set_label(rows, label))
+        elif tag == "a":
+            rows = list(self._open_rows)
+            self._collect(depth, lambda link: self._add_link(rows, link))
+
+    def handle_endtag(self, tag: str):
+        """
+        Closes an element, along with every element left open inside it.
+
+        :param tag: The name of the element.
+        :raises _StopScanning: Once both the name and the infobox have been read.
+        """
+        # Stray end tags are ignored, and unclosed elements are closed by the end tag of an element around them.
+        if tag not in self._stack:
+            return
+
+        while self._stack.pop() != tag:
+            pass
+
+        depth = len(self._stack)
+
+        while self._collectors and self._collectors[-1][0] > depth:
+            _, parts, on_close = self._collectors.pop()
+            on_close("".join(parts))
+
+        if self._hidden_depth is not None and self._hidden_depth > depth:
+            self._hidden_depth = None
+
+        if self._infobox_depth is not None and self._infobox_depth > depth:
+            self._infobox_depth = None
+            self._infobox_done = True
+
+        if self._infobox_done and self.name is not None:
+            raise _StopScanning()
+
+    def handle_data(self, data: str):
+        """
+        Adds a text to every element whose text is being collected, unless it is inside a hidden region.
+
+        :param data: The text.
+        """
+        if self._hidden_depth is None:
+            for _, parts, _ in self._collectors:
+                parts.append(data)
+
+    def _collect(self, depth: int, on_close: Callable[[str], None]):
+        """
+        Starts gathering the text of the element at the given depth of the stack.
+
+        :param depth: The depth of the element.
+        :param on_close: The function called with the text of the element once it is closed.
+        """
+        self._collectors.append((depth, [], on_close))
+
+    def _set_name(self, name: str):
+        """
+        Sets the name once the heading is closed.
+
+        :param name: The text of the heading.
+        """
+        self.name = name
+
+    def _close_row(self, row: list):
+        """
+        Closes a table row, keeping it only if it has a label.
+
+        :param row: The position, the label and the link texts of the row.
+        """
+        self._open_rows.remove(row)
+        if row[1] is not None:
+            self.rows.append(tuple(row))
+
+    @staticmethod
+    def _set_label(rows: list[list], label: str):
+        """
+        Sets the label of the rows that were open when the label cell started, once the cell is closed.
+
+        :param rows: The rows of the label.
+        :param label: The text of the label cell.
+        """
+        for row in rows:
+            row[1] = label
+
+    @staticmethod
+    def _add_link(rows: list[list], link: str):
+        """
+        Adds a link text to the rows that were open when the link started, once the link is closed.
+
+        :param rows: The rows of the link.
+        :param link: The text of the link.
+        """
+        for row in rows:
+            row[2].append(link)
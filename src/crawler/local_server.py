@@ -0,0 +1,190 @@
+import hashlib
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class LocalPageServer:
+    """
+    A local HTTP server serving saved pages from memory, standing in for Wikipedia when testing or benchmarking the
+    crawler. Every response can be delayed to simulate the round-trip latency of a remote server, and a page can be
+    made to fail a number of times before it is served. Pages are served with an ETag and a Last-Modified date, and
+    conditional requests for unchanged pages are answered with a 304 status.
+
+    :cvar pages: The content of the served pages, by path.
+    :cvar latency: The delay before every response, in seconds.
+    :cvar failures: The number of times each page still fails with a 503 status before it is served, by path.
+    :cvar last_modified: The Last-Modified date of every page.
+    :cvar hits: The number of requests received for each path.
+    :cvar not_modified: The number of requests answered with a 304 status.
+    """
+    pages: dict[str, bytes]
+    latency: float
+    failures: dict[str, int]
+    last_modified: str
+    hits: dict[str, int]
+    not_modified: int
+
+    def __init__(self, pages: dict[str, bytes], latency: float = 0.0, failures: Optional[dict[str, int]] = None):
+        """
+        Initializes a server, without starting it.
+
+        :param pages: The content of the served pages, by path.
+        :param latency: The delay before every response, in seconds.
+        :param failures: The number of times each page fails with a 503 status before it is served, by path.
+        """
+        self.pages = pages
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.hits = {}
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_directory(cls, directory: str, prefix: str = "/wiki/", **kwargs) -> "LocalPageServer":
+        """
+        Initializes a server serving the saved pages of a directory, each at the prefix followed by its file name
+        without the extension.
+
+        :param directory: The directory of the saved pages.
+        :param prefix: The path prefix of the pages.
+        :param kwargs: The other arguments of the server.
+        :return: The server.
+        """
+        pages = {}
+
+        for file_name in os.listdir(directory):
+            with open(os.path.join(directory, file_name), "rb") as file:
+                pages[prefix + os.path.splitext(file_name)[0]] = file.read()
+
+        return cls(pages, **kwargs)
+
+    def __enter__(self) -> "LocalPageServer":
+        """
+        Starts the server as a context manager.
+
+        :return: The running server.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        """
+        Stops the server.
+        """
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """
+        The URL of the running server.
+
+        :return: The URL of the server, without a trailing slash.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        """
+        The URL of a page of the running server.
+
+        :param path: The path of the page.
+        :return: The URL of the page.
+        """
+        return self.base_url + path
+
+    def start(self):
+        """
+        Starts serving on a free local port in a background thread.
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                """
+                Serves a GET request from the pages of the server.
+                """
+                server._respond(self)
+
+            def log_message(self, *_):
+                """
+                Silences the request log, which would otherwise be written to the standard error.
+                """
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the server.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def _respond(self, handler: BaseHTTPRequestHandler):
+        """
+        Answers a GET request.
+
+        :param handler: The handler of the request.
+        """
+        path = handler.path
+
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+            failing = self.failures.get(path, 0) > 0
+            if failing:
+                self.failures[path] -= 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        content = self.pages.get(path)
+        status = 503 if failing else 404 if content is None else 200
+        etag = f'"{hashlib.sha1(content).hexdigest()}"' if content is not None else None
+
+        if status == 200 and self._is_fresh(handler.headers.get("If-None-Match"),
+                                            handler.headers.get("If-Modified-Since"), etag):
+            status = 304
+            with self._lock:
+                self.not_modified += 1
+
+        body = content if status == 200 else b""
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            handler.send_header("ETag", etag)
+            handler.send_header("Last-Modified", self.last_modified)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _is_fresh(self, if_none_match: Optional[str], if_modified_since: Optional[str], etag: str) -> bool:
+        """
+        Whether the client already has the current version of a page. The ETag takes precedence over the date.
+
+        :param if_none_match: The If-None-Match header of the request, if any.
+        :param if_modified_since: The If-Modified-Since header of the request, if any.
+        :param etag: The ETag of the page.
+        :return: ``True`` if the page can be answered with a 304 status, ``False`` otherwise.
+        """
+        if if_none_match is not None:
+            return etag in (tag.strip() for tag in if_none_match.split(","))
+        if if_modified_since is not None:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(self.last_modified)
+
+        return False
@@ -0,0 +1,258 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+
+class CachedPage:
+    """
+    A page stored in the page cache, with the validators the server sent it with.
+
+    :cvar digest: The SHA-256 digest of the content of the page, naming the file the content is stored in.
+    :cvar etag: The ETag of the page, if any.
+    :cvar last_modified: The Last-Modified date of the page, if any.
+    """
+    __slots__ = ("digest", "etag", "last_modified")
+
+    digest: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def __init__(self, digest: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Initializes a cached page.
+
+        :param digest: The SHA-256 digest of the content of the page.
+        :param etag: The ETag of the page, if any.
+        :param last_modified: The Last-Modified date of the page, if any.
+        """
+        self.digest = digest
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class PageCache:
+    """
+    An on-disk cache of fetched pages. The content of the pages is stored compressed, in files named by the digest
+    of the content, so a page that did not change is never stored twice. An append-only index maps the URL of every
+    page to its content and its validators, so the page can be revalidated with a conditional request instead of
+    being downloaded again. The last entry of a URL in the index wins, and a torn entry at the end of the index, left
+    by a crash in the middle of a write, is dropped.
+
+    :cvar directory: The directory of the cache.
+    :cvar pages: The cached pages, by URL.
+    """
+    directory: str
+    pages: dict[str, CachedPage]
+
+    def __init__(self, directory: str):
+        """
+        Opens a page cache, creating its directory if it does not exist.
+
+        :param directory: The directory of the cache.
+        """
+        self.directory = directory
+        self.pages = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+        index_path = os.path.join(directory, "index.jsonl")
+
+        for line in _read_lines(index_path):
+            entry = json.loads(line)
+            self.pages[entry["url"]] = CachedPage(entry["digest"], entry["etag"], entry["last_modified"])
+
+        self._index = open(index_path, "a", encoding="utf-8")
+
+    def __contains__(self, url: str) -> bool:
+        """
+        Checks whether a page is cached.
+
+        :param url: The URL of the page.
+        :return: ``True`` if the page is cached, ``False`` otherwise.
+        """
+        return url in self.pages
+
+    def __len__(self) -> int:
+        """
+        The size of the cache.
+
+        :return: The number of cached pages.
+        """
+        return len(self.pages)
+
+    def __enter__(self) -> "PageCache":
+        """
+        Uses the cache as a context manager.
+
+        :return: The cache.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """
+        Closes the index of the cache.
+        """
+        self.close()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Reads the content of a cached page.
+
+        :param url: The URL of the page.
+        :return: The content of the page, or ``None`` if the page is not cached.
+        """
+        page = self.pages.get(url)
+
+        if page is None:
+            return None
+
+        with open(self._object_path(page.digest), "rb") as file:
+            return gzip.decompress(file.read())
+
+    def validators(self, url: str) -> dict[str, str]:
+        """
+        The headers of a conditional request revalidating a cached page.
+
+        :param url: The URL of the page.
+        :return: The If-None-Match and If-Modified-Since headers of the page, empty if the page is not cached.
+        """
+        page = self.pages.get(url)
+        headers = {}
+
+        if page is not None and page.etag:
+            headers["If-None-Match"] = page.etag
+        if page is not None and page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+
+        return headers
+
+    def put(self, url: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Stores a page in the cache. The content is written to a temporary file first, so a crash leaves either no
+        content or the complete content, and it is indexed only once it is written.
+
+        :param url: The URL of the page.
+        :param content: The content of the page.
+        :param etag: The ETag of the page, if any.
+        :param last_modified: The Last-Modified date of the page, if any.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+
+        if not os.path.exists(path):
+            temporary_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temporary_path, "wb") as file:
+                file.write(gzip.compress(content))
+            os.replace(temporary_path, path)
+
+        entry = json.dumps({"url": url, "digest": digest, "etag": etag, "last_modified": last_modified})
+
+        with self._lock:
+            self._index.write(entry + "\n")
+            self._index.flush()
+            self.pages[url] = CachedPage(digest, etag, last_modified)
+
+    def close(self):
+        """
+        Closes the index of the cache.
+        """
+        self._index.close()
+
+    def _object_path(self, digest: str) -> str:
+        """
+        The path of the file storing the content with the given digest.
+
+        :param digest: The SHA-256 digest of the content.
+        :return: The path of the file.
+        """
+        return os.path.join(self.directory, "objects", f"{digest}.gz")
+
+
+class Checkpoint:
+    """
+    The URLs completed so far by a crawl, kept in an append-only file so an interrupted crawl can resume where it
+    stopped. The checkpoint is cleared once the crawl is complete, so the next crawl revalidates every page.
+
+    :cvar path: The path of the checkpoint file.
+    :cvar completed: The completed URLs.
+    """
+    path: str
+    completed: set[str]
+
+    def __init__(self, path: str):
+        """
+        Opens a checkpoint, creating it if it does not exist.
+
+        :param path: The path of the checkpoint file.
+        """
+        self.path = path
+        self.completed = set(_read_lines(path))
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, url: str) -> bool:
+        """
+        Checks whether a URL is completed.
+
+        :param url: The URL.
+        :return: ``True`` if the URL is completed, ``False`` otherwise.
+        """
+        return url in self.completed
+
+    def __len__(self) -> int:
+        """
+        The size of the checkpoint.
+
+        :return: The number of completed URLs.
+        """
+        return len(self.completed)
+
+    def add(self, url: str):
+        """
+        Marks a URL as completed.
+
+        :param url: The URL.
+        """
+        with self._lock:
+            self._file.write(url + "\n")
+            self._file.flush()
+            self.completed.add(url)
+
+    def clear(self):
+        """
+        Forgets every completed URL, once the crawl is complete.
+        """
+        with self._lock:
+            self._file.truncate(0)
+            self.completed.clear()
+
+    def close(self):
+        """
+        Closes the checkpoint file.
+        """
+        self._file.close()
+
+
+def _read_lines(path: str) -> list[str]:
+    """
+    Reads the lines of an append-only file, truncating a torn line at its end, left by a crash in the middle of a
+    write, so the next line is appended after the last complete one.
+
+    :param path: The path of the file.
+    :return: The complete lines of the file, without their line breaks, or an empty list if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "rb+") as file:
+        buffer = file.read()
+        end = buffer.rfind(b"\n") + 1
+        if end < len(buffer):
+            logging.info(f"Dropping {len(buffer) - end} bytes of a torn line from {path}.")
+            file.truncate(end)
+
+    return buffer[:end].decode("utf-8").splitlines()
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+
+from src.chord_dht.chord_async import AsyncChordNode
+from src.chord_dht.chord_stats import RoutingStats
+from src.chord_dht.chord_transport import ChordTransportError, InProcessTransport, StreamTransport, TcpTransport
+from src.chord_dht.chord_transport import Transport, UnixTransport
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class TestChordAsync(unittest.IsolatedAsyncioTestCase):
+    m = 4
+    node_ids = [0, 3, 5, 9, 12, 14]
+
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    async def asyncTearDown(self):
+        self.directory.cleanup()
+
+    def successor_of(self, node_ids, target_id):
+        return min((node_id for node_id in node_ids if node_id >= target_id), default=min(node_ids))
+
+    async def build_ring(self, transport, address_of):
+        nodes = {}
+
+        for node_id in self.node_ids:
+            node = AsyncChordNode(node_id, self.m, address_of(node_id), transport)
+            await node.start()
+            await node.join(nodes[self.node_ids[0]].address if nodes else None)
+            nodes[node_id] = node
+
+        return nodes
+
+    async def check_ring(self, transport, address_of):
+        nodes = await self.build_ring(transport, address_of)
+
+        try:
+            for node in nodes.values():
+                expected = [self.successor_of(nodes, (node.id + 2 ** i) % 2 ** self.m) for i in range(self.m)]
+                self.assertListEqual(expected, [finger[0] for finger in node.fingers])
+
+            await asyncio.gather(*(nodes[0].insert(f'key_{i}', i) for i in range(40)))
+
+            stats = RoutingStats()
+            results = await asyncio.gather(*(nodes[9].lookup(f'key_{i}', stats) for i in range(40)))
+
+            self.assertListEqual([[i] for i in range(40)], results)
+            self.assertLessEqual(stats.max_hops, self.m)
+
+            await nodes[5].leave()
+            await nodes[5].stop()
+            del nodes[5]
+
+            for node in nodes.values():
+                expected = [self.successor_of(nodes, (node.id + 2 ** i) % 2 ** self.m) for i in range(self.m)]
+                self.assertListEqual(expected, [finger[0] for finger in node.fingers])
+
+            results = await asyncio.gather(*(nodes[14].lookup(f'key_{i}') for i in range(40)))
+            self.assertListEqual([[i] for i in range(40)], results)
+        finally:
+            await transport.close()
+
+    async def test_in_process(self):
+        await self.check_ring(InProcessTransport(), lambda node_id: f'node-{node_id}')
+
+    async def test_tcp(self):
+        ports = {node_id: free_port() for node_id in self.node_ids}
+        await self.check_ring(TcpTransport(pool_size=2), lambda node_id: f'127.0.0.1:{ports[node_id]}')
+
+    async def test_unix(self):
+        await self.check_ring(UnixTransport(), lambda node_id: os.path.join(self.directory.name, f'{node_id}.sock'))
+
+    async def test_unknown_address(self):
+        transport = InProcessTransport()
+
+        with self.assertRaises(ChordTransportError):
+            await transport.request('missing', 'step', {'target_id': 0})
+
+    async def test_unknown_operation(self):
+        transport = InProcessTransport()
+        node = AsyncChordNode(0, self.m, 'node-0', transport)
+        await node.start()
+
+        with self.assertRaises(ChordTransportError):
+            await transport.request('node-0', 'unknown', {})
+
+        await transport.close()
+
+    async def check_cancelled_request(self, transport, address):
+        await transport.serve(address, lambda op, args: args['value'])
+
+        try:
+            request = asyncio.create_task(transport.request(address, 'echo', {'value': 1}))
+            await asyncio.sleep(0)
+            request.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await request
+
+            self.assertEqual(2, await asyncio.wait_for(transport.request(address, 'echo', {'value': 2}), 1))
+        finally:
+            await transport.close()
+
+    async def test_cancelled_request(self):
+        await self.check_cancelled_request(InProcessTransport(), 'node-0')
+        await self.check_cancelled_request(TcpTransport(), f'127.0.0.1:{free_port()}')
+
+    async def test_unserve_fails_queued_requests(self):
+        transport = InProcessTransport()
+        await transport.serve('node-0', lambda op, args: args['value'])
+
+        request = asyncio.create_task(transport.request('node-0', 'echo', {'value': 1}))
+        await asyncio.sleep(0)
+        await transport.unserve('node-0')
+
+        with self.assertRaises(ChordTransportError):
+            await asyncio.wait_for(request, 1)
+
+    async def test_abstract_transports(self):
+        with self.assertRaises(TypeError):
+            Transport()
+
+        with self.assertRaises(TypeError):
+            StreamTransport()
@@ -0,0 +1,43 @@
+import unittest
+
+from src.chord_dht.chord import Chord
+
+
+class TestChordBatch(unittest.TestCase):
+    def setUp(self):
+        chord = Chord(4)
+
+        for i in range(0, 2 ** chord.m, 3):
+            chord.join(i)
+
+        self.chord = chord
+        self.keys = [f'key_{i}' for i in range(50)]
+
+    def test_insert_many(self):
+        self.chord.insert_many([(key, f'val_{key}') for key in self.keys])
+
+        for key in self.keys:
+            self.assertEqual([f'val_{key}'], self.chord.lookup(key))
+
+    def test_insert_many_duplicate_keys(self):
+        self.chord.insert_many([('a', 1), ('b', 2), ('a', 3)])
+
+        self.assertEqual([1, 3], self.chord.lookup('a'))
+        self.assertEqual([2], self.chord.lookup('b'))
+
+    def test_lookup_many(self):
+        for key in self.keys:
+            self.chord.insert(key, f'val_{key}')
+
+        missing = ['missing', self.keys[0]]
+
+        self.assertListEqual([[f'val_{key}'] for key in reversed(self.keys)],
+                             self.chord.lookup_many(reversed(self.keys)))
+        self.assertListEqual([[], [f'val_{self.keys[0]}']], self.chord.lookup_many(missing))
+
+    def test_batch_empty_ring(self):
+        with self.assertRaises(ValueError):
+            Chord(2).insert_many([('a', 1)])
+
+        with self.assertRaises(ValueError):
+            Chord(2).lookup_many(['a'])
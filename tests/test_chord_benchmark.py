@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.benchmark.chord_benchmark import RESULT_FIELDS, Workload, benchmark, main, summarize
+
+
+class TestChordBenchmark(unittest.TestCase):
+    def test_benchmark(self):
+        results = benchmark([2, 3], keys=20, repeats=2, warmup=1)
+
+        self.assertEqual(10, len(results))
+
+        for row in results:
+            self.assertListEqual(RESULT_FIELDS, list(row))
+            self.assertLessEqual(row['p50_us'], row['p99_us'])
+
+        lookups = [row for row in results if row['op'] == 'lookup']
+        self.assertListEqual([40, 40], [row['count'] for row in lookups])
+        self.assertTrue(all(row['max_hops'] <= row['m'] for row in lookups))
+
+    def test_benchmark_build_only(self):
+        results = benchmark([4], keys=0, ops=['build'], repeats=3, warmup=0, memory=False)
+
+        self.assertListEqual([('build', 3)], [(row['op'], row['count']) for row in results])
+
+    def test_benchmark_unknown_op(self):
+        with self.assertRaises(ValueError):
+            benchmark([2], ops=['unknown'])
+
+    def test_summarize(self):
+        summary = summarize([float(i) for i in range(1, 101)])
+
+        self.assertAlmostEqual(50.5, summary['mean_us'])
+        self.assertAlmostEqual(50.5, summary['p50_us'])
+        self.assertEqual({'mean_us': 0.0, 'p50_us': 0.0, 'p95_us': 0.0, 'p99_us': 0.0}, summarize([]))
+
+    def test_main_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bench.json')
+            main(['-m', '2', '--keys', '5', '--repeats', '1', '--ops', 'lookup', '--no-memory', '-o', path])
+
+            with open(path) as file:
+                document = json.load(file)
+
+        self.assertEqual([2], document['metadata']['parameters']['m'])
+        self.assertEqual(1, len(document['results']))
+
+    def test_workload(self):
+        uniform = Workload(50)
+        skewed = Workload(50, value_size=8, skew=1.5, seed=1)
+
+        self.assertListEqual(uniform.keys, uniform.values)
+        self.assertListEqual(uniform.keys, uniform.lookups)
+        self.assertTrue(all(len(value) == 8 for value in skewed.values))
+        self.assertEqual(50, len(skewed.lookups))
+        self.assertGreater(skewed.lookups.count('key_0'), skewed.lookups.count('key_49'))
+        self.assertListEqual(skewed.lookups, Workload(50, value_size=8, skew=1.5, seed=1).lookups)
+
+        with self.assertRaises(ValueError):
+            Workload(50, skew=-1)
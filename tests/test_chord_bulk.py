@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_utils import finger_positions, finger_table
+
+
+class TestChordBulk(unittest.TestCase):
+    def setUp(self):
+        self.m = 6
+        self.random = random.Random(11)
+        self.node_ids = self.random.sample(range(2 ** self.m), 30)
+
+    def assert_rings_equal(self, expected, actual):
+        self.assertListEqual(expected.node_ids, actual.node_ids)
+
+        for node_id in expected.node_ids:
+            a, b = expected.nodes[node_id], actual.nodes[node_id]
+            self.assertEqual(a.successor.id, b.successor.id)
+            self.assertEqual(a.predecessor.id, b.predecessor.id)
+            self.assertListEqual([finger.id for finger in a.fingers], [finger.id for finger in b.fingers])
+            self.assertDictEqual(a.data, b.data)
+            self.assertListEqual(a.data_index, b.data_index)
+
+    def test_from_node_ids(self):
+        expected = Chord(self.m)
+
+        for node_id in self.node_ids:
+            expected.join(node_id)
+
+        self.assert_rings_equal(expected, Chord.from_node_ids(self.node_ids, self.m))
+
+    def test_from_node_ids_one(self):
+        chord = Chord.from_node_ids([5], self.m)
+
+        self.assertEqual(5, chord.nodes[5].successor.id)
+        self.assertListEqual([5] * self.m, [finger.id for finger in chord.nodes[5].fingers])
+
+    def test_finger_table_matches_binary_searches(self):
+        wide = [sorted({self.random.getrandbits(bits) for _ in range(50)}) for bits in [64, 70]]
+
+        for m, node_ids in [(self.m, sorted(self.node_ids)), (1, [1]), (64, wide[0]), (64, [0, 2 ** 63, 2 ** 64 - 1]),
+                            (70, wide[1])]:
+            with self.subTest(m=m, size=len(node_ids)):
+                columns = finger_table(node_ids, m)
+
+                self.assertEqual(m, len(columns))
+                for i, column in enumerate(columns):
+                    self.assertListEqual(finger_positions(node_ids, m, i), [int(position) for position in column])
+
+    def test_join_many_with_data(self):
+        expected = Chord(self.m)
+        actual = Chord(self.m)
+
+        for chord in [expected, actual]:
+            for node_id in self.node_ids[:5]:
+                chord.join(node_id)
+            for i in range(200):
+                chord.insert(f'key_{i}', i)
+
+        for node_id in self.node_ids[5:]:
+            expected.join(node_id)
+
+        actual.join_many(self.node_ids[5:])
+
+        self.assert_rings_equal(expected, actual)
+
+        for i in range(200):
+            self.assertEqual([i], actual.lookup(f'key_{i}'))
+
+    def test_join_many_invalid(self):
+        chord = Chord.from_node_ids([1, 2], self.m)
+
+        with self.assertRaises(ValueError):
+            chord.join_many([2, 3])
+
+        with self.assertRaises(ValueError):
+            chord.join_many([3, 3])
+
+        with self.assertRaises(ValueError):
+            chord.join_many([2 ** self.m])
@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_stabilizer import Stabilizer
+from src.chord_dht.chord_stats import RoutingStats
+
+
+class TestChordCache(unittest.TestCase):
+    def setUp(self):
+        self.m = 8
+        self.random = random.Random(23)
+        self.node_ids = self.random.sample(range(2 ** self.m), 30)
+        self.keys = [f'key_{i}' for i in range(100)]
+        self.chord = Chord.from_node_ids(self.node_ids, self.m, lookup_cache_size=50)
+        self.chord.insert_many((key, key) for key in self.keys)
+
+    def test_repeated_lookups_hit(self):
+        stats = RoutingStats()
+
+        for _ in range(3):
+            self.assertEqual([self.keys[0]], self.chord.lookup(self.keys[0], stats))
+
+        self.assertEqual(1, self.chord.cache_misses)
+        self.assertEqual(2, self.chord.cache_hits)
+        self.assertEqual(3, stats.count)
+        self.assertEqual(0, stats.last_hops)
+
+    def test_lru_eviction(self):
+        self.chord.lookup_cache_size = 2
+
+        for key in self.keys[:3]:
+            self.chord.lookup(key)
+        self.chord.lookup(self.keys[2])
+        self.chord.lookup(self.keys[0])
+
+        self.assertEqual(1, self.chord.cache_hits)
+        self.assertEqual(4, self.chord.cache_misses)
+
+    def test_invalidated_by_membership_changes(self):
+        for key in self.keys:
+            self.chord.lookup(key)
+
+        misses = self.chord.cache_misses
+
+        for node_id in self.random.sample([i for i in range(2 ** self.m) if i not in self.chord.nodes], 10):
+            self.chord.join(node_id)
+        for node_id in self.random.sample(self.chord.node_ids, 10):
+            self.chord.leave(node_id)
+
+        for key in self.keys:
+            self.assertEqual([key], self.chord.lookup(key))
+
+        self.assertEqual(2 * misses, self.chord.cache_misses)
+
+    def test_stabilization_moves_keys(self):
+        for node_id in self.random.sample([i for i in range(2 ** self.m) if i not in self.chord.nodes], 10):
+            self.chord.join(node_id, lazy=True)
+
+        for key in self.keys:
+            self.chord.lookup(key)
+
+        Stabilizer(self.chord, fingers_per_tick=self.m).run_until_stable()
+
+        for key in self.keys:
+            self.assertEqual([key], self.chord.lookup(key))
+
+        self.assertGreater(self.chord.cache_hits, 0)
+        self.assertGreater(self.chord.cache_misses, len(self.keys))
+
+    def test_cached_values(self):
+        chord = Chord.from_node_ids(self.node_ids, self.m, lookup_cache_size=50, cache_values=True)
+        chord.insert('key', 1)
+
+        self.assertEqual([1], chord.lookup('key'))
+        self.assertEqual([1], chord.lookup('key'))
+        self.assertEqual([], chord.lookup('key', where=lambda value: value > 1))
+        self.assertEqual(2, chord.cache_hits)
+
+        chord.insert('key', 2)
+
+        self.assertEqual([1, 2], chord.lookup('key'))
+        self.assertEqual([2], chord.lookup('key', where=lambda value: value > 1))
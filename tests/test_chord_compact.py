@@ -0,0 +1,85 @@
+import pickle
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_compact import CompactChord
+from src.chord_dht.chord_node import ChordNode
+from src.chord_dht.chord_stats import RoutingStats
+
+
+class TestChordCompact(unittest.TestCase):
+    def setUp(self):
+        self.m = 7
+        self.chord = Chord(self.m)
+
+        for node_id in random.Random(3).sample(range(2 ** self.m), 50):
+            self.chord.join(node_id)
+
+        self.compact = CompactChord.from_chord(self.chord)
+
+    def test_node_slots(self):
+        self.assertFalse(hasattr(ChordNode(0, self.m), '__dict__'))
+
+    def test_fingers_match_chord(self):
+        self.assertListEqual(self.chord.node_ids, list(self.compact.node_ids))
+
+        for position, node in enumerate(self.chord.nodes_in_order):
+            self.assertListEqual([finger.id for finger in node.fingers],
+                                 [self.compact.node_ids[self.compact.fingers[i][position]] for i in range(self.m)])
+
+    def test_find_successor_matches_chord(self):
+        for node_id in self.chord.node_ids[:5]:
+            for target_id in range(2 ** self.m):
+                chord_stats = RoutingStats()
+                compact_stats = RoutingStats()
+
+                expected = self.chord.nodes[node_id]._find_successor(target_id, chord_stats).id
+
+                self.assertEqual(expected, self.compact.find_successor(target_id, node_id, compact_stats))
+                self.assertEqual(expected, self.compact.successor_of(target_id))
+                self.assertListEqual(chord_stats.last_path, compact_stats.last_path)
+
+    def test_invalid_node_ids(self):
+        with self.assertRaises(ValueError):
+            CompactChord(self.m, [])
+
+        with self.assertRaises(ValueError):
+            CompactChord(self.m, [1, 1])
+
+        with self.assertRaises(ValueError):
+            CompactChord(self.m, [2 ** self.m])
+
+        with self.assertRaises(ValueError):
+            self.compact.position_of(-1)
+
+    def test_find_successors_matches_find_successor(self):
+        rng = random.Random(11)
+        rings = [(self.m, self.compact),
+                 (64, CompactChord(64, [0, 2 ** 64 - 1] + [rng.getrandbits(64) for _ in range(300)])),
+                 (3, CompactChord(3, [5]))]
+
+        for m, compact in rings:
+            target_ids = [rng.getrandbits(m) for _ in range(500)] + list(map(int, compact.node_ids[:10]))
+
+            for start_id in map(int, compact.node_ids[:3]):
+                with self.subTest(m=m, start_id=start_id):
+                    expected_stats = RoutingStats()
+                    stats = RoutingStats()
+                    expected = [compact.find_successor(target_id, start_id, expected_stats) for target_id in target_ids]
+
+                    self.assertListEqual(expected, compact.find_successors(target_ids, start_id, stats).tolist())
+                    self.assertEqual(expected_stats.count, stats.count)
+                    self.assertEqual(expected_stats.total_hops, stats.total_hops)
+                    self.assertEqual(expected_stats.max_hops, stats.max_hops)
+                    self.assertDictEqual(expected_stats.hop_histogram, stats.hop_histogram)
+                    self.assertListEqual(expected_stats.last_path, stats.last_path)
+
+        self.assertListEqual([], self.compact.find_successors([]).tolist())
+
+    def test_pickle(self):
+        compact = pickle.loads(pickle.dumps(self.compact))
+
+        self.assertEqual(self.compact.nbytes, compact.nbytes)
+        self.assertEqual(self.compact.find_successor(5, self.chord.node_ids[3]),
+                         compact.find_successor(5, self.chord.node_ids[3]))
@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_utils import in_right_closed_range
+
+
+class TestChordData(unittest.TestCase):
+    def setUp(self):
+        self.m = 6
+        self.chord = Chord(self.m)
+        self.random = random.Random(7)
+        self.keys = [f'key_{i}' for i in range(300)]
+
+    def assert_data_consistent(self):
+        total = 0
+
+        for node in self.chord.nodes.values():
+            self.assertListEqual(sorted(node.data_index), node.data_index)
+            self.assertSetEqual(set(node.data), {key for _, key in node.data_index})
+
+            for key_id, key in node.data_index:
+                self.assertEqual(self.chord.hasher.hash(key), key_id)
+                if len(self.chord) > 1:
+                    self.assertTrue(in_right_closed_range(node.predecessor.id, node.id, key_id))
+
+            total += len(node.data)
+
+        self.assertEqual(len(self.keys), total)
+
+    def test_data_after_joins(self):
+        self.chord.join(self.random.randrange(2 ** self.m))
+        self.chord.insert_many((key, key) for key in self.keys)
+
+        for node_id in self.random.sample([i for i in range(2 ** self.m) if i not in self.chord.nodes], 30):
+            self.chord.join(node_id)
+            self.assert_data_consistent()
+
+    def test_data_after_leaves(self):
+        for node_id in self.random.sample(range(2 ** self.m), 30):
+            self.chord.join(node_id)
+
+        for key in self.keys:
+            self.chord.insert(key, key)
+
+        for node_id in self.random.sample(self.chord.node_ids, 29):
+            self.chord.leave(node_id)
+            self.assert_data_consistent()
+
+        for key in self.keys:
+            self.assertEqual([key], self.chord.lookup(key))
+
+    def test_data_after_delete(self):
+        for node_id in self.random.sample(range(2 ** self.m), 10):
+            self.chord.join(node_id)
+
+        for key in self.keys:
+            self.chord.insert(key, key)
+
+        for key in self.keys[:100]:
+            self.chord.first_node.delete(key)
+
+        self.keys = self.keys[100:]
+        self.assert_data_consistent()
@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+
+
+class TestChordFingers(unittest.TestCase):
+    def setUp(self):
+        self.m = 6
+        self.chord = Chord(self.m)
+        self.random = random.Random(42)
+
+    def assert_fingers_correct(self):
+        for node in self.chord.nodes.values():
+            expected = [self.chord.successor_of(node.id + 2 ** i).id for i in range(self.m)]
+            self.assertListEqual(expected, [finger.id for finger in node.fingers], f"Node {node.id}")
+
+    def test_fingers_after_random_joins(self):
+        node_ids = self.random.sample(range(2 ** self.m), 40)
+
+        for node_id in node_ids:
+            self.chord.join(node_id)
+            self.assert_fingers_correct()
+
+    def test_fingers_after_churn(self):
+        node_ids = self.random.sample(range(2 ** self.m), 40)
+
+        for node_id in node_ids:
+            self.chord.join(node_id)
+
+        for node_id in self.random.sample(node_ids, 30):
+            self.chord.leave(node_id)
+            self.assert_fingers_correct()
+
+        for node_id in self.random.sample([i for i in range(2 ** self.m) if i not in self.chord.nodes], 20):
+            self.chord.join(node_id)
+            self.assert_fingers_correct()
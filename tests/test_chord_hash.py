@@ -0,0 +1,43 @@
+import hashlib
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_utils import KeyHasher, hash_id
+
+
+class TestChordHash(unittest.TestCase):
+    def test_hash_id_sha1(self):
+        for m in [1, 3, 8, 160]:
+            for key in ['a', 'Stanford University', '']:
+                expected = int(hashlib.sha1(key.encode()).hexdigest(), 16) % (2 ** m)
+                self.assertEqual(expected, hash_id(key, m))
+                self.assertEqual(expected, KeyHasher(m).hash(key))
+
+    def test_hasher_cache(self):
+        hasher = KeyHasher(8, cache_size=2)
+
+        self.assertEqual(hash_id('a', 8), hasher.hash('a'))
+        self.assertEqual(hash_id('a', 8), hasher.hash('a'))
+        self.assertEqual(1, hasher.hash.cache_info().hits)
+
+    def test_hasher_functions(self):
+        for hash_function in ['md5', 'blake2b', 'crc32']:
+            hasher = KeyHasher(16, hash_function)
+            self.assertEqual(hash_id('a', 16, hash_function), hasher.hash('a'))
+            self.assertTrue(0 <= hasher.hash('a') < 2 ** 16)
+
+    def test_hasher_unknown_function(self):
+        with self.assertRaises(ValueError):
+            KeyHasher(8, 'unknown')
+
+    def test_chord_with_hasher(self):
+        chord = Chord(4, hash_function='crc32', hash_cache_size=16)
+
+        for i in range(2 ** chord.m):
+            chord.join(i)
+
+        chord.insert('a', 'val_a')
+
+        self.assertEqual(['val_a'], chord.lookup('a'))
+        self.assertIs(chord.hasher, chord.successor_of(chord.hasher.hash('a')).hasher)
+        self.assertIn('a', chord.successor_of(chord.hasher.hash('a')).data)
@@ -16,3 +16,20 @@ class TestChordLeave(unittest.TestCase):
 
         self.assertEqual(0, len(self.chord))
         self.assertNotIn(0, nodes)
+
+    def test_leave_half_success(self):
+        for i in range(2 ** self.m):
+            self.chord.join(i)
+
+        for i in range(0, 2 ** self.m, 2):
+            self.chord.leave(i)
+
+        nodes = self.chord.nodes
+
+        self.assertEqual(2 ** self.m // 2, len(self.chord))
+
+        for node in nodes.values():
+            self.assertEqual((node.id + 2) % 2 ** self.m, node.successor.id)
+            self.assertEqual((node.id - 2) % 2 ** self.m, node.predecessor.id)
+            self.assertListEqual([self.chord.successor_of(node.id + 2 ** i).id for i in range(self.m)],
+                                 [finger.id for finger in node.fingers])
@@ -0,0 +1,63 @@
+import pickle
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_compact import CompactChord
+from src.chord_dht.chord_parallel import ChordSnapshot, ParallelRouter
+from src.chord_dht.chord_stats import RoutingStats
+
+
+class TestChordParallel(unittest.TestCase):
+    def setUp(self):
+        self.m = 10
+        self.chord = Chord.from_node_ids(random.Random(17).sample(range(2 ** self.m), 300), self.m)
+        self.snapshot = ChordSnapshot.from_chord(self.chord)
+        self.keys = [f'key_{i}' for i in range(2000)]
+
+    def tearDown(self):
+        self.snapshot.unlink()
+
+    def test_snapshot_matches_compact(self):
+        compact = CompactChord.from_chord(self.chord)
+
+        self.assertEqual(compact.nbytes, self.snapshot.nbytes)
+        self.assertListEqual(list(compact.node_ids), list(self.snapshot.node_ids))
+        for i in range(self.m):
+            self.assertListEqual(list(compact.fingers[i]), list(self.snapshot.fingers[i]))
+
+        for target_id in range(0, 2 ** self.m, 7):
+            self.assertEqual(compact.find_successor(target_id, self.chord.node_ids[5]),
+                             self.snapshot.find_successor(target_id, self.chord.node_ids[5]))
+
+    def test_pickled_as_reference(self):
+        attached = pickle.loads(pickle.dumps(self.snapshot))
+
+        self.assertLess(len(pickle.dumps(self.snapshot)), 200)
+        self.assertEqual(self.snapshot.name, attached.name)
+        self.assertListEqual(list(self.snapshot.node_ids), list(attached.node_ids))
+
+        attached.close()
+        self.assertEqual(self.chord.node_ids[0], self.snapshot.node_ids[0])
+
+    def test_find_successors(self):
+        expected_stats = RoutingStats()
+        start = self.chord.nodes[self.chord.node_ids[42]]
+        expected = [start._find_successor(self.chord.hasher.hash(key), expected_stats).id for key in self.keys]
+
+        with ParallelRouter(self.snapshot, processes=2, chunk_size=300) as router:
+            stats = RoutingStats()
+            self.assertListEqual(expected, router.find_successors(self.keys, self.chord.node_ids[42], stats))
+            self.assertListEqual([], router.find_successors([]))
+
+        self.assertEqual(expected_stats.count, stats.count)
+        self.assertEqual(expected_stats.total_hops, stats.total_hops)
+        self.assertEqual(expected_stats.max_hops, stats.max_hops)
+        self.assertDictEqual(expected_stats.hop_histogram, stats.hop_histogram)
+        self.assertListEqual(expected_stats.last_path, stats.last_path)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ParallelRouter(self.snapshot, chunk_size=0)
+        with self.assertRaises(ValueError):
+            ParallelRouter(self.snapshot, hash_function='sha0')
@@ -0,0 +1,95 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_compact import CompactChord
+
+
+class TestChordPersistence(unittest.TestCase):
+    def setUp(self):
+        self.m = 9
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'ring.chrd')
+        self.chord = Chord.from_node_ids(random.Random(29).sample(range(2 ** self.m), 40), self.m,
+                                         index_field='awards', replication=2, virtual_nodes=2)
+        self.items = [(f'key_{i % 150}', {'name': f'name_{i}', 'awards': i % 9}) for i in range(400)]
+        self.chord.insert_many(self.items)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_same_ring(self, expected: Chord, actual: Chord):
+        self.assertEqual(expected.m, actual.m)
+        self.assertListEqual(expected.node_ids, actual.node_ids)
+        self.assertDictEqual(expected.virtual_ids, actual.virtual_ids)
+        self.assertEqual(expected.replication, actual.replication)
+        self.assertEqual(expected.index_field, actual.index_field)
+
+        for expected_node, node in zip(expected.nodes_in_order, actual.nodes_in_order):
+            self.assertEqual(expected_node.owner, node.owner)
+            self.assertEqual(expected_node.successor.id, node.successor.id)
+            self.assertEqual(expected_node.predecessor.id, node.predecessor.id)
+            self.assertListEqual([finger.id for finger in expected_node.fingers], [finger.id for finger in node.fingers])
+            self.assertListEqual([succ.id for succ in expected_node.successor_list],
+                                 [succ.id for succ in node.successor_list])
+            self.assertDictEqual(expected_node.data, node.data)
+            self.assertListEqual(expected_node.data_index, node.data_index)
+            self.assertDictEqual(expected_node.value_index, node.value_index)
+            self.assertDictEqual(expected_node.replicas, node.replicas)
+
+    def test_save_and_load(self):
+        self.chord.save(self.path)
+        loaded = Chord.load(self.path)
+
+        self.assert_same_ring(self.chord, loaded)
+
+    def test_lazy_data(self):
+        self.chord.save(self.path)
+        loaded = Chord.load(self.path)
+        key = self.items[0][0]
+        node = loaded.successor_of(loaded.hasher.hash(key))
+
+        self.assertTrue(all(n._segment is not None for n in loaded.nodes.values()))
+        self.assertListEqual([value for k, value in self.items if k == key and value['awards'] <= 2],
+                             loaded.lookup(key, where=(0, 2)))
+        self.assertIsNone(node._segment)
+        self.assertEqual(loaded.replication, sum(n._segment is None for n in loaded.nodes.values()))
+
+    def test_loaded_ring_operations(self):
+        self.chord.save(self.path)
+        loaded = Chord.load(self.path)
+
+        loaded.join(next(i for i in range(2 ** self.m) if i not in loaded.nodes))
+        loaded.leave(loaded.node_ids[3])
+        loaded.insert('key_new', {'name': 'new', 'awards': 1})
+
+        for key, _ in self.items + [('key_new', None)]:
+            self.assertIn(key, loaded.successor_of(loaded.hasher.hash(key)).data)
+
+        loaded.save(self.path)
+        self.assert_same_ring(loaded, Chord.load(self.path))
+
+    def test_compact_load(self):
+        self.chord.save(self.path)
+        compact = CompactChord.load(self.path)
+        expected = CompactChord.from_chord(self.chord)
+
+        self.assertListEqual(list(expected.node_ids), list(compact.node_ids))
+        for i in range(self.m):
+            self.assertListEqual(list(expected.fingers[i]), list(compact.fingers[i]))
+
+    def test_empty_ring(self):
+        Chord(self.m).save(self.path)
+
+        self.assertEqual(0, len(Chord.load(self.path)))
+        with self.assertRaises(ValueError):
+            CompactChord.load(self.path)
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a ring snapshot, just some bytes')
+
+        with self.assertRaises(ValueError):
+            Chord.load(self.path)
@@ -0,0 +1,81 @@
+import unittest
+
+from src.chord_dht.chord import Chord
+
+
+class TestChordRange(unittest.TestCase):
+    def setUp(self):
+        chord = Chord(5, index_field='awards')
+
+        for i in range(0, 2 ** chord.m, 3):
+            chord.join(i)
+
+        self.keys = [f'key_{i}' for i in range(100)]
+
+        for i, key in enumerate(self.keys):
+            chord.insert(key, {'name': f'name_{i}', 'awards': i % 7})
+
+        self.chord = chord
+
+    def expected(self, lo_id, hi_id):
+        size = 2 ** self.chord.m
+        keys = [key for key in self.keys if (self.chord.hasher.hash(key) - lo_id) % size <= (hi_id - lo_id) % size]
+        return sorted(keys, key=lambda key: ((self.chord.hasher.hash(key) - lo_id) % size, key))
+
+    def test_range_lookup(self):
+        for lo_id, hi_id in [(0, 31), (4, 20), (7, 7), (20, 4), (31, 0), (10, 9)]:
+            result = self.chord.range_lookup(lo_id, hi_id)
+            self.assertListEqual(self.expected(lo_id, hi_id), [key for key, _ in result])
+
+    def test_range_lookup_out_of_bounds(self):
+        with self.assertRaises(ValueError):
+            self.chord.range_lookup(0, 2 ** self.chord.m)
+
+    def test_lookup_where_predicate(self):
+        self.chord.insert('a', {'name': 'x', 'awards': 1})
+        self.chord.insert('a', {'name': 'y', 'awards': 5})
+        self.chord.insert('a', {'name': 'z', 'awards': 3})
+
+        self.assertListEqual(['y', 'z'],
+                             [value['name'] for value in self.chord.lookup('a', where=lambda value: value['awards'] > 2)])
+
+    def test_lookup_where_range(self):
+        self.chord.insert('a', {'name': 'x', 'awards': 1})
+        self.chord.insert('a', {'name': 'y', 'awards': 5})
+        self.chord.insert('a', {'name': 'z', 'awards': 3})
+
+        self.assertListEqual(['y', 'z'], [value['name'] for value in self.chord.lookup('a', where=(2, 5))])
+        self.assertListEqual([], self.chord.lookup('a', where=(6, 9)))
+        self.assertListEqual([[{'name': 'x', 'awards': 1}]], self.chord.lookup_many(['a'], where=(0, 1)))
+
+    def test_lookup_where_range_after_churn(self):
+        self.chord.insert('a', {'name': 'x', 'awards': 1})
+        self.chord.insert('a', {'name': 'y', 'awards': 5})
+
+        for i in range(1, 2 ** self.chord.m, 3):
+            self.chord.join(i)
+
+        for i in range(0, 2 ** self.chord.m, 3):
+            self.chord.leave(i)
+
+        self.assertListEqual(['y'], [value['name'] for value in self.chord.lookup('a', where=(2, 5))])
+
+    def test_lookup_where_range_from_replicas(self):
+        chord = Chord(5, index_field='awards', replication=2)
+        chord.join_many(range(0, 2 ** chord.m, 4))
+
+        for value in [{'name': 'x', 'awards': 1}, 'plain', {'name': 'y'}, {'name': 'z', 'awards': 3}, 4]:
+            chord.insert('a', value)
+
+        for _ in range(4):
+            self.assertListEqual(['x', 'z'], [value['name'] for value in chord.lookup('a', where=(0, 5))])
+
+        self.assertGreater(min(node.reads for node in chord.nodes.values() if 'a' in node.data or 'a' in node.replicas), 0)
+
+    def test_lookup_where_range_not_indexed(self):
+        chord = Chord(2)
+        chord.join(0)
+        chord.insert('a', {'awards': 1})
+
+        with self.assertRaises(ValueError):
+            chord.lookup('a', where=(0, 1))
@@ -0,0 +1,121 @@
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_stabilizer import Stabilizer
+
+
+class TestChordReplication(unittest.TestCase):
+    def setUp(self):
+        self.m = 6
+        self.replication = 3
+        self.random = random.Random(9)
+        self.chord = Chord(self.m, replication=self.replication, successor_list_size=4)
+        self.keys = [f'key_{i}' for i in range(200)]
+
+        for node_id in self.random.sample(range(2 ** self.m), 20):
+            self.chord.join(node_id)
+
+        for key in self.keys:
+            self.chord.insert(key, key)
+
+    def assert_replicated(self):
+        nodes = self.chord.nodes_in_order
+
+        for position, node in enumerate(nodes):
+            expected = {}
+            for k in range(1, self.replication):
+                expected.update(nodes[(position - k) % len(nodes)].data)
+            self.assertSetEqual(set(expected), set(node.replicas), f"Node {node.id}")
+            self.assertListEqual([nodes[(position + k) % len(nodes)] for k in range(1, 5)], node.successor_list)
+
+    def test_replicas_after_joins_and_leaves(self):
+        self.assert_replicated()
+
+        for node_id in self.random.sample(self.chord.node_ids, 5):
+            self.chord.leave(node_id)
+            self.assert_replicated()
+
+        for node_id in self.random.sample([i for i in range(2 ** self.m) if i not in self.chord.nodes], 5):
+            self.chord.join(node_id)
+            self.assert_replicated()
+
+    def test_replicas_after_join_many(self):
+        chord = Chord.from_node_ids(self.chord.node_ids, self.m, replication=self.replication, successor_list_size=4)
+        chord.insert_many((key, key) for key in self.keys)
+
+        self.chord = chord
+        self.assert_replicated()
+
+        chord.join_many([i for i in range(2 ** self.m) if i not in chord.nodes][:10])
+        self.assert_replicated()
+
+    def test_delete_removes_replicas(self):
+        self.chord.first_node.delete(self.keys[0])
+
+        for node in self.chord.nodes.values():
+            self.assertNotIn(self.keys[0], node.data)
+            self.assertNotIn(self.keys[0], node.replicas)
+
+    def test_lookups_survive_crashes(self):
+        stabilizer = Stabilizer(self.chord, fingers_per_tick=self.m)
+
+        for _ in range(3):
+            crashed = self.random.choice(self.chord.node_ids[1:])
+            self.chord.crash(crashed)
+
+            for key in self.keys:
+                self.assertEqual([key], self.chord.lookup(key))
+
+            stabilizer.run_until_stable()
+            self.assert_replicated()
+
+            for key in self.keys:
+                self.assertIn(key, self.chord.successor_of(self.chord.hasher.hash(key)).data)
+
+    def test_eager_join_and_leave_after_crash(self):
+        chord = Chord(self.m, replication=self.replication, successor_list_size=4)
+        chord.join_many(range(0, 2 ** self.m, 8))
+        chord.insert_many((key, key) for key in self.keys)
+
+        chord.crash(16)
+        chord.join(20)
+        chord.leave(8)
+
+        for key in self.keys:
+            self.assertEqual([key], chord.lookup(key))
+
+        Stabilizer(chord, fingers_per_tick=self.m).run_until_stable()
+
+        self.chord = chord
+        self.assert_replicated()
+
+        for key in self.keys:
+            self.assertIn(key, chord.successor_of(chord.hasher.hash(key)).data)
+
+    def test_crash_keeps_values_inserted_before_stabilization(self):
+        key = self.keys[0]
+        primary = self.chord.successor_of(self.chord.hasher.hash(key))
+
+        self.chord.insert(key, 'new')
+        self.chord.crash(primary.id)
+        self.chord.insert(key, 'newer')
+        self.chord.insert(key, key)
+
+        Stabilizer(self.chord, fingers_per_tick=self.m).run_until_stable()
+
+        self.assertEqual([key, 'new', 'newer'], self.chord.lookup(key))
+        self.assert_replicated()
+
+    def test_hot_key_reads_spread(self):
+        key = self.keys[0]
+        primary = self.chord.successor_of(self.chord.hasher.hash(key))
+        holders = [primary] + primary.successor_list[:self.replication - 1]
+
+        for node in self.chord.nodes.values():
+            node.reads = 0
+
+        for _ in range(30):
+            self.assertEqual([key], self.chord.lookup(key))
+
+        self.assertListEqual([10, 10, 10], [node.reads for node in holders])
@@ -0,0 +1,56 @@
+import math
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_node import ChordNode
+from src.chord_dht.chord_stats import RoutingStats
+
+
+class TestChordRouting(unittest.TestCase):
+    def setUp(self):
+        self.m = 6
+        self.chord = Chord(self.m)
+
+        for i in range(2 ** self.m):
+            self.chord.join(i)
+
+    def test_route_path(self):
+        node, path = self.chord.first_node._route(37)
+
+        self.assertEqual(37, node.id)
+        self.assertEqual(0, path[0].id)
+        self.assertEqual(37, path[-1].id)
+
+    def test_stats_hop_bound(self):
+        stats = RoutingStats()
+
+        for i in range(100):
+            self.chord.insert(f'key_{i}', i, stats)
+            self.chord.lookup(f'key_{i}', stats)
+
+        self.assertEqual(200, stats.count)
+        self.assertLessEqual(stats.max_hops, self.m)
+        self.assertEqual(200, sum(stats.hop_histogram.values()))
+        self.assertEqual(stats.last_hops, len(stats.last_path) - 1)
+
+    def test_stats_batch(self):
+        stats = RoutingStats()
+
+        self.chord.insert_many([(f'key_{i}', i) for i in range(100)], stats)
+
+        self.assertGreater(stats.count, 0)
+        self.assertLessEqual(stats.count, 2 ** self.m)
+
+    def test_degraded_fingers(self):
+        size = 2000
+        m = math.ceil(math.log2(size))
+        nodes = [ChordNode(i, m) for i in range(size)]
+
+        for i, node in enumerate(nodes):
+            node.successor = nodes[(i + 1) % size]
+            node.predecessor = nodes[(i - 1) % size]
+
+        stats = RoutingStats()
+
+        self.assertEqual(size - 1, nodes[0]._find_successor(size - 1, stats).id)
+        self.assertEqual(size - 1, stats.max_hops)
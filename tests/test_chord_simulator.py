@@ -0,0 +1,106 @@
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_simulator import ChordSimulator
+
+
+class TestChordSimulator(unittest.TestCase):
+    def setUp(self):
+        self.m = 8
+        self.random = random.Random(13)
+        self.keys = [f'key_{i}' for i in range(300)]
+
+    def new_chord(self, **kwargs) -> Chord:
+        return Chord.from_node_ids(self.random.sample(range(2 ** self.m), 40), self.m, **kwargs)
+
+    def test_lookups_without_churn(self):
+        simulator = ChordSimulator(self.new_chord(), self.keys, lookup_rate=100, sample_interval=2)
+        report = simulator.run(10)
+
+        self.assertGreater(report.lookups, 0)
+        self.assertEqual(report.lookups, report.successes)
+        self.assertEqual(1.0, report.success_rate)
+        self.assertEqual(report.lookups, report.routing.count)
+        self.assertEqual(report.lookups, sum(report.routing.hop_histogram.values()))
+        self.assertEqual(10, report.duration)
+        self.assertEqual(10, simulator.now)
+
+        self.assertListEqual([0, 2, 4, 6, 8, 10], [time for time, _ in report.key_load])
+        for _, load in report.key_load:
+            self.assertEqual(len(self.keys), sum(load.values()))
+        self.assertEqual(report.lookups, sum(sum(load.values()) for _, load in report.lookup_load[1:]))
+
+    def test_deterministic(self):
+        reports = []
+
+        for _ in range(2):
+            self.random = random.Random(13)
+            simulator = ChordSimulator(self.new_chord(), self.keys, join_rate=2, leave_rate=1, crash_rate=1,
+                                       lookup_rate=50, seed=3)
+            reports.append(str(simulator.run(20)))
+
+        self.assertEqual(reports[0], reports[1])
+
+    def test_churn_with_replication(self):
+        chord = self.new_chord(replication=3, successor_list_size=4)
+        simulator = ChordSimulator(chord, self.keys, join_rate=1, leave_rate=0.5, crash_rate=0.5, lookup_rate=100,
+                                   stabilize_interval=0.5, fingers_per_tick=2, seed=7)
+        report = simulator.run(30)
+
+        self.assertGreater(report.joins, 0)
+        self.assertGreater(report.leaves, 0)
+        self.assertGreater(report.crashes, 0)
+        self.assertEqual(report.joins - report.leaves - report.crashes + 40, len(chord))
+        self.assertGreater(report.success_rate, 0.9)
+
+        simulator.stabilizer.run_until_stable()
+        for node_id in chord.node_ids:
+            key_ids = [chord.hasher.hash(key) for key in chord.nodes[node_id].data]
+            self.assertTrue(all(chord.successor_of(key_id).id == node_id for key_id in key_ids))
+
+    def test_churn_with_default_successor_list(self):
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                chord = Chord.from_node_ids(range(0, 1024, 16), 10)
+                simulator = ChordSimulator(chord, self.keys, join_rate=5, leave_rate=5, lookup_rate=50, seed=seed)
+                report = simulator.run(20)
+
+                self.assertGreater(report.leaves, 0)
+                self.assertGreater(report.success_rate, 0.9)
+
+                simulator.stabilizer.run_until_stable()
+                for key in self.keys:
+                    self.assertEqual([key], chord.lookup(key))
+                    self.assertIn(key, chord.successor_of(chord.hasher.hash(key)).data)
+
+    def test_replayed_events(self):
+        chord = self.new_chord()
+        simulator = ChordSimulator(chord, self.keys)
+        free_id = next(i for i in range(2 ** self.m) if i not in chord.nodes)
+        crashed_id = chord.node_ids[3]
+
+        simulator.schedule(1.5, "join", free_id)
+        simulator.schedule(2.5, "crash", crashed_id)
+        simulator.schedule(3.5, "lookup", self.keys[0])
+        report = simulator.run(5)
+
+        self.assertIn(free_id, chord.nodes)
+        self.assertNotIn(crashed_id, chord.nodes)
+        self.assertEqual((1, 0, 1, 1), (report.joins, report.leaves, report.crashes, report.lookups))
+        self.assertEqual(3 + 5, report.events)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ChordSimulator(Chord(self.m), self.keys)
+        with self.assertRaises(ValueError):
+            ChordSimulator(self.new_chord(), self.keys, lookup_rate=-1)
+        with self.assertRaises(ValueError):
+            ChordSimulator(self.new_chord(), self.keys, stabilize_interval=0)
+
+        simulator = ChordSimulator(self.new_chord(), self.keys)
+        with self.assertRaises(ValueError):
+            simulator.schedule(1, "rejoin")
+        simulator.run(1)
+        with self.assertRaises(ValueError):
+            simulator.schedule(0.5, "lookup")
@@ -0,0 +1,142 @@
+import asyncio
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_stabilizer import Stabilizer, TimerStabilizer
+
+
+class TestChordStabilizer(unittest.TestCase):
+    def setUp(self):
+        self.m = 6
+        self.random = random.Random(5)
+        self.chord = Chord(self.m)
+        self.stabilizer = Stabilizer(self.chord, fingers_per_tick=self.m)
+        self.keys = [f'key_{i}' for i in range(200)]
+
+    def assert_data_placed(self):
+        for key in self.keys:
+            key_id = self.chord.hasher.hash(key)
+            self.assertIn(key, self.chord.successor_of(key_id).data)
+            self.assertEqual([key], self.chord.lookup(key))
+
+    def test_lazy_joins(self):
+        self.chord.join(0)
+        self.chord.insert_many((key, key) for key in self.keys)
+
+        for node_id in self.random.sample(range(1, 2 ** self.m), 30):
+            self.chord.join(node_id, lazy=True)
+
+        self.assertFalse(self.stabilizer.is_stable())
+
+        ticks = self.stabilizer.run_until_stable()
+
+        self.assertGreater(ticks, 0)
+        self.assertEqual(ticks, self.stabilizer.convergence_ticks)
+        self.assert_data_placed()
+
+    def test_lazy_leaves(self):
+        self.chord.join_many(self.random.sample(range(2 ** self.m), 40))
+        self.chord.insert_many((key, key) for key in self.keys)
+
+        for node_id in self.random.sample(self.chord.node_ids, 20):
+            self.chord.leave(node_id, lazy=True)
+
+        self.stabilizer.run_until_stable()
+        self.assert_data_placed()
+
+    def test_churn_lookups(self):
+        self.chord.join_many(self.random.sample(range(2 ** self.m), 20))
+        self.chord.insert_many((key, key) for key in self.keys)
+
+        for _ in range(3):
+            for node_id in self.random.sample(self.chord.node_ids, 5):
+                self.chord.leave(node_id, lazy=True)
+            for node_id in self.random.sample([i for i in range(2 ** self.m) if i not in self.chord.nodes], 5):
+                self.chord.join(node_id, lazy=True)
+            self.stabilizer.run(2)
+
+        self.stabilizer.run_until_stable()
+        self.assert_data_placed()
+
+    def test_interleaved_lazy_joins_and_leaves(self):
+        cases = [
+            (3, [2, 6], [(0, True), (2, False), (3, True), (6, False)]),
+            (3, [0, 7], [(1, True), (7, False)]),
+        ]
+
+        for _ in range(20):
+            node_ids = self.random.sample(range(2 ** self.m), 5)
+            current = set(node_ids)
+            churn = []
+            for _ in range(8):
+                join = len(current) == 1 or self.random.random() < 0.5
+                node_id = self.random.choice([i for i in range(2 ** self.m) if (i in current) != join])
+                churn.append((node_id, join))
+                current ^= {node_id}
+            cases.append((self.m, node_ids, churn))
+
+        for m, node_ids, churn in cases:
+            with self.subTest(node_ids=node_ids, churn=churn):
+                self.chord = Chord(m, replication=2, successor_list_size=2)
+                self.chord.join_many(node_ids)
+                self.chord.insert_many((key, key) for key in self.keys)
+
+                for node_id, join in churn:
+                    if join:
+                        self.chord.join(node_id, lazy=True)
+                    else:
+                        self.chord.leave(node_id, lazy=True)
+
+                Stabilizer(self.chord, fingers_per_tick=m).run_until_stable()
+                self.assert_data_placed()
+                self.assertEqual(len(self.keys), sum(len(node.data) for node in self.chord.nodes.values()))
+
+    def test_interleaved_lazy_joins_and_leaves_with_default_successor_list(self):
+        cases = [
+            (5, [1, 3, 4, 6, 7, 8, 9, 10, 11, 13, 15, 17, 18, 20, 22, 24, 26, 27, 29, 30],
+             [(23, True), (12, True), (24, False), (19, True), (13, False), (24, True)]),
+            (6, [38, 21, 53, 23], [(6, True), (50, True), (63, True), (7, True), (10, True), (50, False), (21, False)]),
+        ]
+
+        for _ in range(30):
+            node_ids = self.random.sample(range(2 ** self.m), 8)
+            current = set(node_ids)
+            churn = []
+            for _ in range(10):
+                join = len(current) == 1 or self.random.random() < 0.5
+                node_id = self.random.choice([i for i in range(2 ** self.m) if (i in current) != join])
+                churn.append((node_id, join))
+                current ^= {node_id}
+            cases.append((self.m, node_ids, churn))
+
+        for m, node_ids, churn in cases:
+            with self.subTest(node_ids=node_ids, churn=churn):
+                self.chord = Chord.from_node_ids(node_ids, m)
+                self.chord.insert_many((key, key) for key in self.keys)
+
+                for node_id, join in churn:
+                    if join:
+                        self.chord.join(node_id, lazy=True)
+                    else:
+                        self.chord.leave(node_id, lazy=True)
+
+                Stabilizer(self.chord).run_until_stable()
+                self.assert_data_placed()
+                self.assertEqual(len(self.keys), sum(len(node.data) for node in self.chord.nodes.values()))
+
+    def test_timer_stabilizer(self):
+        async def run():
+            stabilizer = TimerStabilizer(self.chord, interval=0.001, fingers_per_tick=self.m)
+            stabilizer.start()
+            while not stabilizer.is_stable():
+                await asyncio.sleep(0.001)
+            await stabilizer.stop()
+            return stabilizer.ticks
+
+        self.chord.join(0)
+
+        for node_id in self.random.sample(range(1, 2 ** self.m), 10):
+            self.chord.join(node_id, lazy=True)
+
+        self.assertGreater(asyncio.run(run()), 0)
@@ -0,0 +1,37 @@
+import unittest
+
+from src.chord_dht.chord import Chord
+
+
+class TestChordSuccessor(unittest.TestCase):
+    def setUp(self):
+        self.m = 3
+        self.chord = Chord(self.m)
+
+        for node_id in [6, 1, 4, 0, 2]:
+            self.chord.join(node_id)
+
+    def test_node_ids_sorted(self):
+        self.assertListEqual([0, 1, 2, 4, 6], self.chord.node_ids)
+        self.assertListEqual([0, 1, 2, 4, 6], [node.id for node in self.chord.nodes_in_order])
+
+    def test_successor_of(self):
+        self.assertEqual(0, self.chord.successor_of(0).id)
+        self.assertEqual(4, self.chord.successor_of(3).id)
+        self.assertEqual(6, self.chord.successor_of(6).id)
+        self.assertEqual(0, self.chord.successor_of(7).id)
+
+    def test_successor_of_matches_routing(self):
+        for target_id in range(2 ** self.m):
+            self.assertEqual(self.chord.first_node._find_successor(target_id).id,
+                             self.chord.successor_of(target_id).id)
+
+    def test_successor_of_after_leave(self):
+        self.chord.leave(4)
+
+        self.assertListEqual([0, 1, 2, 6], self.chord.node_ids)
+        self.assertEqual(6, self.chord.successor_of(3).id)
+
+    def test_successor_of_empty(self):
+        with self.assertRaises(ValueError):
+            Chord(self.m).successor_of(0)
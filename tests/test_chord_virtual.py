@@ -0,0 +1,95 @@
+import random
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_stats import LoadReport
+
+
+class TestChordVirtual(unittest.TestCase):
+    def setUp(self):
+        self.m = 10
+        self.virtual_nodes = 4
+        self.random = random.Random(21)
+        self.node_ids = self.random.sample(range(2 ** self.m), 20)
+        self.keys = [f'key_{i}' for i in range(500)]
+
+    def assert_data_placed(self, chord: Chord):
+        for key in self.keys:
+            self.assertIn(key, chord.successor_of(chord.hasher.hash(key)).data)
+            self.assertEqual([key], chord.lookup(key))
+
+    def test_join_virtual_nodes(self):
+        chord = Chord(self.m, virtual_nodes=self.virtual_nodes)
+
+        for node_id in self.node_ids:
+            node = chord.join(node_id)
+            self.assertEqual(node_id, node.id)
+
+        self.assertEqual(len(self.node_ids) * self.virtual_nodes, len(chord))
+        self.assertSetEqual(set(self.node_ids), set(chord.virtual_ids))
+
+        for node_id, positions in chord.virtual_ids.items():
+            self.assertEqual(node_id, positions[0])
+            self.assertEqual(self.virtual_nodes, len(positions))
+            for position in positions:
+                self.assertEqual(node_id, chord.nodes[position].owner)
+
+        chord.insert_many((key, key) for key in self.keys)
+        self.assert_data_placed(chord)
+
+    def test_join_many_matches_join(self):
+        chord = Chord(self.m, virtual_nodes=self.virtual_nodes)
+        for node_id in self.node_ids:
+            chord.join(node_id)
+
+        bulk = Chord.from_node_ids(self.node_ids, self.m, virtual_nodes=self.virtual_nodes)
+
+        self.assertListEqual(chord.node_ids, bulk.node_ids)
+        self.assertDictEqual(chord.virtual_ids, bulk.virtual_ids)
+
+    def test_leave_virtual_nodes(self):
+        chord = Chord.from_node_ids(self.node_ids, self.m, virtual_nodes=self.virtual_nodes)
+        chord.insert_many((key, key) for key in self.keys)
+
+        for node_id in self.node_ids[:10]:
+            positions = chord.virtual_ids[node_id]
+            with self.assertRaises(ValueError):
+                chord.leave(positions[1])
+
+            chord.leave(node_id)
+
+            self.assertNotIn(node_id, chord.virtual_ids)
+            for position in positions:
+                self.assertNotIn(position, chord.nodes)
+            self.assert_data_placed(chord)
+
+        self.assertEqual(10 * self.virtual_nodes, len(chord))
+        self.assertEqual(len(self.keys), sum(chord.load_report().keys.values()))
+
+    def test_load_report(self):
+        report = LoadReport({1: 0, 2: 0, 3: 0, 4: 8})
+
+        self.assertEqual(2, report.mean)
+        self.assertEqual(8, report.max)
+        self.assertEqual(4, report.imbalance)
+        self.assertAlmostEqual(0.75, report.gini)
+        self.assertEqual(0, LoadReport({1: 5, 2: 5}).gini)
+        self.assertEqual(0, LoadReport({}).gini)
+
+    def test_virtual_nodes_spread_load(self):
+        reports = []
+
+        for virtual_nodes in [1, 16]:
+            chord = Chord.from_node_ids(self.node_ids, self.m, virtual_nodes=virtual_nodes)
+            chord.insert_many((key, key) for key in self.keys)
+            reports.append(chord.load_report())
+
+        self.assertSetEqual(set(self.node_ids), set(reports[1].keys))
+        self.assertLess(reports[1].gini, reports[0].gini)
+        self.assertLess(reports[1].imbalance, reports[0].imbalance)
+
+    def test_invalid_virtual_nodes(self):
+        with self.assertRaises(ValueError):
+            Chord(self.m, virtual_nodes=0)
+        with self.assertRaises(ValueError):
+            Chord.from_node_ids(range(3), 2, virtual_nodes=2)
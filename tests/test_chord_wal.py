@@ -0,0 +1,116 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.chord_dht.chord import Chord
+from src.chord_dht.chord_wal import WriteAheadLog
+
+
+class TestChordWal(unittest.TestCase):
+    def setUp(self):
+        self.m = 8
+        self.random = random.Random(31)
+        self.directory = tempfile.TemporaryDirectory()
+        self.node_ids = self.random.sample(range(2 ** self.m), 20)
+        self.items = [(f'key_{i % 120}', {'name': f'name_{i}', 'awards': i % 5}) for i in range(300)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def new_chord(self, **kwargs) -> Chord:
+        return Chord.from_node_ids(self.node_ids, self.m, index_field='awards', wal_directory=self.directory.name,
+                                   **kwargs)
+
+    def assert_recovered(self, chord: Chord, **kwargs):
+        chord.sync()
+        recovered = Chord.from_node_ids(chord.node_ids, self.m, index_field='awards',
+                                        wal_directory=self.directory.name, **kwargs)
+
+        for node_id in chord.node_ids:
+            self.assertDictEqual(chord.nodes[node_id].data, recovered.nodes[node_id].data)
+            self.assertListEqual(chord.nodes[node_id].data_index, recovered.nodes[node_id].data_index)
+            self.assertDictEqual(chord.nodes[node_id].value_index, recovered.nodes[node_id].value_index)
+            self.assertDictEqual(chord.nodes[node_id].replicas, recovered.nodes[node_id].replicas)
+
+    def test_recover_inserts_and_deletes(self):
+        chord = self.new_chord(replication=2)
+
+        for key, value in self.items:
+            chord.insert(key, value)
+        for key in self.random.sample(sorted({key for key, _ in self.items}), 30):
+            chord.first_node.delete(key)
+
+        self.assert_recovered(chord, replication=2)
+
+    def test_recover_after_churn(self):
+        chord = self.new_chord()
+        chord.insert_many(self.items)
+
+        for node_id in self.random.sample(chord.node_ids, 5):
+            chord.leave(node_id)
+            self.assertFalse(os.path.exists(os.path.join(self.directory.name, f'node-{node_id}.wal')))
+        for node_id in self.random.sample([i for i in range(2 ** self.m) if i not in chord.nodes], 5):
+            chord.join(node_id)
+
+        self.assert_recovered(chord)
+
+    def test_compaction(self):
+        chord = self.new_chord(wal_compact_every=10)
+
+        for key, value in self.items:
+            chord.insert(key, value)
+
+        for node in chord.nodes.values():
+            self.assertLessEqual(node.wal.records, 10)
+        self.assertTrue(any(os.path.exists(node.wal.snapshot_path) for node in chord.nodes.values()))
+        self.assert_recovered(chord, wal_compact_every=10)
+
+    def test_torn_record(self):
+        chord = self.new_chord()
+        chord.insert_many(self.items)
+        chord.sync()
+
+        node = chord.successor_of(chord.hasher.hash(self.items[0][0]))
+        with open(node.wal.path, 'ab') as file:
+            file.write(b'\x40\x00\x00\x00\x00\x00\x00\x00torn')
+
+        self.assert_recovered(chord)
+
+    def test_group_commit(self):
+        wal = WriteAheadLog(os.path.join(self.directory.name, 'test.wal'), sync_every=4)
+
+        for i in range(6):
+            wal.append(('store', i, f'key_{i}', i))
+
+        self.assertEqual(2, wal.pending)
+        self.assertEqual(6, wal.records)
+        wal.sync()
+        self.assertEqual(0, wal.pending)
+        wal.close()
+
+        snapshot, records = WriteAheadLog(wal.path).recover()
+        self.assertIsNone(snapshot)
+        self.assertListEqual([('store', i, f'key_{i}', i) for i in range(6)], records)
+
+        with self.assertRaises(ValueError):
+            WriteAheadLog(wal.path, sync_every=0)
+
+    def test_crash_during_compaction(self):
+        path = os.path.join(self.directory.name, 'test.wal')
+        wal = WriteAheadLog(path)
+        wal.append(('store', 1, 'key_1', 1))
+        wal.sync()
+
+        with open(path, 'rb') as file:
+            log = file.read()
+
+        wal.compact(b'snapshot')
+        wal.close()
+
+        with open(path, 'wb') as file:
+            file.write(log)
+
+        snapshot, records = WriteAheadLog(path).recover()
+        self.assertEqual(b'snapshot', snapshot)
+        self.assertListEqual([], records)
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+
+from src.crawler.crawler_engine import Crawler
+from src.crawler.local_server import LocalPageServer
+from src.crawler.page_cache import Checkpoint, PageCache
+
+
+class TestCrawlerCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.pages = {f'/wiki/Page_{i}': f'<html><h1 id="firstHeading">Page {i}</h1>{"x" * 500}</html>'.encode()
+                      for i in range(12)}
+        self.server = LocalPageServer(self.pages)
+        self.server.start()
+        self.urls = [self.server.url(path) for path in self.pages]
+
+    def tearDown(self):
+        self.server.stop()
+        self.directory.cleanup()
+
+    def crawl(self, urls: list[str], checkpoint: bool = False) -> list[tuple[str, bytes]]:
+        with PageCache(self.directory.name) as cache:
+            resume = Checkpoint(os.path.join(self.directory.name, 'checkpoint')) if checkpoint else None
+            with Crawler(workers=4, cache=cache, checkpoint=resume) as crawler:
+                results = list(crawler.crawl(urls))
+            if resume is not None:
+                resume.close()
+
+        return results
+
+    def test_recrawl_revalidates_unchanged_pages(self):
+        first = self.crawl(self.urls)
+        second = self.crawl(self.urls)
+
+        self.assertListEqual(first, second)
+        self.assertListEqual([content for _, content in second], list(self.pages.values()))
+        self.assertEqual(self.server.not_modified, len(self.urls))
+
+    def test_recrawl_refetches_changed_pages(self):
+        self.crawl(self.urls)
+        self.pages['/wiki/Page_3'] = b'<html>changed</html>'
+
+        results = dict(self.crawl(self.urls))
+
+        self.assertEqual(results[self.server.url('/wiki/Page_3')], b'<html>changed</html>')
+        self.assertEqual(self.server.not_modified, len(self.urls) - 1)
+
+        with PageCache(self.directory.name) as cache:
+            self.assertEqual(cache.get(self.server.url('/wiki/Page_3')), b'<html>changed</html>')
+
+    def test_checkpoint_resumes_interrupted_crawl(self):
+        self.crawl(self.urls[:5], checkpoint=True)
+        hits = dict(self.server.hits)
+
+        results = self.crawl(self.urls, checkpoint=True)
+
+        self.assertListEqual([content for _, content in results], list(self.pages.values()))
+        self.assertDictEqual({path: self.server.hits[path] for path in hits}, hits)
+        self.assertEqual(sum(self.server.hits.values()), len(self.urls))
+
+        checkpoint = Checkpoint(os.path.join(self.directory.name, 'checkpoint'))
+        self.assertEqual(len(checkpoint), len(self.urls))
+        checkpoint.clear()
+        checkpoint.close()
+        self.assertEqual(len(Checkpoint(os.path.join(self.directory.name, 'checkpoint'))), 0)
+
+    def test_identical_pages_are_stored_once_compressed(self):
+        with PageCache(self.directory.name) as cache:
+            cache.put('http://a/1', b'same' * 1000)
+            cache.put('http://a/2', b'same' * 1000)
+
+            objects = os.listdir(os.path.join(self.directory.name, 'objects'))
+            self.assertEqual(len(objects), 1)
+            self.assertLess(os.path.getsize(os.path.join(self.directory.name, 'objects', objects[0])), 4000)
+            self.assertEqual(cache.get('http://a/2'), b'same' * 1000)
+
+    def test_torn_index_entry_is_dropped(self):
+        with PageCache(self.directory.name) as cache:
+            cache.put('http://a/1', b'first', etag='"1"')
+
+        with open(os.path.join(self.directory.name, 'index.jsonl'), 'a') as file:
+            file.write('{"url": "http://a/2", "dig')
+
+        with PageCache(self.directory.name) as cache:
+            cache.put('http://a/3', b'third')
+
+        with PageCache(self.directory.name) as cache:
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.get('http://a/1'), b'first')
+            self.assertEqual(cache.get('http://a/3'), b'third')
+            self.assertDictEqual(cache.validators('http://a/1'), {'If-None-Match': '"1"'})
+
+    def test_checkpoint_requires_cache(self):
+        with self.assertRaises(ValueError):
+            Crawler(checkpoint=Checkpoint(os.path.join(self.directory.name, 'checkpoint')))
+
+
+if __name__ == '__main__':
+    unittest.main()
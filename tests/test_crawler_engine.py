@@ -0,0 +1,68 @@
+import time
+import unittest
+
+from src.crawler.crawler_engine import Crawler, HostRateLimiter
+from src.crawler.local_server import LocalPageServer
+
+
+class TestCrawlerEngine(unittest.TestCase):
+    def setUp(self):
+        self.pages = {f'/wiki/Page_{i}': f'<html><h1 id="firstHeading">Page {i}</h1></html>'.encode() for i in range(24)}
+
+    def test_crawl_returns_pages_in_order(self):
+        with LocalPageServer(self.pages) as server, Crawler(workers=4) as crawler:
+            urls = [server.url(path) for path in self.pages]
+            results = list(crawler.crawl(urls))
+
+        self.assertListEqual([url for url, _ in results], urls)
+        self.assertListEqual([content for _, content in results], list(self.pages.values()))
+
+    def test_crawl_reports_missing_pages(self):
+        with LocalPageServer(self.pages) as server, Crawler(workers=2, retries=0) as crawler:
+            results = list(crawler.crawl([server.url('/wiki/Page_0'), server.url('/wiki/Missing')]))
+
+        self.assertEqual(results[0][1], self.pages['/wiki/Page_0'])
+        self.assertIsNone(results[1][1])
+
+    def test_fetch_retries_server_errors(self):
+        with LocalPageServer(self.pages, failures={'/wiki/Page_1': 2}) as server, \
+                Crawler(retries=2, backoff=0.01) as crawler:
+            self.assertEqual(crawler.fetch(server.url('/wiki/Page_1')), self.pages['/wiki/Page_1'])
+            self.assertEqual(server.hits['/wiki/Page_1'], 3)
+
+    def test_crawl_gives_up_after_retries(self):
+        with LocalPageServer(self.pages, failures={'/wiki/Page_2': 5}) as server, \
+                Crawler(retries=1, backoff=0.01) as crawler:
+            (_, content), = crawler.crawl([server.url('/wiki/Page_2')])
+
+            self.assertIsNone(content)
+            self.assertEqual(server.hits['/wiki/Page_2'], 2)
+
+    def test_concurrency_reduces_wall_time(self):
+        with LocalPageServer(self.pages, latency=0.05) as server:
+            urls = [server.url(path) for path in self.pages]
+            durations = {}
+
+            for workers in [1, 8]:
+                with Crawler(workers=workers) as crawler:
+                    start = time.perf_counter()
+                    self.assertTrue(all(content for _, content in crawler.crawl(urls)))
+                    durations[workers] = time.perf_counter() - start
+
+        self.assertLess(durations[8], durations[1] / 3)
+
+    def test_rate_limiter_spaces_requests_per_host(self):
+        with LocalPageServer(self.pages) as server, Crawler(workers=8, requests_per_second=50) as crawler:
+            urls = [server.url(path) for path in list(self.pages)[:10]]
+            start = time.perf_counter()
+            list(crawler.crawl(urls))
+
+            self.assertGreaterEqual(time.perf_counter() - start, 9 / 50)
+
+    def test_rate_limiter_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            HostRateLimiter(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
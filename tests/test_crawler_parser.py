@@ -0,0 +1,76 @@
+import unittest
+
+from src.benchmark.parser_benchmark import available_backends, benchmark
+from src.crawler.infobox_parser import BACKENDS, _InfoboxScanner, _StopScanning, parse_page
+
+ARTICLE = '''<!DOCTYPE html><html><head><meta charset="utf-8"><style>.a{}</style>
+<script>var box = "<table class=infobox><tr><th class=infobox-label>Awards</th><td><a>Fake</a></td></tr></table>";</script>
+</head><body><h1 id="firstHeading" class="firstHeading"><span class="mw-page-title-main">Alan M.&nbsp;Türïng</span><!-- x --></h1>
+<table class="sidebar"><tr><th class="infobox-label">Awards</th><td><a>Sidebar</a></td></tr></table>
+<table class="infobox biography vcard"><tbody>
+<tr><th colspan="2" class="infobox-above">Alan Turing</th></tr>
+<tr><td colspan="2"><img src="turing.jpg"><br>Turing in 1936</td></tr>
+<tr><th scope="row" class="infobox-label">Education</th><td><a href="/wiki/Sherborne">Sherborne School</a></td></tr>
+<tr><th scope="row" class="infobox-label">Alma&nbsp;mater<style>.b{}</style></th>
+<td><a href="/wiki/Kings">King's College, Cambridge</a> (<a>BA</a>, <a>MA</a>)<link rel="stylesheet">
+<a href="/wiki/Princeton">Princeton <i>University</i></a> (<a>PhD</a>)<sup><a href="#cite">[1]</a></sup></td></tr>
+<tr><th scope="row" class="infobox-label">Awards</th><td><table><tr><th class="infobox-label">Year</th>
+<td><a>1946</a></td></tr></table><a href="/wiki/Smith">Smith's Prize</a> &amp; <a>OBE</a></td></tr>
+<tr><td><a>Unlabelled</a></td></tr>
+</tbody></table>
+<table class="infobox"><tr><th class="infobox-label">Awards</th><td><a>Second infobox</a></td></tr></table>
+<p>Turing was born in <a href="/wiki/London">London</a>.</p></body></html>'''.encode()
+
+
+class TestCrawlerParser(unittest.TestCase):
+    def setUp(self):
+        self.expected = ['Alan M.\xa0Türïng', ['Sherborne School'],
+                         ["King's College, Cambridge", 'BA', 'MA', 'Princeton University', 'PhD', '[1]'],
+                         ['1946', "Smith's Prize", 'OBE']]
+        self.pages = [
+            ARTICLE,
+            b'<html><body><h1 id="firstHeading">No infobox</h1><p><a>Link</a></p></body></html>',
+            b'<html><body><h1 id="firstHeading">Unclosed <b>tags</h1><table class="infobox"><tr>'
+            b'<th class="infobox-label">awards</th><td><a>Prize</a></table><p>Body',
+        ]
+
+    def test_backends_agree_with_beautifulsoup(self):
+        self.assertListEqual(parse_page(ARTICLE, 'bs4'), self.expected)
+
+        for backend in available_backends():
+            for page in self.pages:
+                with self.subTest(backend=backend, page=page[:60]):
+                    self.assertListEqual(parse_page(page, backend), parse_page(page, 'bs4'))
+
+    def test_scanner_stops_after_infobox(self):
+        scanner = _InfoboxScanner()
+
+        with self.assertRaises(_StopScanning):
+            scanner.feed(ARTICLE.decode())
+
+        self.assertEqual(scanner.name, self.expected[0])
+        self.assertListEqual([row[1] for row in scanner.rows], ['Education', 'Alma\xa0mater', 'Year', 'Awards'])
+
+    def test_backends_ignore_content_after_infobox(self):
+        page = ARTICLE.replace(b'</body>', b'<table class="infobox">' + b'<p><a>x' * 10000 + b'</body>')
+
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                self.assertListEqual(parse_page(page, backend), self.expected)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            parse_page(ARTICLE, 'regex')
+
+    def test_benchmark_reports_every_backend(self):
+        results = benchmark(self.pages, available_backends(), repeats=2, warmup=0)
+
+        self.assertListEqual([result['backend'] for result in results], available_backends())
+        self.assertTrue(all(result['mismatches'] == 0 for result in results))
+        self.assertTrue(all(result['pages'] == len(self.pages) for result in results))
+        self.assertEqual(next(result for result in results if result['backend'] == 'bs4')['speedup'], 1.0)
+        self.assertTrue(set(available_backends()) <= set(BACKENDS))
+
+
+if __name__ == '__main__':
+    unittest.main()
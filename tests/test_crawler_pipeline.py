@@ -0,0 +1,101 @@
+import ast
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.crawler.crawler_engine import Crawler
+from src.crawler.crawler_pipeline import parse_page, run_pipeline
+from src.crawler.crawler_utilities import (exclude_degree_titles, exclude_references, normalize_text,
+                                           preprocess_dataframe, read_jsonl, remove_text_in_parentheses)
+from src.crawler.local_server import LocalPageServer
+
+
+def article(name: str, rows: dict[str, list[str]]) -> bytes:
+    cells = ''.join(f'<tr><th class="infobox-label">{label}</th><td>'
+                    + ', '.join(f'<a href="/wiki/{link}">{link}</a>' for link in links) + '</td></tr>'
+                    for label, links in rows.items())
+    return (f'<html><body><h1 id="firstHeading"><span>{name}</span></h1>'
+            f'<table class="infobox">{cells}</table></body></html>').encode()
+
+
+class TestCrawlerPipeline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.raw_path = os.path.join(self.directory.name, 'raw.csv')
+        self.pp_path = os.path.join(self.directory.name, 'pp.csv')
+        self.pages = {}
+
+        for i in range(30):
+            rows = {
+                'Education': [f'School {i}', 'PhD'][:i % 3],
+                'Alma&nbsp;mater': [f'University {i % 7}', 'B.Sc.', '[1]'][:i % 4],
+                'Awards': [f'Prize {i % 5}', '[2]'][:i % 2 + 1],
+                'Known for': ['Something'],
+            }
+            self.pages[f'/wiki/Scientist_{i}'] = article(f'Scientist&nbsp;{i} (computer scientist)', rows)
+
+        self.pages['/wiki/No_infobox'] = b'<html><h1 id="firstHeading">No infobox</h1></html>'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_parse_page(self):
+        record = parse_page(self.pages['/wiki/Scientist_7'])
+
+        self.assertListEqual(record, ['Scientist\xa07 (computer scientist)', ['School 7'],
+                                      ['University 0', 'B.Sc.', '[1]'], ['Prize 2', '[2]']])
+        self.assertListEqual(parse_page(self.pages['/wiki/No_infobox']), ['No infobox', [], [], []])
+
+    def test_pipeline_matches_dataframe_preprocessing(self):
+        with LocalPageServer(self.pages) as server, Crawler(workers=4) as crawler:
+            urls = [server.url(path) for path in self.pages] + [server.url('/wiki/Missing')]
+            count = run_pipeline(crawler, urls, self.raw_path, self.pp_path)
+
+        self.assertEqual(count, len(self.pages))
+
+        df = pd.read_csv(self.raw_path)
+        df["name"] = df["name"].apply(normalize_text).apply(remove_text_in_parentheses)
+        df["alma_mater"] = df["alma_mater"].apply(ast.literal_eval).apply(exclude_degree_titles).apply(exclude_references)
+        df["education"] = df["education"].apply(ast.literal_eval).apply(exclude_degree_titles).apply(exclude_references)
+        df["awards"] = df["awards"].apply(ast.literal_eval).apply(exclude_references)
+        df["education"] = df["education"] + df["alma_mater"]
+        df.drop(columns=["alma_mater"], inplace=True)
+
+        with open(self.pp_path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), df.to_csv(index=False))
+
+        self.assertListEqual(list(pd.read_csv(self.pp_path)['name'][:2]), ['Scientist 0', 'Scientist 1'])
+
+    def test_pipeline_writes_json_lines(self):
+        raw_path = os.path.join(self.directory.name, 'raw.jsonl')
+        pp_path = os.path.join(self.directory.name, 'pp.jsonl')
+
+        with LocalPageServer(self.pages) as server, Crawler(workers=4) as crawler:
+            run_pipeline(crawler, [server.url(path) for path in self.pages], raw_path, pp_path)
+
+        raw = read_jsonl(raw_path)
+
+        self.assertListEqual(list(raw.columns), ['name', 'education', 'alma_mater', 'awards'])
+        self.assertListEqual(raw.loc[7].tolist(), parse_page(self.pages['/wiki/Scientist_7']))
+        self.assertTrue(read_jsonl(pp_path).equals(preprocess_dataframe(raw)))
+
+    def test_crawl_reads_urls_lazily(self):
+        consumed = []
+
+        def urls():
+            for path in self.pages:
+                consumed.append(path)
+                yield server.url(path)
+
+        with LocalPageServer(self.pages) as server, Crawler(workers=2) as crawler:
+            results = crawler.crawl(urls(), buffer_size=3)
+            next(results)
+
+            self.assertLessEqual(len(consumed), 4)
+            self.assertEqual(len(list(results)), len(self.pages) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.crawler.crawler_utilities import (exclude_degree_titles, exclude_degree_titles_column, exclude_references,
+                                           exclude_references_column, normalize_text, normalize_text_column,
+                                           preprocess_dataframe, read_jsonl, remove_text_in_parentheses,
+                                           remove_text_in_parentheses_column, write_jsonl)
+
+
+class TestCrawlerUtilities(unittest.TestCase):
+    def setUp(self):
+        self.names = pd.Series([
+            'Alan Turing', ' Grace&nbsp;Hopper (computer scientist) ', 'Edsger W.\xa0Dijkstra', 'A &amp; B\n(x) C',
+            '', 'Tony Hoare (1934)'
+        ], index=[10, 11, 12, 12, 14, 15])
+        self.lists = pd.Series([
+            ['MIT', 'Ph.D.', '[1]'], [], ['B.Sc', ' msc ', 'Harvard', '[12] note'], ['[2]', 'phd'], ['Oxford'], []
+        ], index=[10, 11, 12, 12, 14, 15])
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_text_columns_match_scalar_functions(self):
+        self.assertListEqual(normalize_text_column(self.names).tolist(), [normalize_text(name) for name in self.names])
+        self.assertListEqual(remove_text_in_parentheses_column(self.names).tolist(),
+                             [remove_text_in_parentheses(name) for name in self.names])
+        self.assertListEqual(list(normalize_text_column(self.names).index), list(self.names.index))
+
+    def test_list_columns_match_scalar_functions(self):
+        self.assertListEqual(exclude_degree_titles_column(self.lists).tolist(),
+                             [exclude_degree_titles(entries) for entries in self.lists])
+        self.assertListEqual(exclude_references_column(self.lists).tolist(),
+                             [exclude_references(entries) for entries in self.lists])
+        self.assertListEqual(list(exclude_references_column(self.lists).index), list(self.lists.index))
+        self.assertEqual(len(exclude_references_column(self.lists.iloc[:0])), 0)
+
+    def test_preprocess_dataframe_matches_record_preprocessing(self):
+        df = pd.DataFrame({'name': self.names, 'education': self.lists, 'alma_mater': self.lists[::-1].values,
+                           'awards': self.lists}).reset_index(drop=True)
+
+        expected = pd.DataFrame({
+            'name': df['name'].apply(normalize_text).apply(remove_text_in_parentheses),
+            'education': (df['education'].apply(exclude_degree_titles).apply(exclude_references)
+                          + df['alma_mater'].apply(exclude_degree_titles).apply(exclude_references)),
+            'awards': df['awards'].apply(exclude_references),
+        })
+
+        self.assertTrue(preprocess_dataframe(df).equals(expected))
+
+    def test_jsonl_keeps_lists_and_strings(self):
+        path = os.path.join(self.directory.name, 'records.jsonl')
+        df = pd.DataFrame({'name': ['1234', 'NaN', 'Ada Lovelace', 'Türïng'],
+                           'awards': [['[1]', 'Prize, "quoted"'], [], ['2020'], ['Médaille']]})
+
+        write_jsonl(df, path)
+
+        self.assertTrue(read_jsonl(path).equals(df))
+
+
+if __name__ == '__main__':
+    unittest.main()
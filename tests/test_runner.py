@@ -4,6 +4,30 @@ from tests.test_chord_insert import TestChordInsert
 from tests.test_chord_leave import TestChordLeave
 from tests.test_chord_lookup import TestChordLookup
 from tests.test_chord_node import TestChordNode
+from tests.test_chord_successor import TestChordSuccessor
+from tests.test_chord_batch import TestChordBatch
+from tests.test_chord_routing import TestChordRouting
+from tests.test_chord_fingers import TestChordFingers
+from tests.test_chord_hash import TestChordHash
+from tests.test_chord_data import TestChordData
+from tests.test_chord_range import TestChordRange
+from tests.test_chord_compact import TestChordCompact
+from tests.test_chord_bulk import TestChordBulk
+from tests.test_chord_benchmark import TestChordBenchmark
+from tests.test_chord_async import TestChordAsync
+from tests.test_chord_stabilizer import TestChordStabilizer
+from tests.test_chord_replication import TestChordReplication
+from tests.test_chord_simulator import TestChordSimulator
+from tests.test_chord_parallel import TestChordParallel
+from tests.test_chord_virtual import TestChordVirtual
+from tests.test_chord_cache import TestChordCache
+from tests.test_chord_persistence import TestChordPersistence
+from tests.test_chord_wal import TestChordWal
+from tests.test_crawler_engine import TestCrawlerEngine
+from tests.test_crawler_cache import TestCrawlerCache
+from tests.test_crawler_pipeline import TestCrawlerPipeline
+from tests.test_crawler_parser import TestCrawlerParser
+from tests.test_crawler_utilities import TestCrawlerUtilities
 
 
 def suite():
@@ -14,6 +38,30 @@ def suite():
     test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordLeave))
     test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordLookup))
     test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordNode))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordSuccessor))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordBatch))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordRouting))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordFingers))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordHash))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordData))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordRange))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordCompact))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordBulk))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordBenchmark))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordAsync))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordStabilizer))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordReplication))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordSimulator))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordParallel))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordVirtual))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordCache))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordPersistence))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestChordWal))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestCrawlerEngine))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestCrawlerCache))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestCrawlerPipeline))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestCrawlerParser))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestCrawlerUtilities))
 
     return test_suite
 